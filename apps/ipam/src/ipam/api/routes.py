@@ -1,8 +1,11 @@
 """IPAM API routes."""
 
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
+from fastapi.responses import Response, StreamingResponse
+from shared_python import json_response
 
 from ..core.auth import JWTPayload, get_current_user, require_operator, require_admin
 from ..services.network import NetworkService
@@ -28,17 +31,29 @@ async def list_networks(
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     search: str | None = None,
     is_active: bool | None = None,
+    cursor: str | None = None,
     _user: JWTPayload = Depends(get_current_user),
-) -> PaginatedResponse[Network]:
-    """List all networks with pagination and optional filters."""
-    return await network_service.list_networks(
-        page=page, limit=limit, search=search, is_active=is_active
-    )
+) -> Response:
+    """List all networks with pagination and optional filters.
+
+    Pass ``pagination.next_cursor`` back as ``cursor`` for constant-cost
+    paging; ``page`` is ignored when a cursor is given.
+    """
+    try:
+        networks = await network_service.list_networks(
+            page=page, limit=limit, search=search, is_active=is_active, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return json_response(networks)
 
 
 @router.get("/networks/{network_id}", response_model=APIResponse[NetworkWithStats])
 async def get_network(
-    network_id: str,
+    network_id: UUID,
     _user: JWTPayload = Depends(get_current_user),
 ) -> APIResponse[NetworkWithStats]:
     """Get a network by ID with utilization statistics."""
@@ -69,7 +84,7 @@ async def create_network(
 
 @router.put("/networks/{network_id}", response_model=APIResponse[Network])
 async def update_network(
-    network_id: str,
+    network_id: UUID,
     data: NetworkUpdate,
     _user: JWTPayload = Depends(require_operator),
 ) -> APIResponse[Network]:
@@ -91,7 +106,7 @@ async def update_network(
 
 @router.delete("/networks/{network_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_network(
-    network_id: str,
+    network_id: UUID,
     _user: JWTPayload = Depends(require_admin),
 ) -> None:
     """Delete a network (requires admin role)."""
@@ -105,7 +120,7 @@ async def delete_network(
 
 @router.get("/networks/{network_id}/stats", response_model=APIResponse[NetworkStats])
 async def get_network_stats(
-    network_id: str,
+    network_id: UUID,
     _user: JWTPayload = Depends(get_current_user),
 ) -> APIResponse[NetworkStats]:
     """Get detailed statistics for a network."""
@@ -121,26 +136,57 @@ async def get_network_stats(
 # IP Address endpoints
 @router.get("/networks/{network_id}/addresses", response_model=PaginatedResponse[IPAddress])
 async def list_addresses(
-    network_id: str,
+    network_id: UUID,
     page: Annotated[int, Query(ge=1)] = 1,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-    status: IPStatus | None = None,
+    status_filter: Annotated[IPStatus | None, Query(alias="status")] = None,
     search: str | None = None,
+    cursor: str | None = None,
     _user: JWTPayload = Depends(get_current_user),
-) -> PaginatedResponse[IPAddress]:
+) -> Response:
     """List IP addresses in a network."""
-    return await network_service.list_addresses(
-        network_id=network_id,
-        page=page,
-        limit=limit,
-        status=status,
-        search=search,
+    try:
+        addresses = await network_service.list_addresses(
+            network_id=network_id,
+            page=page,
+            limit=limit,
+            status=status_filter,
+            search=search,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    return json_response(addresses)
+
+
+@router.get("/networks/{network_id}/addresses/export")
+async def export_addresses(
+    network_id: UUID,
+    status_filter: Annotated[IPStatus | None, Query(alias="status")] = None,
+    _user: JWTPayload = Depends(get_current_user),
+) -> StreamingResponse:
+    """Export all IP addresses in a network as NDJSON (one address per line).
+
+    Streams straight from a database cursor, so there is no page size limit
+    and no total count.
+    """
+    if not await network_service.get_network(network_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Network {network_id} not found",
+        )
+    return StreamingResponse(
+        network_service.export_addresses(network_id, status=status_filter),
+        media_type="application/x-ndjson",
     )
 
 
 @router.get("/addresses/{address_id}", response_model=APIResponse[IPAddress])
 async def get_address(
-    address_id: str,
+    address_id: UUID,
     _user: JWTPayload = Depends(get_current_user),
 ) -> APIResponse[IPAddress]:
     """Get an IP address by ID."""
@@ -165,7 +211,7 @@ async def create_address(
 
 @router.put("/addresses/{address_id}", response_model=APIResponse[IPAddress])
 async def update_address(
-    address_id: str,
+    address_id: UUID,
     data: IPAddressUpdate,
     _user: JWTPayload = Depends(require_operator),
 ) -> APIResponse[IPAddress]:
@@ -181,7 +227,7 @@ async def update_address(
 
 @router.delete("/addresses/{address_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_address(
-    address_id: str,
+    address_id: UUID,
     _user: JWTPayload = Depends(require_admin),
 ) -> None:
     """Delete an IP address (requires admin role)."""
@@ -196,7 +242,7 @@ async def delete_address(
 # Scan endpoints
 @router.post("/networks/{network_id}/scan", response_model=APIResponse[ScanJob])
 async def start_scan(
-    network_id: str,
+    network_id: UUID,
     scan_type: ScanType = ScanType.PING,
     background_tasks: BackgroundTasks = BackgroundTasks(),
     _user: JWTPayload = Depends(require_operator),
@@ -219,7 +265,7 @@ async def start_scan(
 
 @router.get("/scans/{scan_id}", response_model=APIResponse[ScanJob])
 async def get_scan_status(
-    scan_id: str,
+    scan_id: UUID,
     _user: JWTPayload = Depends(get_current_user),
 ) -> APIResponse[ScanJob]:
     """Get the status of a scan job."""
@@ -234,7 +280,7 @@ async def get_scan_status(
 
 @router.get("/networks/{network_id}/scans", response_model=APIResponse[list[ScanJob]])
 async def list_network_scans(
-    network_id: str,
+    network_id: UUID,
     limit: Annotated[int, Query(ge=1, le=50)] = 10,
     _user: JWTPayload = Depends(get_current_user),
 ) -> APIResponse[list[ScanJob]]:
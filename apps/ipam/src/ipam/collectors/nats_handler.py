@@ -1,10 +1,10 @@
 """NATS JetStream handler for async scan processing."""
 
 import asyncio
-import json
 from typing import Any, Callable, Coroutine
 
 import nats
+import orjson
 from nats.js import JetStreamContext
 from nats.js.api import ConsumerConfig, DeliverPolicy, AckPolicy
 
@@ -12,7 +12,7 @@ from ..core.config import settings
 from ..core.logging import get_logger
 from ..services.scanner import ScannerService
 from ..services.metrics import MetricsService
-from ..models.scan import ScanType
+from ..models.scan import ScanResult, ScanType
 
 logger = get_logger(__name__)
 
@@ -23,7 +23,35 @@ SUBJECT_SCAN_COMPLETE = "ipam.scan.complete"
 SUBJECT_DISCOVERY = "ipam.discovery.result"
 
 # Stream configuration
+# Scan requests are single-consumer work items: a workqueue stream deletes
+# each one as soon as it is acked. Completion events live in a separate
+# limits stream so they remain replayable.
 STREAM_NAME = "IPAM"
+SCAN_QUEUE_STREAM_NAME = "IPAM_SCAN_QUEUE"
+
+# orjson options for outgoing payloads: treat naive datetimes as UTC so
+# model_dump() output (datetimes, enums) serializes without a custom encoder.
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC
+
+
+# Value -> member lookup for incoming scan requests (cheaper than ScanType(...))
+_SCAN_TYPES: dict[str, ScanType] = {m.value: m for m in ScanType}
+
+
+def _encode(data: dict[str, Any]) -> bytes:
+    """Serialize a payload straight to bytes (no intermediate str)."""
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTS)
+
+
+# Static framing for scan failure events; only the id and error are encoded
+# per message. Field order matches the previous dict-based payload.
+_FAIL_PREFIX = b'{"network_id":'
+_FAIL_STATUS = b',"status":"failed","error":'
+
+
+def _fail_payload(network_id: str, error: str) -> bytes:
+    """Build a scan failure payload from pre-encoded static parts."""
+    return _FAIL_PREFIX + orjson.dumps(network_id) + _FAIL_STATUS + orjson.dumps(error) + b"}"
 
 
 class NATSHandler:
@@ -61,32 +89,54 @@ class NATSHandler:
             self.nc = await nats.connect(**connect_opts)
             self.js = self.nc.jetstream()
 
-            # Ensure stream exists or update it
-            try:
-                stream_info = await self.js.stream_info(STREAM_NAME)
-                logger.info("stream_exists", stream=STREAM_NAME, subjects=stream_info.config.subjects)
-            except nats.js.errors.NotFoundError:
-                logger.info("creating_jetstream_stream", stream=STREAM_NAME)
-                try:
-                    await self.js.add_stream(
-                        name=STREAM_NAME,
-                        subjects=[
-                            "ipam.scan.*",
-                            "ipam.discovery.*",
-                        ],
-                        retention="limits",
-                        max_msgs=100000,
-                        max_age=86400 * 7,  # 7 days
-                    )
-                except nats.js.errors.BadRequestError as e:
-                    # Stream might exist with overlapping subjects from another service
-                    logger.warning("stream_creation_conflict", error=str(e))
+            # Completion events first: narrows a legacy IPAM stream that still
+            # captures ipam.scan.* before the work queue claims the request subject.
+            await self._ensure_stream(
+                STREAM_NAME,
+                subjects=[SUBJECT_SCAN_COMPLETE],
+                retention="limits",
+                max_msgs=100000,
+                max_age=86400 * 7,  # 7 days
+            )
+            await self._ensure_stream(
+                SCAN_QUEUE_STREAM_NAME,
+                subjects=[SUBJECT_SCAN_REQUEST],
+                retention="workqueue",
+                storage="file",
+                max_msgs=10000,
+                max_msgs_per_subject=10000,
+                max_age=86400,  # 1 day; older requests are stale
+                discard="new",  # back-pressure publishers when the queue is full
+            )
 
             logger.info("nats_connected", url=settings.nats_url)
         except Exception as e:
             logger.error("nats_connection_failed", error=str(e))
             raise
 
+    async def _ensure_stream(self, name: str, subjects: list[str], **config: Any) -> None:
+        """Create a JetStream stream, or realign its subjects if it already exists."""
+        if not self.js:
+            raise RuntimeError("NATS not connected")
+
+        try:
+            stream_info = await self.js.stream_info(name)
+            if sorted(stream_info.config.subjects or []) != sorted(subjects):
+                stream_info.config.subjects = subjects
+                await self.js.update_stream(stream_info.config)
+                logger.info("stream_subjects_updated", stream=name, subjects=subjects)
+            else:
+                logger.info("stream_exists", stream=name, subjects=subjects)
+        except nats.js.errors.NotFoundError:
+            logger.info("creating_jetstream_stream", stream=name)
+            try:
+                await self.js.add_stream(name=name, subjects=subjects, **config)
+            except nats.js.errors.BadRequestError as e:
+                # Stream might exist with overlapping subjects from another service
+                logger.warning("stream_creation_conflict", stream=name, error=str(e))
+        except nats.js.errors.BadRequestError as e:
+            logger.warning("stream_update_conflict", stream=name, error=str(e))
+
     async def disconnect(self) -> None:
         """Disconnect from NATS server."""
         self._running = False
@@ -151,7 +201,7 @@ class NATSHandler:
                     messages = await consumer.fetch(batch=1, timeout=5)
                     for msg in messages:
                         try:
-                            data = json.loads(msg.data.decode())
+                            data = orjson.loads(msg.data)
                             await handler(data)
                             await msg.ack()
                         except Exception as e:
@@ -172,12 +222,19 @@ class NATSHandler:
     async def _handle_scan_request(self, data: dict[str, Any]) -> None:
         """Handle a scan request message."""
         network_id = data.get("network_id")
-        scan_type = ScanType(data.get("scan_type", "ping"))
+        raw_scan_type = data.get("scan_type", "ping")
+        scan_type = _SCAN_TYPES.get(raw_scan_type)
 
         if not network_id:
             logger.warning("invalid_scan_request", data=data)
             return
 
+        if scan_type is None:
+            # Reject rather than run a different scan; returning acks the message
+            logger.warning("invalid_scan_type", network_id=network_id, scan_type=raw_scan_type)
+            await self.publish_scan_failed(network_id, f"Unknown scan type: {raw_scan_type}")
+            return
+
         logger.info("processing_scan_request", network_id=network_id, scan_type=scan_type.value)
 
         try:
@@ -188,7 +245,7 @@ class NATSHandler:
             result = await self.scanner.run_scan(scan_job.id)
 
             # Publish completion message
-            await self.publish_scan_complete(result.model_dump())
+            await self.publish_scan_complete_model(result)
 
             # Push metrics
             await self.metrics.push_scan_metrics(
@@ -203,11 +260,22 @@ class NATSHandler:
 
         except Exception as e:
             logger.error("scan_processing_failed", network_id=network_id, error=str(e))
-            await self.publish_scan_complete({
-                "network_id": network_id,
-                "status": "failed",
-                "error": str(e),
-            })
+            await self.publish_scan_failed(network_id, str(e))
+
+    async def _publish(self, subject: str, payload: bytes, durable: bool = False) -> None:
+        """Publish a payload.
+
+        Durable events go through JetStream (stored and acked by the broker);
+        everything else is fire-and-forget on core NATS.
+        """
+        if durable:
+            if not self.js:
+                return
+            await self.js.publish(subject, payload)
+        else:
+            if not self.nc:
+                return
+            await self.nc.publish(subject, payload)
 
     async def publish_scan_request(
         self,
@@ -219,45 +287,40 @@ class NATSHandler:
         if not self.js:
             raise RuntimeError("NATS not connected")
 
-        await self.js.publish(
+        await self._publish(
             SUBJECT_SCAN_REQUEST,
-            json.dumps({
+            _encode({
                 "network_id": network_id,
                 "network_name": network_name,
                 "scan_type": scan_type,
-            }).encode(),
+            }),
+            durable=True,
         )
         logger.info("scan_request_published", network_id=network_id)
 
     async def publish_scan_progress(self, data: dict[str, Any]) -> None:
-        """Publish scan progress update."""
-        if not self.js:
-            return
+        """Publish scan progress update (core NATS, not persisted)."""
+        await self._publish(SUBJECT_SCAN_PROGRESS, _encode(data))
 
-        await self.js.publish(
-            SUBJECT_SCAN_PROGRESS,
-            json.dumps(data).encode(),
+    async def publish_scan_complete_model(self, result: ScanResult) -> None:
+        """Publish scan completion event serialized directly from the model."""
+        await self._publish(
+            SUBJECT_SCAN_COMPLETE,
+            result.model_dump_json().encode(),
+            durable=True,
         )
 
-    async def publish_scan_complete(self, data: dict[str, Any]) -> None:
-        """Publish scan completion event."""
-        if not self.js:
-            return
-
-        await self.js.publish(
+    async def publish_scan_failed(self, network_id: str, error: str) -> None:
+        """Publish a scan failure as a completion event."""
+        await self._publish(
             SUBJECT_SCAN_COMPLETE,
-            json.dumps(data).encode(),
+            _fail_payload(network_id, error),
+            durable=True,
         )
 
     async def publish_discovery(self, data: dict[str, Any]) -> None:
-        """Publish IP discovery result."""
-        if not self.js:
-            return
-
-        await self.js.publish(
-            SUBJECT_DISCOVERY,
-            json.dumps(data).encode(),
-        )
+        """Publish IP discovery result (core NATS, not persisted)."""
+        await self._publish(SUBJECT_DISCOVERY, _encode(data))
 
 
 async def main() -> None:
@@ -22,6 +22,10 @@ class Settings(BaseServiceSettings):
     # IPAM-specific: OTEL service name
     otel_service_name: str = Field(default="ipam-service", alias="OTEL_SERVICE_NAME")
 
+    # Database pool: sized by DB_POOL_MIN/DB_POOL_MAX (set them equal for a
+    # fixed-size pool); idle connections are probed before reuse
+    db_pre_ping_after: float = Field(default=60.0, alias="DB_PRE_PING_AFTER")
+
     # Scanning
     scan_timeout: int = Field(default=300, alias="SCAN_TIMEOUT")
     scan_concurrency: int = Field(default=50, alias="SCAN_CONCURRENCY")
@@ -1,13 +1,14 @@
 """Database connection and utilities."""
 
 from .connection import db_pool, get_db, init_db, close_db
-from .repository import NetworkRepository, AddressRepository, ScanRepository
+from .repository import EntityId, NetworkRepository, AddressRepository, ScanRepository
 
 __all__ = [
     "db_pool",
     "get_db",
     "init_db",
     "close_db",
+    "EntityId",
     "NetworkRepository",
     "AddressRepository",
     "ScanRepository",
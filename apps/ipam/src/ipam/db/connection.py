@@ -5,10 +5,6 @@ get_db, get_pool, transaction, check_health) so existing IPAM code
 doesn't need import changes.
 """
 
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-
-import asyncpg
 from asyncpg import Pool
 
 from shared_python import DatabasePool
@@ -27,6 +23,14 @@ db_pool = DatabasePool(
     command_timeout=60,
     max_retries=5,
     retry_delay=2.0,
+    # Repository SQL is canonical text, so a larger cache keeps every
+    # variant prepared per connection once first used; the cacheable-size
+    # ceiling leaves room for CTEs to grow without silently falling out of
+    # the cache
+    statement_cache_size=2048,
+    max_cacheable_statement_size=32768,
+    max_inactive_connection_lifetime=600,
+    pre_ping_after=settings.db_pre_ping_after,
 )
 
 
@@ -45,18 +49,12 @@ def get_pool() -> Pool:
     return db_pool.pool
 
 
-@asynccontextmanager
-async def get_db() -> AsyncGenerator[asyncpg.Connection, None]:
-    """Get a database connection from the pool."""
-    async with db_pool.acquire() as connection:
-        yield connection
-
-
-@asynccontextmanager
-async def transaction() -> AsyncGenerator[asyncpg.Connection, None]:
-    """Get a database connection with an active transaction."""
-    async with db_pool.transaction() as connection:
-        yield connection
+# Exposed directly rather than re-wrapped in generator-based context managers:
+# `async with get_db() as conn` / `async with transaction() as conn` go
+# straight to the pool. FastAPI dependencies needing `yield` should wrap these
+# locally.
+get_db = db_pool.acquire
+transaction = db_pool.transaction
 
 
 async def check_health() -> bool:
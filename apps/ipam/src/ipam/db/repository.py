@@ -1,25 +1,553 @@
 """Database repositories for IPAM entities."""
 
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import datetime, timezone
-from typing import Any
+from enum import Enum
+from functools import lru_cache
+from ipaddress import ip_address, ip_network
+from collections.abc import AsyncIterator
+from typing import Any, TypeVar
 from uuid import UUID
 
 from asyncpg import Connection
-
-from ..models.network import Network, NetworkCreate, NetworkUpdate, NetworkWithStats
-from ..models.address import IPAddress, IPAddressCreate, IPAddressUpdate, IPStatus
+from pydantic import BaseModel
+from shared_python import TTLCache
+
+from ..models.network import Network, NetworkCreate, NetworkUpdate, NetworkWithStats, host_count
+from ..models.address import (
+    IPAddress,
+    IPAddressCreate,
+    IPAddressDiscovered,
+    IPAddressUpdate,
+    IPStatus,
+)
 from ..models.scan import ScanJob, ScanJobCreate, ScanStatus, ScanType
 from ..models.common import NetworkStats
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_M = TypeVar("_M", bound=BaseModel)
+
+# Entity ids as handed to repositories: route handlers pass the uuid.UUID
+# FastAPI already parsed, NATS consumers pass the string from the message.
+# asyncpg encodes either for a uuid parameter, so neither is re-parsed here.
+EntityId = UUID | str
+
+# ---------------------------------------------------------------------------
+# SQL
+#
+# asyncpg keeps a per-connection cache of prepared statements keyed by query
+# text. Static statements are module-level constants and dynamic ones come from
+# cached builders keyed by a canonical (sorted) field mask, so the same logical
+# query always produces the same text and skips re-parse/re-plan on reuse.
+# ---------------------------------------------------------------------------
+
+_NETWORK_COLUMNS = """id::text, name, network::text, vlan_id, description, location,
+                   gateway::text, dns_servers::text[] as dns_servers, is_active,
+                   created_by::text, created_at, updated_at"""
+
+_ADDRESS_COLUMNS = """id::text, network_id::text, address::text, mac_address::text,
+                   hostname, fqdn, status, device_type, description, last_seen, discovered_at,
+                   created_at, updated_at"""
+
+_SCAN_COLUMNS = """id::text, network_id::text, scan_type, status, started_at, completed_at,
+                   total_ips, active_ips, new_ips, error_message"""
+
+_NETWORK_RETURNING = f"RETURNING {_NETWORK_COLUMNS}"
+_ADDRESS_RETURNING = f"RETURNING {_ADDRESS_COLUMNS}"
+_SCAN_RETURNING = f"RETURNING {_SCAN_COLUMNS}"
+
+# Conflict handling shared by every address upsert path (single, UNNEST, COPY)
+# so a re-seen host is merged the same way whichever path wrote it.
+_ADDRESS_ON_CONFLICT = """
+    ON CONFLICT (network_id, address)
+    DO UPDATE SET
+        mac_address = COALESCE(EXCLUDED.mac_address, ipam.addresses.mac_address),
+        hostname = COALESCE(EXCLUDED.hostname, ipam.addresses.hostname),
+        status = EXCLUDED.status,
+        last_seen = NOW(),
+        updated_at = NOW(),
+        discovered_at = COALESCE(ipam.addresses.discovered_at, EXCLUDED.discovered_at)
+"""
+
+# Bulk upserts report how many rows were inserted (xmax = 0) rather than updated.
+_ADDRESS_BULK_UPSERT = """
+    WITH upserted AS (
+        INSERT INTO ipam.addresses (
+            network_id, address, mac_address, hostname,
+            status, last_seen, discovered_at
+        )
+        {source}
+        {on_conflict}
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT COUNT(*) FILTER (WHERE inserted) FROM upserted
+"""
+
+_Q_NETWORK_FIND_BY_ID = f"""
+    SELECT {_NETWORK_COLUMNS}
+    FROM ipam.networks
+    WHERE id = $1
+"""
+
+_Q_NETWORK_FIND_BY_CIDR = f"""
+    SELECT {_NETWORK_COLUMNS}
+    FROM ipam.networks
+    WHERE network = $1::cidr
+"""
+
+_Q_NETWORK_CREATE = f"""
+    INSERT INTO ipam.networks (
+        name, network, vlan_id, description, location,
+        gateway, dns_servers, is_active, created_by
+    )
+    VALUES ($1, $2::cidr, $3, $4, $5, $6::inet, $7::inet[], $8, $9)
+    {_NETWORK_RETURNING}
+"""
+
+_Q_NETWORK_DELETE = "DELETE FROM ipam.networks WHERE id = $1"
+
+# Status counts are maintained by triggers in ipam.network_address_counts,
+# so this is a primary-key lookup plus an index-backed probe for the
+# latest completed scan; no addresses rows are read. Host totals and
+# utilization are derived from the CIDR in get_stats().
+_NETWORK_STATS_SELECT = """
+    SELECT
+        n.id::text as network_id,
+        n.network::text as network,
+        COALESCE(c.total, 0) as used_addresses,
+        COALESCE(c.active, 0) as active_count,
+        COALESCE(c.inactive, 0) as inactive_count,
+        COALESCE(c.reserved, 0) as reserved_count,
+        COALESCE(c.dhcp, 0) as dhcp_count,
+        COALESCE(c.unknown, 0) as unknown_count,
+        ls.started_at as last_scan
+    FROM ipam.networks n
+    LEFT JOIN ipam.network_address_counts c ON c.network_id = n.id
+    LEFT JOIN LATERAL (
+        SELECT started_at
+        FROM ipam.scan_history
+        WHERE network_id = n.id AND status = 'completed'
+        ORDER BY started_at DESC
+        LIMIT 1
+    ) ls ON true
+"""
+
+_Q_NETWORK_STATS = _NETWORK_STATS_SELECT + "    WHERE n.id = $1\n"
+
+# Same row shape for many networks in one round trip
+_Q_NETWORK_STATS_BULK = _NETWORK_STATS_SELECT + "    WHERE n.id = ANY($1::uuid[])\n"
+
+# Network row plus the stats the detail view shows, in one round trip
+_Q_NETWORK_WITH_STATS = f"""
+    SELECT n.*, COALESCE(c.total, 0) as used_addresses, ls.started_at as last_scan
+    FROM (SELECT {_NETWORK_COLUMNS} FROM ipam.networks WHERE id = $1) n
+    LEFT JOIN ipam.network_address_counts c ON c.network_id = $1
+    LEFT JOIN LATERAL (
+        SELECT started_at
+        FROM ipam.scan_history
+        WHERE network_id = $1 AND status = 'completed'
+        ORDER BY started_at DESC
+        LIMIT 1
+    ) ls ON true
+"""
+
+_Q_ADDRESS_FIND_BY_ID = f"""
+    SELECT {_ADDRESS_COLUMNS}
+    FROM ipam.addresses
+    WHERE id = $1
+"""
+
+# Full, unpaginated listing for exports; read through a server-side cursor
+_Q_ADDRESS_ITER_BY_NETWORK = f"""
+    SELECT {_ADDRESS_COLUMNS}
+    FROM ipam.addresses
+    WHERE network_id = $1 AND ($2::text IS NULL OR status = $2)
+    ORDER BY address
+"""
+
+# An export holds a connection and a transaction open for as long as the
+# client keeps reading; cap each cursor FETCH and, more importantly, the gap
+# between FETCHes, so a stalled download can't pin a pool connection
+_Q_EXPORT_TIMEOUTS = """
+    SET LOCAL statement_timeout = '60s';
+    SET LOCAL idle_in_transaction_session_timeout = '60s'
+"""
+
+_Q_ADDRESS_FIND_BY_IP = f"""
+    SELECT {_ADDRESS_COLUMNS}
+    FROM ipam.addresses
+    WHERE network_id = $1 AND address = $2::inet
+"""
+
+_Q_ADDRESS_CREATE = f"""
+    INSERT INTO ipam.addresses (
+        network_id, address, mac_address, hostname, fqdn,
+        status, device_type, description, discovered_at
+    )
+    VALUES ($1, $2::inet, $3::macaddr, $4, $5, $6, $7, $8, NOW())
+    {_ADDRESS_RETURNING}
+"""
+
+_Q_ADDRESS_UPSERT = f"""
+    INSERT INTO ipam.addresses (
+        network_id, address, mac_address, hostname, fqdn,
+        status, device_type, description, last_seen, discovered_at
+    )
+    VALUES ($1, $2::inet, $3::macaddr, $4, $5, $6, $7, $8, NOW(), NOW())
+    {_ADDRESS_ON_CONFLICT}
+    {_ADDRESS_RETURNING}
+"""
+
+# Bulk variant of the upsert above: one statement per batch, arrays unnested
+# column-wise.
+_Q_ADDRESS_UPSERT_MANY = _ADDRESS_BULK_UPSERT.format(
+    source="""
+        SELECT $1, t.address, t.mac_address, t.hostname, $5, NOW(), NOW()
+        FROM unnest($2::inet[], $3::macaddr[], $4::text[]) AS t(address, mac_address, hostname)
+    """,
+    on_conflict=_ADDRESS_ON_CONFLICT,
+)
+
+# COPY path for large sweeps: rows are streamed into a transaction-scoped
+# staging table (binary COPY, no per-row parse/plan) and merged in one pass.
+# asyncpg has no binary encoder for macaddr, so the MAC is staged as text and
+# cast during the merge.
+_Q_ADDRESS_STAGE_CREATE = """
+    CREATE TEMP TABLE _addr_stage (
+        address inet NOT NULL,
+        mac_address text,
+        hostname text
+    ) ON COMMIT DROP
+"""
+
+_ADDRESS_STAGE_COLUMNS = ("address", "mac_address", "hostname")
+
+_Q_ADDRESS_MERGE_STAGE = _ADDRESS_BULK_UPSERT.format(
+    source="""
+        SELECT $1, s.address, s.mac_address::macaddr, s.hostname, $2, NOW(), NOW()
+        FROM _addr_stage s
+    """,
+    on_conflict=_ADDRESS_ON_CONFLICT,
+)
+
+_Q_ADDRESS_DELETE = "DELETE FROM ipam.addresses WHERE id = $1"
+
+# Anti-join against the unnested active set (typed inet[] so it compares on the
+# column type) instead of a per-row `!= ALL(array)` scan.
+_Q_ADDRESS_MARK_INACTIVE = """
+    UPDATE ipam.addresses a
+    SET status = 'inactive', updated_at = NOW()
+    WHERE a.network_id = $1
+      AND a.status = 'active'
+      AND NOT EXISTS (
+          SELECT 1 FROM unnest($2::inet[]) AS t(ip) WHERE t.ip = a.address
+      )
+"""
+
+# Same as above with responders given as offsets from the network address
+_Q_ADDRESS_MARK_INACTIVE_OFFSETS = """
+    UPDATE ipam.addresses a
+    SET status = 'inactive', updated_at = NOW()
+    WHERE a.network_id = $1
+      AND a.status = 'active'
+      AND NOT EXISTS (
+          SELECT 1 FROM unnest($3::bigint[]) AS t(n) WHERE $2::inet + t.n = a.address
+      )
+"""
+
+_Q_SCAN_CREATE = f"""
+    INSERT INTO ipam.scan_history (network_id, scan_type, started_at, status)
+    VALUES ($1, $2, NOW(), 'pending')
+    {_SCAN_RETURNING}
+"""
+
+# One template for every status transition: counters left as NULL keep their
+# stored value, and terminal statuses stamp completed_at. A scan therefore
+# costs two writes (running, then completed/failed with all aggregates) that
+# share a single cached plan.
+_Q_SCAN_UPDATE_STATUS = f"""
+    UPDATE ipam.scan_history
+    SET status = $2,
+        completed_at = CASE WHEN $2 IN ('completed', 'failed') THEN NOW() ELSE completed_at END,
+        total_ips = COALESCE($3, total_ips),
+        active_ips = COALESCE($4, active_ips),
+        new_ips = COALESCE($5, new_ips),
+        error_message = COALESCE($6, error_message)
+    WHERE id = $1
+    {_SCAN_RETURNING}
+"""
+
+_Q_SCAN_FIND_BY_ID = f"""
+    SELECT {_SCAN_COLUMNS}
+    FROM ipam.scan_history
+    WHERE id = $1
+"""
+
+_Q_SCAN_FIND_BY_NETWORK = f"""
+    SELECT {_SCAN_COLUMNS}
+    FROM ipam.scan_history
+    WHERE network_id = $1
+    ORDER BY started_at DESC
+    LIMIT $2
+"""
+
+# Parameter casts for dynamic UPDATE builders
+_NETWORK_UPDATE_CASTS = {"network": "::cidr", "gateway": "::inet", "dns_servers": "::inet[]"}
+_ADDRESS_UPDATE_CASTS = {"mac_address": "::macaddr"}
+
+
+# Window count added to OFFSET pages so the total arrives with the rows instead
+# of needing its own round trip. model_construct ignores the extra column.
+_TOTAL_COUNT = "COUNT(*) OVER () AS total_count"
+
+
+@lru_cache(maxsize=8)
+def _network_list_sql(
+    has_search: bool, has_is_active: bool, has_cursor: bool
+) -> tuple[str, str]:
+    """Build (count, page) queries for NetworkRepository.find_all.
+
+    With a cursor the page is a keyset seek on (created_at, id) instead of
+    LIMIT/OFFSET, so deep pages cost the same as the first. OFFSET pages carry
+    the total in a ``total_count`` window column; the count query is only a
+    fallback for pages past the end (see _window_total).
+    """
+    where_clauses = []
+    param_idx = 1
+
+    if has_search:
+        # network_text is a generated column with a trigram index
+        where_clauses.append(
+            f"(name ILIKE ${param_idx} OR network_text ILIKE ${param_idx} OR location ILIKE ${param_idx})"
+        )
+        param_idx += 1
+
+    if has_is_active:
+        where_clauses.append(f"is_active = ${param_idx}")
+        param_idx += 1
+
+    count_where = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    count_sql = f"SELECT COUNT(*) FROM ipam.networks {count_where}"
+
+    if has_cursor:
+        where_clauses.append(f"(created_at, id) < (${param_idx}, ${param_idx + 1})")
+        param_idx += 2
+        columns = _NETWORK_COLUMNS
+        page_sql = f"LIMIT ${param_idx}"
+    else:
+        columns = f"{_NETWORK_COLUMNS}, {_TOTAL_COUNT}"
+        page_sql = f"LIMIT ${param_idx} OFFSET ${param_idx + 1}"
+
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    query = f"""
+        SELECT {columns}
+        FROM ipam.networks
+        {where_sql}
+        ORDER BY created_at DESC, id DESC
+        {page_sql}
+    """
+    return count_sql, query
+
+
+_SEARCH_PREFIX = "prefix"
+_SEARCH_PATTERN = "pattern"
+
+
+def _address_search(search: str) -> tuple[str, str]:
+    """Classify an address search term and build its LIKE parameter.
+
+    Plain terms are treated as prefixes (index-friendly ``term%``); terms with
+    an explicit ``*`` or ``%`` wildcard are used as the ILIKE pattern as given
+    and go through the trigram indexes.
+    """
+    if "*" in search or "%" in search:
+        return _SEARCH_PATTERN, search.replace("*", "%")
+    escaped = search.lower().replace("\\", "\\\\").replace("_", "\\_")
+    return _SEARCH_PREFIX, f"{escaped}%"
+
+
+@lru_cache(maxsize=16)
+def _address_list_sql(
+    has_status: bool, search_mode: str | None, has_cursor: bool
+) -> tuple[str, str]:
+    """Build (count, page) queries for AddressRepository.find_by_network.
+
+    Addresses are unique per network, so a cursor seeks on ``address`` alone
+    along the (network_id, address) unique index. OFFSET pages carry the total
+    the same way as _network_list_sql.
+    """
+    where_clauses = ["network_id = $1"]
+    param_idx = 2
+
+    if has_status:
+        where_clauses.append(f"status = ${param_idx}")
+        param_idx += 1
+
+    if search_mode == _SEARCH_PREFIX:
+        # Btree text_pattern_ops indexes; the term is already lower-cased
+        where_clauses.append(
+            f"(lower(hostname) LIKE ${param_idx} OR address_text LIKE ${param_idx} OR mac_text LIKE ${param_idx})"
+        )
+        param_idx += 1
+    elif search_mode == _SEARCH_PATTERN:
+        # address_text/mac_text are generated columns with trigram indexes
+        where_clauses.append(
+            f"(address_text ILIKE ${param_idx} OR hostname ILIKE ${param_idx} OR mac_text ILIKE ${param_idx})"
+        )
+        param_idx += 1
+
+    count_sql = f"SELECT COUNT(*) FROM ipam.addresses WHERE {' AND '.join(where_clauses)}"
+
+    if has_cursor:
+        where_clauses.append(f"address > ${param_idx}::inet")
+        param_idx += 1
+        columns = _ADDRESS_COLUMNS
+        page_sql = f"LIMIT ${param_idx}"
+    else:
+        columns = f"{_ADDRESS_COLUMNS}, {_TOTAL_COUNT}"
+        page_sql = f"LIMIT ${param_idx} OFFSET ${param_idx + 1}"
+
+    query = f"""
+        SELECT {columns}
+        FROM ipam.addresses
+        WHERE {' AND '.join(where_clauses)}
+        ORDER BY address
+        {page_sql}
+    """
+    return count_sql, query
+
+
+@lru_cache(maxsize=256)
+def _network_update_sql(fields: tuple[str, ...]) -> str:
+    """Build an UPDATE for a sorted network field mask ($1 is the id)."""
+    sets = ", ".join(
+        f"{field} = ${idx}{_NETWORK_UPDATE_CASTS.get(field, '')}"
+        for idx, field in enumerate(fields, start=2)
+    )
+    return f"""
+        UPDATE ipam.networks
+        SET {sets}, updated_at = NOW()
+        WHERE id = $1
+        {_NETWORK_RETURNING}
+    """
+
+
+@lru_cache(maxsize=128)
+def _address_update_sql(fields: tuple[str, ...]) -> str:
+    """Build an UPDATE for a sorted address field mask ($1 is the id)."""
+    sets = ", ".join(
+        f"{field} = ${idx}{_ADDRESS_UPDATE_CASTS.get(field, '')}"
+        for idx, field in enumerate(fields, start=2)
+    )
+    return f"""
+        UPDATE ipam.addresses
+        SET {sets}, updated_at = NOW()
+        WHERE id = $1
+        {_ADDRESS_RETURNING}
+    """
+
+
+def _encode_cursor(*parts: str) -> str:
+    """Pack keyset values into an opaque, URL-safe pagination cursor."""
+    return urlsafe_b64encode("|".join(parts).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> list[str]:
+    """Unpack a cursor from _encode_cursor(); raises ValueError if malformed."""
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    parts = raw.split("|")
+    if len(parts) != size:
+        raise ValueError("Invalid pagination cursor")
+    return parts
+
 
 def _row_to_dict(row: Any) -> dict[str, Any]:
     """Convert asyncpg Record to dictionary."""
     return dict(row) if row else {}
 
 
+@lru_cache(maxsize=4096)
+def _usable_hosts(cidr: str) -> int:
+    """Number of assignable hosts in a CIDR."""
+    return host_count(ip_network(cidr))
+
+
+def _utilization_percent(used: int, total: int) -> float:
+    """Share of usable hosts in use, as a percentage to two places."""
+    return round(used / total * 100, 2) if total > 0 else 0
+
+
+def _stats_from_row(row: Any) -> NetworkStats:
+    """Build NetworkStats from a stats row, deriving totals from the CIDR."""
+    data = _row_to_dict(row)
+    total = _usable_hosts(data.pop("network"))
+    used = data["used_addresses"]
+    data["total_addresses"] = total
+    data["available_addresses"] = total - used
+    data["utilization_percent"] = _utilization_percent(used, total)
+    return NetworkStats(**data)
+
+
+async def _window_total(
+    conn: Connection, rows: list[Any], page: int, count_sql: str, params: list[Any]
+) -> int:
+    """Total matches for an OFFSET page, read from its ``total_count`` column.
+
+    A page past the end has no row to carry the total, so only then is the
+    separate count query run.
+    """
+    if rows:
+        return rows[0]["total_count"]
+    if page <= 1:
+        return 0
+    return await conn.fetchval(count_sql, *params)
+
+
+def _row_to_model(model: type[_M], row: Any, **enums: type[Enum]) -> _M:
+    """Build a model from a row without re-validating DB-typed columns.
+
+    The column lists above cast UUID/inet columns to text, so every row already
+    matches the model's field types and pydantic validation would be redundant.
+    ``enums`` maps text columns to the Enum the model declares for them, so
+    serialization sees real members rather than bare strings.
+    """
+    data = dict(row)
+    for field, enum in enums.items():
+        if data[field] is not None:
+            data[field] = enum(data[field])
+    return model.model_construct(**data)
+
+
+def _rows_to_models(
+    model: type[_M], rows: list[Any], **enums: type[Enum]
+) -> list[_M]:
+    """Build models from list rows; see _row_to_model."""
+    if not enums:
+        construct = model.model_construct
+        return [construct(**dict(row)) for row in rows]
+    return [_row_to_model(model, row, **enums) for row in rows]
+
+
+# How stale a network read through find_by_id_cached() may be. Writes through
+# NetworkRepository evict in the writing process only, so another process (the
+# NATS scanner) can see an updated or deleted network for up to this long.
+SCAN_NETWORK_CACHE_TTL = 60.0
+
+# Network metadata for the scan path only; API reads always hit the database
+_scan_networks = TTLCache(maxsize=1024, ttl=SCAN_NETWORK_CACHE_TTL)
+
+
+def _invalidate_network(network_id: EntityId) -> None:
+    """Evict a network from the scan cache after a write."""
+    _scan_networks.invalidate(str(network_id))
+
+
 class NetworkRepository:
     """Repository for network/subnet operations."""
 
@@ -32,87 +560,84 @@ class NetworkRepository:
         limit: int = 20,
         search: str | None = None,
         is_active: bool | None = None,
-    ) -> tuple[list[Network], int]:
-        """Find all networks with pagination and optional filters."""
-        where_clauses = []
+        cursor: str | None = None,
+    ) -> tuple[list[Network], int | None, str | None]:
+        """Find all networks with pagination and optional filters.
+
+        Returns (networks, total, next_cursor). When ``cursor`` is given the
+        page is read by keyset and ``page`` is ignored; the total is skipped
+        (None) since cursor clients walk pages rather than jump to them.
+        """
+        count_sql, query = _network_list_sql(
+            bool(search), is_active is not None, cursor is not None
+        )
         params: list[Any] = []
-        param_idx = 1
 
         if search:
-            where_clauses.append(
-                f"(name ILIKE ${param_idx} OR network::text ILIKE ${param_idx} OR location ILIKE ${param_idx})"
-            )
             params.append(f"%{search}%")
-            param_idx += 1
 
         if is_active is not None:
-            where_clauses.append(f"is_active = ${param_idx}")
             params.append(is_active)
-            param_idx += 1
-
-        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-
-        # Get total count
-        count_sql = f"SELECT COUNT(*) FROM ipam.networks {where_sql}"
-        total = await self.conn.fetchval(count_sql, *params)
 
-        # Get paginated results
-        offset = (page - 1) * limit
-        params.extend([limit, offset])
+        if cursor is not None:
+            created_at, last_id = _decode_cursor(cursor, 2)
+            try:
+                params.extend([datetime.fromisoformat(created_at), UUID(last_id)])
+            except ValueError as e:
+                raise ValueError("Invalid pagination cursor") from e
+            rows = await self.conn.fetch(query, *params, limit)
+            total = None
+        else:
+            rows = await self.conn.fetch(query, *params, limit, (page - 1) * limit)
+            total = await _window_total(self.conn, rows, page, count_sql, params)
 
-        query = f"""
-            SELECT id, name, network::text, vlan_id, description, location,
-                   gateway::text, dns_servers::text[] as dns_servers, is_active,
-                   created_by, created_at, updated_at
-            FROM ipam.networks
-            {where_sql}
-            ORDER BY created_at DESC
-            LIMIT ${param_idx} OFFSET ${param_idx + 1}
-        """
+        networks = _rows_to_models(Network, rows)
 
-        rows = await self.conn.fetch(query, *params)
-        networks = [Network(**_row_to_dict(row)) for row in rows]
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = _encode_cursor(last["created_at"].isoformat(), last["id"])
 
-        return networks, total
+        return networks, total, next_cursor
 
-    async def find_by_id(self, network_id: str) -> Network | None:
+    async def find_by_id(self, network_id: EntityId) -> Network | None:
         """Find a network by ID."""
-        query = """
-            SELECT id, name, network::text, vlan_id, description, location,
-                   gateway::text, dns_servers::text[] as dns_servers, is_active,
-                   created_by, created_at, updated_at
-            FROM ipam.networks
-            WHERE id = $1
+        row = await self.conn.fetchrow(_Q_NETWORK_FIND_BY_ID, network_id)
+        return _row_to_model(Network, row) if row else None
+
+    async def find_by_id_cached(
+        self,
+        network_id: EntityId,
+        refresh: bool = False,
+    ) -> Network | None:
+        """Find a network by ID for the scanner, via a short-lived cache.
+
+        The result may be up to SCAN_NETWORK_CACHE_TTL seconds stale. Pass
+        ``refresh=True`` to read the database and re-prime the entry. Only
+        hits are cached, so a missing network is always re-queried.
         """
-        row = await self.conn.fetchrow(query, UUID(network_id))
-        return Network(**_row_to_dict(row)) if row else None
+        key = str(network_id)
+        if not refresh:
+            network = _scan_networks.get(key)
+            if network is not None:
+                return network
+
+        network = await self.find_by_id(network_id)
+        if network is None:
+            _scan_networks.invalidate(key)
+        else:
+            _scan_networks.set(key, network)
+        return network
 
     async def find_by_cidr(self, cidr: str) -> Network | None:
         """Find a network by CIDR."""
-        query = """
-            SELECT id, name, network::text, vlan_id, description, location,
-                   gateway::text, dns_servers::text[] as dns_servers, is_active,
-                   created_by, created_at, updated_at
-            FROM ipam.networks
-            WHERE network = $1::cidr
-        """
-        row = await self.conn.fetchrow(query, cidr)
-        return Network(**_row_to_dict(row)) if row else None
+        row = await self.conn.fetchrow(_Q_NETWORK_FIND_BY_CIDR, cidr)
+        return _row_to_model(Network, row) if row else None
 
     async def create(self, data: NetworkCreate, created_by: str | None = None) -> Network:
         """Create a new network."""
-        query = """
-            INSERT INTO ipam.networks (
-                name, network, vlan_id, description, location,
-                gateway, dns_servers, is_active, created_by
-            )
-            VALUES ($1, $2::cidr, $3, $4, $5, $6::inet, $7::inet[], $8, $9)
-            RETURNING id, name, network::text, vlan_id, description, location,
-                      gateway::text, dns_servers::text[] as dns_servers, is_active,
-                      created_by, created_at, updated_at
-        """
         row = await self.conn.fetchrow(
-            query,
+            _Q_NETWORK_CREATE,
             data.name,
             data.network,
             data.vlan_id,
@@ -121,107 +646,61 @@ class NetworkRepository:
             data.gateway,
             data.dns_servers,
             data.is_active,
-            UUID(created_by) if created_by else None,
+            created_by,
         )
         logger.info("network_created", network_id=str(row["id"]), name=data.name)
-        return Network(**_row_to_dict(row))
+        _invalidate_network(row["id"])
+        return _row_to_model(Network, row)
 
-    async def update(self, network_id: str, data: NetworkUpdate) -> Network | None:
+    async def update(self, network_id: EntityId, data: NetworkUpdate) -> Network | None:
         """Update an existing network."""
-        # Build dynamic update query
-        updates = []
-        params: list[Any] = [UUID(network_id)]
-        param_idx = 2
-
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if field == "network":
-                updates.append(f"network = ${param_idx}::cidr")
-            elif field == "gateway":
-                updates.append(f"gateway = ${param_idx}::inet")
-            elif field == "dns_servers":
-                updates.append(f"dns_servers = ${param_idx}::inet[]")
-            else:
-                updates.append(f"{field} = ${param_idx}")
-            params.append(value)
-            param_idx += 1
-
-        if not updates:
+        if not update_data:
             return await self.find_by_id(network_id)
 
-        query = f"""
-            UPDATE ipam.networks
-            SET {', '.join(updates)}, updated_at = NOW()
-            WHERE id = $1
-            RETURNING id, name, network::text, vlan_id, description, location,
-                      gateway::text, dns_servers::text[] as dns_servers, is_active,
-                      created_by, created_at, updated_at
-        """
-        row = await self.conn.fetchrow(query, *params)
+        fields = tuple(sorted(update_data))
+        params = [update_data[field] for field in fields]
+        row = await self.conn.fetchrow(_network_update_sql(fields), network_id, *params)
+        _invalidate_network(network_id)
         if row:
             logger.info("network_updated", network_id=network_id)
-        return Network(**_row_to_dict(row)) if row else None
+        return _row_to_model(Network, row) if row else None
 
-    async def delete(self, network_id: str) -> bool:
+    async def delete(self, network_id: EntityId) -> bool:
         """Delete a network by ID."""
-        query = "DELETE FROM ipam.networks WHERE id = $1"
-        result = await self.conn.execute(query, UUID(network_id))
+        result = await self.conn.execute(_Q_NETWORK_DELETE, network_id)
+        _invalidate_network(network_id)
         deleted = result == "DELETE 1"
         if deleted:
             logger.info("network_deleted", network_id=network_id)
         return deleted
 
-    async def get_stats(self, network_id: str) -> NetworkStats | None:
+    async def find_by_id_with_stats(self, network_id: EntityId) -> NetworkWithStats | None:
+        """Find a network by ID together with its utilization statistics."""
+        row = await self.conn.fetchrow(_Q_NETWORK_WITH_STATS, network_id)
+        if not row:
+            return None
+        data = dict(row)
+        total = _usable_hosts(data["network"])
+        return NetworkWithStats.model_construct(
+            **data,
+            total_addresses=total,
+            utilization_percent=_utilization_percent(data["used_addresses"], total),
+        )
+
+    async def get_stats(self, network_id: EntityId) -> NetworkStats | None:
         """Get statistics for a network."""
-        query = """
-            WITH addr_stats AS (
-                SELECT
-                    network_id,
-                    COUNT(*) as total,
-                    COUNT(*) FILTER (WHERE status = 'active') as active,
-                    COUNT(*) FILTER (WHERE status = 'inactive') as inactive,
-                    COUNT(*) FILTER (WHERE status = 'reserved') as reserved,
-                    COUNT(*) FILTER (WHERE status = 'dhcp') as dhcp,
-                    COUNT(*) FILTER (WHERE status = 'unknown') as unknown
-                FROM ipam.addresses
-                WHERE network_id = $1
-                GROUP BY network_id
-            ),
-            last_scan AS (
-                SELECT started_at
-                FROM ipam.scan_history
-                WHERE network_id = $1 AND status = 'completed'
-                ORDER BY started_at DESC
-                LIMIT 1
-            ),
-            network_size AS (
-                SELECT
-                    (host(broadcast(network)) - host(network(network)))::int - 1 as total_addresses
-                FROM ipam.networks
-                WHERE id = $1
-            )
-            SELECT
-                $1 as network_id,
-                COALESCE(ns.total_addresses, 0) as total_addresses,
-                COALESCE(a.total, 0) as used_addresses,
-                COALESCE(ns.total_addresses, 0) - COALESCE(a.total, 0) as available_addresses,
-                CASE
-                    WHEN ns.total_addresses > 0 THEN
-                        ROUND((COALESCE(a.total, 0)::float / ns.total_addresses * 100)::numeric, 2)
-                    ELSE 0
-                END as utilization_percent,
-                COALESCE(a.active, 0) as active_count,
-                COALESCE(a.inactive, 0) as inactive_count,
-                COALESCE(a.reserved, 0) as reserved_count,
-                COALESCE(a.dhcp, 0) as dhcp_count,
-                COALESCE(a.unknown, 0) as unknown_count,
-                ls.started_at as last_scan
-            FROM network_size ns
-            LEFT JOIN addr_stats a ON true
-            LEFT JOIN last_scan ls ON true
-        """
-        row = await self.conn.fetchrow(query, UUID(network_id))
-        return NetworkStats(**_row_to_dict(row)) if row else None
+        row = await self.conn.fetchrow(_Q_NETWORK_STATS, network_id)
+        return _stats_from_row(row) if row else None
+
+    async def get_stats_bulk(
+        self, network_ids: list[EntityId]
+    ) -> dict[str, NetworkStats]:
+        """Get statistics for many networks in one query, keyed by network id."""
+        if not network_ids:
+            return {}
+        rows = await self.conn.fetch(_Q_NETWORK_STATS_BULK, network_ids)
+        return {row["network_id"]: _stats_from_row(row) for row in rows}
 
 
 class AddressRepository:
@@ -232,93 +711,83 @@ class AddressRepository:
 
     async def find_by_network(
         self,
-        network_id: str,
+        network_id: EntityId,
         page: int = 1,
         limit: int = 50,
         status: IPStatus | None = None,
         search: str | None = None,
-    ) -> tuple[list[IPAddress], int]:
-        """Find all IP addresses in a network with pagination."""
-        where_clauses = ["network_id = $1"]
-        params: list[Any] = [UUID(network_id)]
-        param_idx = 2
+        cursor: str | None = None,
+    ) -> tuple[list[IPAddress], int | None, str | None]:
+        """Find all IP addresses in a network with pagination.
+
+        Returns (addresses, total, next_cursor); see NetworkRepository.find_all
+        for the cursor semantics.
+        """
+        search_mode, search_param = _address_search(search) if search else (None, None)
+        count_sql, query = _address_list_sql(bool(status), search_mode, cursor is not None)
+        params: list[Any] = [network_id]
 
         if status:
-            where_clauses.append(f"status = ${param_idx}")
             params.append(status.value)
-            param_idx += 1
 
-        if search:
-            where_clauses.append(
-                f"(address::text ILIKE ${param_idx} OR hostname ILIKE ${param_idx} OR mac_address::text ILIKE ${param_idx})"
-            )
-            params.append(f"%{search}%")
-            param_idx += 1
-
-        where_sql = f"WHERE {' AND '.join(where_clauses)}"
-
-        # Get total count
-        count_sql = f"SELECT COUNT(*) FROM ipam.addresses {where_sql}"
-        total = await self.conn.fetchval(count_sql, *params)
-
-        # Get paginated results
-        offset = (page - 1) * limit
-        params.extend([limit, offset])
-
-        query = f"""
-            SELECT id, network_id, address::text, mac_address::text, hostname, fqdn,
-                   status, device_type, description, last_seen, discovered_at,
-                   created_at, updated_at
-            FROM ipam.addresses
-            {where_sql}
-            ORDER BY address
-            LIMIT ${param_idx} OFFSET ${param_idx + 1}
-        """
+        if search_param:
+            params.append(search_param)
 
-        rows = await self.conn.fetch(query, *params)
-        addresses = [IPAddress(**_row_to_dict(row)) for row in rows]
+        if cursor is not None:
+            (last_address,) = _decode_cursor(cursor, 1)
+            try:
+                params.append(ip_address(last_address))
+            except ValueError as e:
+                raise ValueError("Invalid pagination cursor") from e
+            rows = await self.conn.fetch(query, *params, limit)
+            total = None
+        else:
+            rows = await self.conn.fetch(query, *params, limit, (page - 1) * limit)
+            total = await _window_total(self.conn, rows, page, count_sql, params)
 
-        return addresses, total
+        addresses = _rows_to_models(IPAddress, rows, status=IPStatus)
 
-    async def find_by_id(self, address_id: str) -> IPAddress | None:
-        """Find an IP address by ID."""
-        query = """
-            SELECT id, network_id, address::text, mac_address::text, hostname, fqdn,
-                   status, device_type, description, last_seen, discovered_at,
-                   created_at, updated_at
-            FROM ipam.addresses
-            WHERE id = $1
+        next_cursor = _encode_cursor(rows[-1]["address"]) if len(rows) == limit else None
+
+        return addresses, total, next_cursor
+
+    async def iter_by_network(
+        self,
+        network_id: EntityId,
+        status: IPStatus | None = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream every address in a network as row dicts, ordered by address.
+
+        Uses a server-side cursor so memory stays flat regardless of network
+        size; the connection is held for the whole iteration, bounded by the
+        export timeouts.
         """
-        row = await self.conn.fetchrow(query, UUID(address_id))
-        return IPAddress(**_row_to_dict(row)) if row else None
+        async with self.conn.transaction():
+            await self.conn.execute(_Q_EXPORT_TIMEOUTS)
+            async for row in self.conn.cursor(
+                _Q_ADDRESS_ITER_BY_NETWORK,
+                network_id,
+                status.value if status else None,
+                prefetch=prefetch,
+            ):
+                yield dict(row)
+
+    async def find_by_id(self, address_id: EntityId) -> IPAddress | None:
+        """Find an IP address by ID."""
+        row = await self.conn.fetchrow(_Q_ADDRESS_FIND_BY_ID, address_id)
+        return _row_to_model(IPAddress, row, status=IPStatus) if row else None
 
-    async def find_by_ip(self, network_id: str, address: str) -> IPAddress | None:
+    async def find_by_ip(self, network_id: EntityId, address: str) -> IPAddress | None:
         """Find an IP address by network and IP."""
-        query = """
-            SELECT id, network_id, address::text, mac_address::text, hostname, fqdn,
-                   status, device_type, description, last_seen, discovered_at,
-                   created_at, updated_at
-            FROM ipam.addresses
-            WHERE network_id = $1 AND address = $2::inet
-        """
-        row = await self.conn.fetchrow(query, UUID(network_id), address)
-        return IPAddress(**_row_to_dict(row)) if row else None
+        row = await self.conn.fetchrow(_Q_ADDRESS_FIND_BY_IP, network_id, address)
+        return _row_to_model(IPAddress, row, status=IPStatus) if row else None
 
     async def create(self, data: IPAddressCreate) -> IPAddress:
         """Create a new IP address record."""
-        query = """
-            INSERT INTO ipam.addresses (
-                network_id, address, mac_address, hostname, fqdn,
-                status, device_type, description, discovered_at
-            )
-            VALUES ($1, $2::inet, $3::macaddr, $4, $5, $6, $7, $8, NOW())
-            RETURNING id, network_id, address::text, mac_address::text, hostname, fqdn,
-                      status, device_type, description, last_seen, discovered_at,
-                      created_at, updated_at
-        """
         row = await self.conn.fetchrow(
-            query,
-            UUID(data.network_id),
+            _Q_ADDRESS_CREATE,
+            data.network_id,
             data.address,
             data.mac_address,
             data.hostname,
@@ -327,31 +796,13 @@ class AddressRepository:
             data.device_type,
             data.description,
         )
-        return IPAddress(**_row_to_dict(row))
+        return _row_to_model(IPAddress, row, status=IPStatus)
 
     async def upsert(self, data: IPAddressCreate) -> IPAddress:
         """Create or update an IP address (for scan results)."""
-        query = """
-            INSERT INTO ipam.addresses (
-                network_id, address, mac_address, hostname, fqdn,
-                status, device_type, description, last_seen, discovered_at
-            )
-            VALUES ($1, $2::inet, $3::macaddr, $4, $5, $6, $7, $8, NOW(),
-                    COALESCE((SELECT discovered_at FROM ipam.addresses WHERE network_id = $1 AND address = $2::inet), NOW()))
-            ON CONFLICT (network_id, address)
-            DO UPDATE SET
-                mac_address = COALESCE(EXCLUDED.mac_address, ipam.addresses.mac_address),
-                hostname = COALESCE(EXCLUDED.hostname, ipam.addresses.hostname),
-                status = EXCLUDED.status,
-                last_seen = NOW(),
-                updated_at = NOW()
-            RETURNING id, network_id, address::text, mac_address::text, hostname, fqdn,
-                      status, device_type, description, last_seen, discovered_at,
-                      created_at, updated_at
-        """
         row = await self.conn.fetchrow(
-            query,
-            UUID(data.network_id),
+            _Q_ADDRESS_UPSERT,
+            data.network_id,
             data.address,
             data.mac_address,
             data.hostname,
@@ -360,62 +811,107 @@ class AddressRepository:
             data.device_type,
             data.description,
         )
-        return IPAddress(**_row_to_dict(row))
+        return _row_to_model(IPAddress, row, status=IPStatus)
 
-    async def update(self, address_id: str, data: IPAddressUpdate) -> IPAddress | None:
-        """Update an existing IP address."""
-        updates = []
-        params: list[Any] = [UUID(address_id)]
-        param_idx = 2
+    async def upsert_many(
+        self,
+        network_id: EntityId,
+        rows: list[IPAddressDiscovered],
+        status: IPStatus = IPStatus.ACTIVE,
+    ) -> int:
+        """Upsert a batch of discovered addresses in one statement.
+
+        Returns the number of addresses that were newly inserted.
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique = {row.address: row for row in rows}
+        if not unique:
+            return 0
+
+        addresses = list(unique)
+        macs = [row.mac_address for row in unique.values()]
+        hostnames = [row.hostname for row in unique.values()]
+
+        inserted = await self.conn.fetchval(
+            _Q_ADDRESS_UPSERT_MANY,
+            network_id,
+            addresses,
+            macs,
+            hostnames,
+            status.value,
+        )
+        return inserted or 0
 
+    async def copy_many(
+        self,
+        network_id: EntityId,
+        rows: list[IPAddressDiscovered],
+        status: IPStatus = IPStatus.ACTIVE,
+    ) -> int:
+        """Upsert a large set of discovered addresses via COPY into a staging table.
+
+        Same semantics and return value as upsert_many(); cheaper once a sweep
+        yields a few hundred rows.
+        """
+        unique = {row.address: row for row in rows}
+        if not unique:
+            return 0
+
+        records = [(row.address, row.mac_address, row.hostname) for row in unique.values()]
+
+        async with self.conn.transaction():
+            await self.conn.execute(_Q_ADDRESS_STAGE_CREATE)
+            await self.conn.copy_records_to_table(
+                "_addr_stage", records=records, columns=_ADDRESS_STAGE_COLUMNS
+            )
+            inserted = await self.conn.fetchval(
+                _Q_ADDRESS_MERGE_STAGE, network_id, status.value
+            )
+        return inserted or 0
+
+    async def update(self, address_id: EntityId, data: IPAddressUpdate) -> IPAddress | None:
+        """Update an existing IP address."""
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if field == "mac_address":
-                updates.append(f"mac_address = ${param_idx}::macaddr")
-            elif field == "status":
-                updates.append(f"status = ${param_idx}")
-                value = value.value if hasattr(value, "value") else value
-            else:
-                updates.append(f"{field} = ${param_idx}")
-            params.append(value)
-            param_idx += 1
-
-        if not updates:
+        if not update_data:
             return await self.find_by_id(address_id)
 
-        query = f"""
-            UPDATE ipam.addresses
-            SET {', '.join(updates)}, updated_at = NOW()
-            WHERE id = $1
-            RETURNING id, network_id, address::text, mac_address::text, hostname, fqdn,
-                      status, device_type, description, last_seen, discovered_at,
-                      created_at, updated_at
-        """
-        row = await self.conn.fetchrow(query, *params)
-        return IPAddress(**_row_to_dict(row)) if row else None
+        status = update_data.get("status")
+        if status is not None and hasattr(status, "value"):
+            update_data["status"] = status.value
+
+        fields = tuple(sorted(update_data))
+        params = [update_data[field] for field in fields]
+        row = await self.conn.fetchrow(_address_update_sql(fields), address_id, *params)
+        return _row_to_model(IPAddress, row, status=IPStatus) if row else None
 
-    async def delete(self, address_id: str) -> bool:
+    async def delete(self, address_id: EntityId) -> bool:
         """Delete an IP address by ID."""
-        query = "DELETE FROM ipam.addresses WHERE id = $1"
-        result = await self.conn.execute(query, UUID(address_id))
+        result = await self.conn.execute(_Q_ADDRESS_DELETE, address_id)
         return result == "DELETE 1"
 
-    async def mark_inactive(self, network_id: str, active_ips: set[str]) -> int:
+    async def mark_inactive(self, network_id: EntityId, active_ips: set[str]) -> int:
         """Mark addresses not in the active set as inactive."""
         if not active_ips:
             return 0
 
-        query = """
-            UPDATE ipam.addresses
-            SET status = 'inactive', updated_at = NOW()
-            WHERE network_id = $1
-              AND address::text != ALL($2)
-              AND status = 'active'
-        """
-        result = await self.conn.execute(query, UUID(network_id), list(active_ips))
+        result = await self.conn.execute(
+            _Q_ADDRESS_MARK_INACTIVE, network_id, list(active_ips)
+        )
         # Parse "UPDATE N" to get count
         return int(result.split()[1]) if result.startswith("UPDATE") else 0
 
+    async def mark_inactive_offsets(
+        self, network_id: EntityId, base_address: str, offsets: list[int]
+    ) -> int:
+        """Mark addresses not at base_address + offset as inactive."""
+        if not offsets:
+            return 0
+
+        result = await self.conn.execute(
+            _Q_ADDRESS_MARK_INACTIVE_OFFSETS, network_id, base_address, offsets
+        )
+        return int(result.split()[1]) if result.startswith("UPDATE") else 0
+
 
 class ScanRepository:
     """Repository for scan job operations."""
@@ -425,88 +921,43 @@ class ScanRepository:
 
     async def create(self, data: ScanJobCreate) -> ScanJob:
         """Create a new scan job."""
-        query = """
-            INSERT INTO ipam.scan_history (network_id, scan_type, started_at, status)
-            VALUES ($1, $2, NOW(), 'pending')
-            RETURNING id, network_id, scan_type, status, started_at, completed_at,
-                      total_ips, active_ips, new_ips, error_message
-        """
         row = await self.conn.fetchrow(
-            query, UUID(data.network_id), data.scan_type.value
+            _Q_SCAN_CREATE, data.network_id, data.scan_type.value
         )
         logger.info("scan_job_created", scan_id=str(row["id"]), network_id=data.network_id)
-        return ScanJob(**_row_to_dict(row))
+        return _row_to_model(ScanJob, row, scan_type=ScanType, status=ScanStatus)
 
-    async def find_by_id(self, scan_id: str) -> ScanJob | None:
+    async def find_by_id(self, scan_id: EntityId) -> ScanJob | None:
         """Find a scan job by ID."""
-        query = """
-            SELECT id, network_id, scan_type, status, started_at, completed_at,
-                   total_ips, active_ips, new_ips, error_message
-            FROM ipam.scan_history
-            WHERE id = $1
-        """
-        row = await self.conn.fetchrow(query, UUID(scan_id))
-        return ScanJob(**_row_to_dict(row)) if row else None
+        row = await self.conn.fetchrow(_Q_SCAN_FIND_BY_ID, scan_id)
+        return _row_to_model(ScanJob, row, scan_type=ScanType, status=ScanStatus) if row else None
 
     async def find_by_network(
-        self, network_id: str, limit: int = 10
+        self, network_id: EntityId, limit: int = 10
     ) -> list[ScanJob]:
         """Find recent scan jobs for a network."""
-        query = """
-            SELECT id, network_id, scan_type, status, started_at, completed_at,
-                   total_ips, active_ips, new_ips, error_message
-            FROM ipam.scan_history
-            WHERE network_id = $1
-            ORDER BY started_at DESC
-            LIMIT $2
-        """
-        rows = await self.conn.fetch(query, UUID(network_id), limit)
-        return [ScanJob(**_row_to_dict(row)) for row in rows]
+        rows = await self.conn.fetch(_Q_SCAN_FIND_BY_NETWORK, network_id, limit)
+        return _rows_to_models(ScanJob, rows, scan_type=ScanType, status=ScanStatus)
 
     async def update_status(
         self,
-        scan_id: str,
+        scan_id: EntityId,
         status: ScanStatus,
         total_ips: int | None = None,
         active_ips: int | None = None,
         new_ips: int | None = None,
         error_message: str | None = None,
     ) -> ScanJob | None:
-        """Update scan job status and results."""
-        updates = ["status = $2"]
-        params: list[Any] = [UUID(scan_id), status.value]
-        param_idx = 3
-
-        if status in (ScanStatus.COMPLETED, ScanStatus.FAILED):
-            updates.append("completed_at = NOW()")
-
-        if total_ips is not None:
-            updates.append(f"total_ips = ${param_idx}")
-            params.append(total_ips)
-            param_idx += 1
-
-        if active_ips is not None:
-            updates.append(f"active_ips = ${param_idx}")
-            params.append(active_ips)
-            param_idx += 1
-
-        if new_ips is not None:
-            updates.append(f"new_ips = ${param_idx}")
-            params.append(new_ips)
-            param_idx += 1
-
-        if error_message is not None:
-            updates.append(f"error_message = ${param_idx}")
-            params.append(error_message)
-
-        query = f"""
-            UPDATE ipam.scan_history
-            SET {', '.join(updates)}
-            WHERE id = $1
-            RETURNING id, network_id, scan_type, status, started_at, completed_at,
-                      total_ips, active_ips, new_ips, error_message
-        """
-        row = await self.conn.fetchrow(query, *params)
+        """Update scan job status and results; None counters are left unchanged."""
+        row = await self.conn.fetchrow(
+            _Q_SCAN_UPDATE_STATUS,
+            scan_id,
+            status.value,
+            total_ips,
+            active_ips,
+            new_ips,
+            error_message,
+        )
         if row:
             logger.info("scan_status_updated", scan_id=scan_id, status=status.value)
-        return ScanJob(**_row_to_dict(row)) if row else None
+        return _row_to_model(ScanJob, row, scan_type=ScanType, status=ScanStatus) if row else None
@@ -5,6 +5,7 @@ from .network import (
     NetworkCreate,
     NetworkUpdate,
     NetworkWithStats,
+    host_count,
 )
 from .address import (
     IPAddress,
@@ -31,6 +32,7 @@ __all__ = [
     "NetworkCreate",
     "NetworkUpdate",
     "NetworkWithStats",
+    "host_count",
     "IPAddress",
     "IPAddressCreate",
     "IPAddressUpdate",
@@ -1,10 +1,26 @@
 """IP Address models."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, field_validator
+
+_HEX = frozenset("0123456789abcdefABCDEF")
+_MAC_SEPARATOR_POSITIONS = (2, 5, 8, 11, 14)
+
+
+def _check_mac(v: str | None) -> str | None:
+    """Validate a MAC as six hex octets separated by ':' or '-'."""
+    if v is None:
+        return None
+    if (
+        len(v) != 17
+        or any(v[i] not in ":-" for i in _MAC_SEPARATOR_POSITIONS)
+        or not _HEX.issuperset(v[0:2] + v[3:5] + v[6:8] + v[9:11] + v[12:14] + v[15:17])
+    ):
+        raise ValueError(f"Invalid MAC address: {v}")
+    return v
 
 
 class IPStatus(str, Enum):
@@ -23,11 +39,17 @@ class IPAddressBase(BaseModel):
     address: str
     hostname: str | None = None
     fqdn: str | None = None
-    mac_address: Annotated[str | None, Field(pattern=r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")] = None
+    mac_address: str | None = None
     status: IPStatus = IPStatus.UNKNOWN
     device_type: str | None = None
     description: str | None = None
 
+
+class IPAddressCreate(IPAddressBase):
+    """IP address creation schema."""
+
+    network_id: str
+
     @field_validator("address")
     @classmethod
     def validate_ip(cls, v: str) -> str:
@@ -39,11 +61,11 @@ class IPAddressBase(BaseModel):
         except Exception as e:
             raise ValueError(f"Invalid IP address: {e}") from e
 
-
-class IPAddressCreate(IPAddressBase):
-    """IP address creation schema."""
-
-    network_id: str
+    @field_validator("mac_address")
+    @classmethod
+    def validate_mac(cls, v: str | None) -> str | None:
+        """Validate MAC address format."""
+        return _check_mac(v)
 
 
 class IPAddressUpdate(BaseModel):
@@ -51,14 +73,24 @@ class IPAddressUpdate(BaseModel):
 
     hostname: str | None = None
     fqdn: str | None = None
-    mac_address: Annotated[str | None, Field(pattern=r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")] = None
+    mac_address: str | None = None
     status: IPStatus | None = None
     device_type: str | None = None
     description: str | None = None
 
+    @field_validator("mac_address")
+    @classmethod
+    def validate_mac(cls, v: str | None) -> str | None:
+        """Validate MAC address format."""
+        return _check_mac(v)
+
 
 class IPAddress(IPAddressBase):
-    """Complete IP address entity from database."""
+    """Complete IP address entity from database.
+
+    Rows are materialized without the ``address``/``mac_address`` checks;
+    Postgres ``inet``/``macaddr`` already guarantee valid values.
+    """
 
     id: str
     network_id: str
@@ -78,8 +110,13 @@ class IPAddressBulkCreate(BaseModel):
     addresses: list[IPAddressCreate]
 
 
-class IPAddressDiscovered(BaseModel):
-    """IP address discovered during a scan."""
+@dataclass(slots=True, frozen=True)
+class IPAddressDiscovered:
+    """IP address discovered during a scan.
+
+    Built once per probed host from trusted scanner output, so this is a
+    plain dataclass rather than a validated model.
+    """
 
     address: str
     mac_address: str | None = None
@@ -9,12 +9,17 @@ T = TypeVar("T")
 
 
 class Pagination(BaseModel):
-    """Pagination metadata."""
+    """Pagination metadata.
+
+    ``total``/``pages`` are None for cursor-paged requests, which skip the
+    count; follow ``next_cursor`` until it is None instead.
+    """
 
     page: int = Field(ge=1)
     limit: int = Field(ge=1, le=100)
-    total: int = Field(ge=0)
-    pages: int = Field(ge=0)
+    total: int | None = Field(default=None, ge=0)
+    pages: int | None = Field(default=None, ge=0)
+    next_cursor: str | None = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
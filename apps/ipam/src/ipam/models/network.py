@@ -1,10 +1,50 @@
 """Network/Subnet models."""
 
+import ipaddress
+import re
+import socket
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import BaseModel, Field, field_validator
-from netaddr import IPNetwork
+
+
+# Networks, gateways and DNS servers repeat heavily across requests and rows,
+# so parse each distinct string once. Invalid input raises and isn't cached.
+@lru_cache(maxsize=4096)
+def _norm_cidr(v: str) -> str:
+    """Normalize a CIDR to its network address."""
+    return str(ipaddress.ip_network(v, strict=False))
+
+
+def host_count(net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> int:
+    """Number of addresses ``net.hosts()`` yields, without iterating it.
+
+    IPv4 drops the network and broadcast addresses and IPv6 drops the
+    Subnet-Router anycast address, except on point-to-point (/31, /127) and
+    single-host networks, where every address is usable.
+    """
+    if net.prefixlen >= net.max_prefixlen - 1:
+        return net.num_addresses
+    return net.num_addresses - (2 if net.version == 4 else 1)
+
+
+# Dotted quad without leading zeros (which ipaddress rejects); inet_aton then
+# range-checks each octet
+_IPV4_RE = re.compile(r"^(?:0|[1-9]\d{0,2})(?:\.(?:0|[1-9]\d{0,2})){3}$")
+
+
+@lru_cache(maxsize=4096)
+def _check_ip(v: str) -> None:
+    """Raise ValueError unless v is a valid IPv4/IPv6 address."""
+    try:
+        if _IPV4_RE.match(v):
+            socket.inet_aton(v)
+        else:
+            socket.inet_pton(socket.AF_INET6, v)
+    except OSError:
+        raise ValueError(f"{v!r} does not appear to be an IPv4 or IPv6 address") from None
 
 
 class NetworkBase(BaseModel):
@@ -24,10 +64,8 @@ class NetworkBase(BaseModel):
     def validate_cidr(cls, v: str) -> str:
         """Validate CIDR notation."""
         try:
-            net = IPNetwork(v)
-            # Normalize to network address
-            return str(net.cidr)
-        except Exception as e:
+            return _norm_cidr(v)
+        except ValueError as e:
             raise ValueError(f"Invalid CIDR notation: {e}") from e
 
     @field_validator("gateway")
@@ -37,10 +75,9 @@ class NetworkBase(BaseModel):
         if v is None:
             return None
         try:
-            from netaddr import IPAddress
-            IPAddress(v)
+            _check_ip(v)
             return v
-        except Exception as e:
+        except ValueError as e:
             raise ValueError(f"Invalid IP address: {e}") from e
 
     @field_validator("dns_servers")
@@ -49,11 +86,10 @@ class NetworkBase(BaseModel):
         """Validate DNS server IP addresses."""
         if v is None:
             return None
-        from netaddr import IPAddress
         for ip in v:
             try:
-                IPAddress(ip)
-            except Exception as e:
+                _check_ip(ip)
+            except ValueError as e:
                 raise ValueError(f"Invalid DNS server IP '{ip}': {e}") from e
         return v
 
@@ -83,9 +119,8 @@ class NetworkUpdate(BaseModel):
         if v is None:
             return None
         try:
-            net = IPNetwork(v)
-            return str(net.cidr)
-        except Exception as e:
+            return _norm_cidr(v)
+        except ValueError as e:
             raise ValueError(f"Invalid CIDR notation: {e}") from e
 
 
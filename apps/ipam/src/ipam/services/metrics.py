@@ -1,6 +1,8 @@
 """Metrics service for VictoriaMetrics integration."""
 
+import asyncio
 import httpx
+import orjson
 from datetime import datetime, timezone
 from typing import Any
 
@@ -10,6 +12,20 @@ from ..db import get_db, NetworkRepository
 
 logger = get_logger(__name__)
 
+# Concurrent VictoriaMetrics import requests during a full refresh
+PUSH_CONCURRENCY = 32
+
+# Prometheus text lines per import request
+IMPORT_CHUNK_LINES = 10_000
+
+# Enough pooled keep-alive connections for a full PUSH_CONCURRENCY fan-out,
+# so bulk refreshes reuse sockets instead of reconnecting per POST
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=PUSH_CONCURRENCY,
+    max_connections=PUSH_CONCURRENCY * 2,
+    keepalive_expiry=60.0,
+)
+
 
 def escape_label_value(value: str) -> str:
     """Escape a Prometheus label value.
@@ -32,12 +48,46 @@ class MetricsService:
 
     def __init__(self) -> None:
         self.base_url = settings.victoria_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, limits=HTTP_LIMITS)
 
     async def close(self) -> None:
         """Close the HTTP client."""
         await self.client.aclose()
 
+    @staticmethod
+    def _format_network_lines(
+        network_id: str,
+        network_name: str,
+        total_addresses: int,
+        used_addresses: int,
+        active_addresses: int,
+        timestamp: int,
+    ) -> list[str]:
+        """Format network utilization samples as Prometheus text lines."""
+        utilization = (used_addresses / total_addresses * 100) if total_addresses > 0 else 0
+
+        # Escape label values once to prevent metric format corruption
+        labels = (
+            f'{{network_id="{escape_label_value(network_id)}",'
+            f'network_name="{escape_label_value(network_name)}"}}'
+        )
+
+        return [
+            f"ipam_network_total_addresses{labels} {total_addresses} {timestamp}",
+            f"ipam_network_used_addresses{labels} {used_addresses} {timestamp}",
+            f"ipam_network_active_addresses{labels} {active_addresses} {timestamp}",
+            f"ipam_network_utilization_percent{labels} {utilization:.2f} {timestamp}",
+        ]
+
+    async def _import_lines(self, lines: list[str]) -> None:
+        """POST Prometheus text lines to VictoriaMetrics; raises httpx.HTTPError."""
+        response = await self.client.post(
+            f"{self.base_url}/api/v1/import/prometheus",
+            content="\n".join(lines),
+            headers={"Content-Type": "text/plain"},
+        )
+        response.raise_for_status()
+
     async def push_network_utilization(
         self,
         network_id: str,
@@ -48,26 +98,12 @@ class MetricsService:
     ) -> None:
         """Push network utilization metrics to VictoriaMetrics."""
         timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
-        utilization = (used_addresses / total_addresses * 100) if total_addresses > 0 else 0
-
-        # Escape label values to prevent metric format corruption
-        safe_network_id = escape_label_value(network_id)
-        safe_network_name = escape_label_value(network_name)
-
-        metrics = [
-            f'ipam_network_total_addresses{{network_id="{safe_network_id}",network_name="{safe_network_name}"}} {total_addresses} {timestamp}',
-            f'ipam_network_used_addresses{{network_id="{safe_network_id}",network_name="{safe_network_name}"}} {used_addresses} {timestamp}',
-            f'ipam_network_active_addresses{{network_id="{safe_network_id}",network_name="{safe_network_name}"}} {active_addresses} {timestamp}',
-            f'ipam_network_utilization_percent{{network_id="{safe_network_id}",network_name="{safe_network_name}"}} {utilization:.2f} {timestamp}',
-        ]
+        metrics = self._format_network_lines(
+            network_id, network_name, total_addresses, used_addresses, active_addresses, timestamp
+        )
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/api/v1/import/prometheus",
-                content="\n".join(metrics),
-                headers={"Content-Type": "text/plain"},
-            )
-            response.raise_for_status()
+            await self._import_lines(metrics)
             logger.debug("metrics_pushed", network_id=network_id, metrics_count=len(metrics))
         except httpx.HTTPError as e:
             logger.warning("metrics_push_failed", network_id=network_id, error=str(e))
@@ -85,25 +121,22 @@ class MetricsService:
         """Push scan result metrics to VictoriaMetrics."""
         timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
 
-        # Escape label values to prevent metric format corruption
-        safe_network_id = escape_label_value(network_id)
-        safe_network_name = escape_label_value(network_name)
-        safe_scan_type = escape_label_value(scan_type)
+        # Escape label values once to prevent metric format corruption
+        labels = (
+            f'{{network_id="{escape_label_value(network_id)}",'
+            f'network_name="{escape_label_value(network_name)}",'
+            f'scan_type="{escape_label_value(scan_type)}"}}'
+        )
 
         metrics = [
-            f'ipam_scan_duration_seconds{{network_id="{safe_network_id}",network_name="{safe_network_name}",scan_type="{safe_scan_type}"}} {duration_seconds:.2f} {timestamp}',
-            f'ipam_scan_total_ips{{network_id="{safe_network_id}",network_name="{safe_network_name}",scan_type="{safe_scan_type}"}} {total_ips} {timestamp}',
-            f'ipam_scan_active_ips{{network_id="{safe_network_id}",network_name="{safe_network_name}",scan_type="{safe_scan_type}"}} {active_ips} {timestamp}',
-            f'ipam_scan_new_ips{{network_id="{safe_network_id}",network_name="{safe_network_name}",scan_type="{safe_scan_type}"}} {new_ips} {timestamp}',
+            f"ipam_scan_duration_seconds{labels} {duration_seconds:.2f} {timestamp}",
+            f"ipam_scan_total_ips{labels} {total_ips} {timestamp}",
+            f"ipam_scan_active_ips{labels} {active_ips} {timestamp}",
+            f"ipam_scan_new_ips{labels} {new_ips} {timestamp}",
         ]
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/api/v1/import/prometheus",
-                content="\n".join(metrics),
-                headers={"Content-Type": "text/plain"},
-            )
-            response.raise_for_status()
+            await self._import_lines(metrics)
         except httpx.HTTPError as e:
             logger.warning("scan_metrics_push_failed", network_id=network_id, error=str(e))
 
@@ -129,16 +162,16 @@ class MetricsService:
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("status") == "success" and data.get("data", {}).get("result"):
                 result = data["data"]["result"][0]
                 return [
-                    {"timestamp": int(point[0]), "value": float(point[1])}
-                    for point in result.get("values", [])
+                    {"timestamp": int(ts), "value": float(value)}
+                    for ts, value in result.get("values", [])
                 ]
             return []
-        except httpx.HTTPError as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.warning("metrics_query_failed", network_id=network_id, error=str(e))
             return []
 
@@ -146,14 +179,16 @@ class MetricsService:
         """Get aggregated metrics for the IPAM dashboard."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
-            networks, total = await repo.find_all(limit=1000)
+            networks, total, _ = await repo.find_all(limit=1000)
+
+            stats_map = await repo.get_stats_bulk([n.id for n in networks])
 
             total_addresses = 0
             total_used = 0
             total_active = 0
 
             for network in networks:
-                stats = await repo.get_stats(network.id)
+                stats = stats_map.get(network.id)
                 if stats:
                     total_addresses += stats.total_addresses
                     total_used += stats.used_addresses
@@ -175,20 +210,44 @@ class MetricsService:
         """Refresh metrics for all networks (called periodically)."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
-            networks, _ = await repo.find_all(limit=1000)
-            count = 0
+            networks, _, _ = await repo.find_all(limit=1000)
+            stats_map = await repo.get_stats_bulk([n.id for n in networks])
 
-            for network in networks:
-                stats = await repo.get_stats(network.id)
-                if stats:
-                    await self.push_network_utilization(
-                        network_id=network.id,
-                        network_name=network.name,
-                        total_addresses=stats.total_addresses,
-                        used_addresses=stats.used_addresses,
-                        active_addresses=stats.active_count,
+        # One import request carries every network's samples (chunked to bound
+        # request size) instead of one POST per network
+        timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
+        lines: list[str] = []
+        count = 0
+        for network in networks:
+            stats = stats_map.get(network.id)
+            if stats:
+                lines.extend(
+                    self._format_network_lines(
+                        network.id,
+                        network.name,
+                        stats.total_addresses,
+                        stats.used_addresses,
+                        stats.active_count,
+                        timestamp,
                     )
-                    count += 1
+                )
+                count += 1
+
+        sem = asyncio.Semaphore(PUSH_CONCURRENCY)
+
+        async def push(chunk: list[str]) -> None:
+            async with sem:
+                try:
+                    await self._import_lines(chunk)
+                except httpx.HTTPError as e:
+                    logger.warning("metrics_push_failed", lines=len(chunk), error=str(e))
+
+        await asyncio.gather(
+            *(
+                push(lines[i:i + IMPORT_CHUNK_LINES])
+                for i in range(0, len(lines), IMPORT_CHUNK_LINES)
+            )
+        )
 
-            logger.info("metrics_refreshed", networks_count=count)
-            return count
+        logger.info("metrics_refreshed", networks_count=count)
+        return count
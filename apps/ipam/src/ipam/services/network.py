@@ -1,5 +1,10 @@
 """Network management service."""
 
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+import orjson
+
 from ..db import get_db, NetworkRepository, AddressRepository
 from ..models.network import Network, NetworkCreate, NetworkUpdate, NetworkWithStats
 from ..models.address import IPAddress, IPAddressCreate, IPAddressUpdate, IPStatus
@@ -8,6 +13,21 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Address rows per cursor FETCH and per streamed response chunk
+EXPORT_BATCH_ROWS = 1000
+
+
+def _pagination(
+    page: int, limit: int, total: int | None, next_cursor: str | None
+) -> Pagination:
+    """Build pagination metadata; total/pages are omitted for cursor pages."""
+    pages = None
+    if total is not None:
+        pages = (total + limit - 1) // limit if total > 0 else 0
+    return Pagination(
+        page=page, limit=limit, total=total, pages=pages, next_cursor=next_cursor
+    )
+
 
 class NetworkService:
     """Service for network management operations."""
@@ -18,43 +38,31 @@ class NetworkService:
         limit: int = 20,
         search: str | None = None,
         is_active: bool | None = None,
+        cursor: str | None = None,
     ) -> PaginatedResponse[Network]:
         """List all networks with pagination and filters."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
-            networks, total = await repo.find_all(
-                page=page, limit=limit, search=search, is_active=is_active
+            networks, total, next_cursor = await repo.find_all(
+                page=page, limit=limit, search=search, is_active=is_active, cursor=cursor
             )
 
-            pages = (total + limit - 1) // limit if total > 0 else 0
-
             return PaginatedResponse(
                 data=networks,
-                pagination=Pagination(page=page, limit=limit, total=total, pages=pages),
+                pagination=_pagination(page, limit, total, next_cursor),
             )
 
-    async def get_network(self, network_id: str) -> Network | None:
+    async def get_network(self, network_id: UUID) -> Network | None:
         """Get a network by ID."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
             return await repo.find_by_id(network_id)
 
-    async def get_network_with_stats(self, network_id: str) -> NetworkWithStats | None:
+    async def get_network_with_stats(self, network_id: UUID) -> NetworkWithStats | None:
         """Get a network with utilization statistics."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
-            network = await repo.find_by_id(network_id)
-            if not network:
-                return None
-
-            stats = await repo.get_stats(network_id)
-            return NetworkWithStats(
-                **network.model_dump(),
-                total_addresses=stats.total_addresses if stats else 0,
-                used_addresses=stats.used_addresses if stats else 0,
-                utilization_percent=stats.utilization_percent if stats else 0.0,
-                last_scan=stats.last_scan if stats else None,
-            )
+            return await repo.find_by_id_with_stats(network_id)
 
     async def create_network(
         self, data: NetworkCreate, created_by: str | None = None
@@ -71,7 +79,7 @@ class NetworkService:
             return await repo.create(data, created_by)
 
     async def update_network(
-        self, network_id: str, data: NetworkUpdate
+        self, network_id: UUID, data: NetworkUpdate
     ) -> Network | None:
         """Update an existing network."""
         async with get_db() as conn:
@@ -82,6 +90,10 @@ class NetworkService:
             if not existing:
                 return None
 
+            # Nothing to change: the row we just read is the result
+            if not data.model_fields_set:
+                return existing
+
             # Check for duplicate CIDR if changing
             if data.network and data.network != existing.network:
                 duplicate = await repo.find_by_cidr(data.network)
@@ -90,13 +102,13 @@ class NetworkService:
 
             return await repo.update(network_id, data)
 
-    async def delete_network(self, network_id: str) -> bool:
+    async def delete_network(self, network_id: UUID) -> bool:
         """Delete a network and all associated addresses."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
             return await repo.delete(network_id)
 
-    async def get_network_stats(self, network_id: str) -> NetworkStats | None:
+    async def get_network_stats(self, network_id: UUID) -> NetworkStats | None:
         """Get detailed statistics for a network."""
         async with get_db() as conn:
             repo = NetworkRepository(conn)
@@ -104,31 +116,48 @@ class NetworkService:
 
     async def list_addresses(
         self,
-        network_id: str,
+        network_id: UUID,
         page: int = 1,
         limit: int = 50,
         status: IPStatus | None = None,
         search: str | None = None,
+        cursor: str | None = None,
     ) -> PaginatedResponse[IPAddress]:
         """List IP addresses in a network."""
         async with get_db() as conn:
             repo = AddressRepository(conn)
-            addresses, total = await repo.find_by_network(
+            addresses, total, next_cursor = await repo.find_by_network(
                 network_id=network_id,
                 page=page,
                 limit=limit,
                 status=status,
                 search=search,
+                cursor=cursor,
             )
 
-            pages = (total + limit - 1) // limit if total > 0 else 0
-
             return PaginatedResponse(
                 data=addresses,
-                pagination=Pagination(page=page, limit=limit, total=total, pages=pages),
+                pagination=_pagination(page, limit, total, next_cursor),
             )
 
-    async def get_address(self, address_id: str) -> IPAddress | None:
+    async def export_addresses(
+        self, network_id: UUID, status: IPStatus | None = None
+    ) -> AsyncIterator[bytes]:
+        """Yield every address in a network as NDJSON, EXPORT_BATCH_ROWS lines per chunk."""
+        lines: list[bytes] = []
+        async with get_db() as conn:
+            repo = AddressRepository(conn)
+            async for row in repo.iter_by_network(
+                network_id, status=status, prefetch=EXPORT_BATCH_ROWS
+            ):
+                lines.append(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+                if len(lines) >= EXPORT_BATCH_ROWS:
+                    yield b"".join(lines)
+                    lines = []
+        if lines:
+            yield b"".join(lines)
+
+    async def get_address(self, address_id: UUID) -> IPAddress | None:
         """Get an IP address by ID."""
         async with get_db() as conn:
             repo = AddressRepository(conn)
@@ -141,14 +170,14 @@ class NetworkService:
             return await repo.create(data)
 
     async def update_address(
-        self, address_id: str, data: IPAddressUpdate
+        self, address_id: UUID, data: IPAddressUpdate
     ) -> IPAddress | None:
         """Update an existing IP address."""
         async with get_db() as conn:
             repo = AddressRepository(conn)
             return await repo.update(address_id, data)
 
-    async def delete_address(self, address_id: str) -> bool:
+    async def delete_address(self, address_id: UUID) -> bool:
         """Delete an IP address."""
         async with get_db() as conn:
             repo = AddressRepository(conn)
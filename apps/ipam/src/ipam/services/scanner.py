@@ -1,18 +1,21 @@
 """Network scanning service with ICMP ping and NMAP support."""
 
 import asyncio
+import ipaddress
 import socket
 import subprocess
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime, timezone
-from typing import AsyncIterator
+from functools import lru_cache
 import shutil
 
-from netaddr import IPNetwork
+import aiodns
+from shared_python import TTLCache
 
-from ..db import get_db, NetworkRepository, AddressRepository, ScanRepository
-from ..models.network import Network
-from ..models.address import IPAddressCreate, IPStatus, IPAddressDiscovered
+from ..db import get_db, EntityId, NetworkRepository, AddressRepository, ScanRepository
+from ..models.network import Network, host_count
+from ..models.address import IPAddressDiscovered
 from ..models.scan import ScanJob, ScanJobCreate, ScanType, ScanStatus, ScanProgress, ScanResult
 from ..core.config import settings
 from ..core.logging import get_logger
@@ -23,6 +26,87 @@ logger = get_logger(__name__)
 # Check for nmap availability
 NMAP_AVAILABLE = shutil.which("nmap") is not None
 
+# Live hosts buffered before each write during a built-in sweep
+UPSERT_BATCH_SIZE = 500
+
+# Above this many rows, discovered hosts are loaded with COPY instead of UNNEST
+COPY_THRESHOLD = 256
+
+# c-ares resolver for PTR lookups; created on first use so it binds to the
+# running event loop rather than whichever loop exists at import time
+_resolver: aiodns.DNSResolver | None = None
+
+# PTR answers per IP; misses are stored as "" so hosts without a reverse
+# record are not re-queried on every rescan
+_hostnames = TTLCache(maxsize=16384, ttl=3600.0)
+
+
+@lru_cache(maxsize=256)
+def _parse_net(cidr: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+    """Parse a CIDR once per distinct value."""
+    return ipaddress.ip_network(cidr, strict=False)
+
+
+# Networks up to this size track responders as a bitmap (2 MiB at most);
+# larger ones, in practice IPv6, keep a set of address strings instead
+BITMAP_MAX_ADDRESSES = 1 << 24
+
+
+class _ActiveHosts:
+    """Addresses that answered during a scan."""
+
+    def __init__(self, net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> None:
+        self._net = net
+        self._base = int(net.network_address)
+        self._bits: bytearray | None = None
+        self._sparse: set[str] = set()
+        self._count = 0
+        if net.num_addresses <= BITMAP_MAX_ADDRESSES:
+            self._bits = bytearray((net.num_addresses + 7) // 8)
+
+    def add(self, ip: str) -> None:
+        """Record a responding address."""
+        if self._bits is None:
+            self._sparse.add(ip)
+            return
+        n = int(ipaddress.ip_address(ip)) - self._base
+        mask = 1 << (n & 7)
+        if not self._bits[n >> 3] & mask:
+            self._bits[n >> 3] |= mask
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count if self._bits is not None else len(self._sparse)
+
+    def _offsets(self) -> list[int]:
+        """Host offsets of every set bit, ascending."""
+        offsets: list[int] = []
+        for i, byte in enumerate(self._bits or b""):
+            while byte:
+                low = byte & -byte
+                offsets.append((i << 3) + low.bit_length() - 1)
+                byte ^= low
+        return offsets
+
+    async def mark_others_inactive(self, address_repo: AddressRepository, network_id: str) -> int:
+        """Mark the network's active addresses that did not answer as inactive."""
+        if self._bits is None:
+            return await address_repo.mark_inactive(network_id, self._sparse)
+        return await address_repo.mark_inactive_offsets(
+            network_id, str(self._net.network_address), self._offsets()
+        )
+
+
+async def _store_discovered(
+    address_repo: AddressRepository,
+    network_id: str,
+    rows: list[IPAddressDiscovered],
+) -> int:
+    """Upsert discovered hosts, returning how many were new."""
+    if len(rows) > COPY_THRESHOLD:
+        return await address_repo.copy_many(network_id, rows)
+    return await address_repo.upsert_many(network_id, rows)
+
 
 async def icmp_ping(ip: str, count: int = 2, timeout: float = 2.0) -> tuple[str, bool, float | None]:
     """
@@ -85,40 +169,52 @@ async def tcp_ping(ip: str, ports: list[int] | None = None, timeout: float = 1.0
     """
     ports = ports or [22, 80, 443, 3389, 445, 23, 21, 25, 53, 8080]
     open_ports = []
+    loop = asyncio.get_running_loop()
+    family = socket.AF_INET6 if ":" in ip else socket.AF_INET
 
     for port in ports:
+        # Bare non-blocking connect: no stream reader/writer or protocol
+        # objects are built for a socket that is closed straight away
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
         try:
-            start = asyncio.get_event_loop().time()
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, port),
-                timeout=timeout,
-            )
-            writer.close()
-            await writer.wait_closed()
+            start = loop.time()
+            await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout=timeout)
 
-            elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            elapsed = (loop.time() - start) * 1000
             open_ports.append(port)
 
             if len(open_ports) == 1:
                 # Return after first successful connection with latency
                 return ip, True, elapsed, open_ports
 
-        except (asyncio.TimeoutError, OSError, ConnectionRefusedError):
+        except ConnectionRefusedError:
+            # A RST means the host is up with this port closed; no need to
+            # try the remaining ports
+            return ip, True, (loop.time() - start) * 1000, open_ports
+        except (asyncio.TimeoutError, OSError):
             continue
+        finally:
+            sock.close()
 
     return ip, len(open_ports) > 0, None, open_ports
 
 
 async def resolve_hostname(ip: str) -> str | None:
     """Resolve IP address to hostname via reverse DNS."""
+    global _resolver
+    cached = _hostnames.get(ip)
+    if cached is not None:
+        return cached or None
+    if _resolver is None:
+        _resolver = aiodns.DNSResolver(timeout=1.0, tries=1)
     try:
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, socket.gethostbyaddr, ip
-        )
-        return result[0] if result else None
-    except (socket.herror, socket.gaierror, OSError):
-        return None
+        result = await _resolver.gethostbyaddr(ip)
+        name = result.name or ""
+    except aiodns.error.DNSError:
+        name = ""
+    _hostnames.set(ip, name)
+    return name or None
 
 
 async def nmap_scan(
@@ -286,7 +382,7 @@ class ScannerService:
 
     async def start_scan(
         self,
-        network_id: str,
+        network_id: EntityId,
         scan_type: ScanType = ScanType.PING,
         created_by: str | None = None,
     ) -> ScanJob:
@@ -295,13 +391,15 @@ class ScannerService:
             network_repo = NetworkRepository(conn)
             scan_repo = ScanRepository(conn)
 
-            network = await network_repo.find_by_id(network_id)
+            # Read fresh so a just-deleted or re-addressed network is caught,
+            # and prime the cache run_scan() reads from
+            network = await network_repo.find_by_id_cached(network_id, refresh=True)
             if not network:
                 raise ValueError(f"Network {network_id} not found")
 
             # Create scan job
             job = await scan_repo.create(
-                ScanJobCreate(network_id=network_id, scan_type=scan_type)
+                ScanJobCreate(network_id=network.id, scan_type=scan_type)
             )
 
             logger.info(
@@ -314,85 +412,76 @@ class ScannerService:
 
             return job
 
-    async def run_scan(self, scan_id: str) -> ScanResult:
+    async def run_scan(self, scan_id: EntityId) -> ScanResult:
         """Execute a scan job."""
+        # Connections are only held around the few queries a scan makes, not
+        # for the minutes a large sweep can take
         async with get_db() as conn:
             scan_repo = ScanRepository(conn)
             network_repo = NetworkRepository(conn)
-            address_repo = AddressRepository(conn)
 
-            scan = await scan_repo.find_by_id(scan_id)
+            # Mark running; the returned row doubles as the scan lookup, so a
+            # scan costs this write plus the final one with all aggregates
+            scan = await scan_repo.update_status(scan_id, ScanStatus.RUNNING)
             if not scan:
                 raise ValueError(f"Scan {scan_id} not found")
 
-            network = await network_repo.find_by_id(scan.network_id)
+            network = await network_repo.find_by_id_cached(scan.network_id)
             if not network:
                 raise ValueError(f"Network {scan.network_id} not found")
 
-            # Update status to running
-            await scan_repo.update_status(scan_id, ScanStatus.RUNNING)
-
-            start_time = datetime.now(timezone.utc)
-            active_ips: set[str] = set()
-            new_ips = 0
-            total_ips = 0
+        start_time = datetime.now(timezone.utc)
 
-            try:
-                if scan.scan_type == ScanType.NMAP:
-                    # Use nmap for comprehensive scanning
-                    result = await self._run_nmap_scan(
-                        network, scan_id, scan_repo, address_repo
-                    )
-                else:
-                    # Use built-in ICMP/TCP scanning
-                    result = await self._run_builtin_scan(
-                        network, scan, scan_id, scan_repo, address_repo
-                    )
+        try:
+            if scan.scan_type == ScanType.NMAP:
+                # Use nmap for comprehensive scanning
+                result = await self._run_nmap_scan(network, scan_id)
+            else:
+                # Use built-in ICMP/TCP scanning
+                result = await self._run_builtin_scan(network, scan, scan_id)
 
-                return result
+            return result
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error("scan_failed", scan_id=scan_id, error=error_msg)
+        except Exception as e:
+            error_msg = str(e)
+            logger.error("scan_failed", scan_id=scan_id, error=error_msg)
 
-                await scan_repo.update_status(
+            async with get_db() as conn:
+                await ScanRepository(conn).update_status(
                     scan_id,
                     ScanStatus.FAILED,
                     error_message=error_msg,
                 )
 
-                end_time = datetime.now(timezone.utc)
-                return ScanResult(
-                    scan_id=scan_id,
-                    network_id=network.id,
-                    scan_type=scan.scan_type,
-                    status=ScanStatus.FAILED,
-                    started_at=start_time,
-                    completed_at=end_time,
-                    duration_seconds=(end_time - start_time).total_seconds(),
-                    total_ips=0,
-                    active_ips=0,
-                    new_ips=0,
-                    updated_ips=0,
-                    disappeared_ips=0,
-                    error_message=error_msg,
-                )
+            end_time = datetime.now(timezone.utc)
+            return ScanResult(
+                scan_id=scan_id,
+                network_id=network.id,
+                scan_type=scan.scan_type,
+                status=ScanStatus.FAILED,
+                started_at=start_time,
+                completed_at=end_time,
+                duration_seconds=(end_time - start_time).total_seconds(),
+                total_ips=0,
+                active_ips=0,
+                new_ips=0,
+                updated_ips=0,
+                disappeared_ips=0,
+                error_message=error_msg,
+            )
 
     async def _run_nmap_scan(
         self,
         network: Network,
         scan_id: str,
-        scan_repo: ScanRepository,
-        address_repo: AddressRepository,
     ) -> ScanResult:
         """Run nmap-based network scan."""
         start_time = datetime.now(timezone.utc)
-        active_ips: set[str] = set()
-        new_ips = 0
 
         # Calculate total hosts
-        ip_network = IPNetwork(network.network)
-        total_ips = ip_network.size - 2  # Exclude network and broadcast
+        net = _parse_net(network.network)
+        active_ips = _ActiveHosts(net)
+        total_ips = host_count(net)
 
         logger.info(
             "running_nmap_scan",
@@ -404,43 +493,41 @@ class ScannerService:
         # Run nmap scan
         hosts = await nmap_scan(network.network, scan_type="ping")
 
+        discovered: list[IPAddressDiscovered] = []
         for host in hosts:
             ip = host["ip_address"]
             if not ip:
                 continue
 
             active_ips.add(ip)
-
-            # Check if this is a new IP
-            existing = await address_repo.find_by_ip(network.id, ip)
-            if not existing:
-                new_ips += 1
-
-            # Upsert the discovered address
-            await address_repo.upsert(
-                IPAddressCreate(
-                    network_id=network.id,
+            discovered.append(
+                IPAddressDiscovered(
                     address=ip,
                     hostname=host.get("hostname"),
                     mac_address=host.get("mac_address"),
-                    status=IPStatus.ACTIVE,
                 )
             )
 
-        # Mark addresses not seen as inactive
-        disappeared = await address_repo.mark_inactive(network.id, active_ips)
+        async with get_db() as conn:
+            address_repo = AddressRepository(conn)
 
-        end_time = datetime.now(timezone.utc)
-        duration = (end_time - start_time).total_seconds()
+            # Upsert discovered addresses; counts newly inserted rows
+            new_ips = await _store_discovered(address_repo, network.id, discovered)
 
-        # Update scan with results
-        await scan_repo.update_status(
-            scan_id,
-            ScanStatus.COMPLETED,
-            total_ips=total_ips,
-            active_ips=len(active_ips),
-            new_ips=new_ips,
-        )
+            # Mark addresses not seen as inactive
+            disappeared = await active_ips.mark_others_inactive(address_repo, network.id)
+
+            end_time = datetime.now(timezone.utc)
+            duration = (end_time - start_time).total_seconds()
+
+            # Update scan with results
+            await ScanRepository(conn).update_status(
+                scan_id,
+                ScanStatus.COMPLETED,
+                total_ips=total_ips,
+                active_ips=len(active_ips),
+                new_ips=new_ips,
+            )
 
         logger.info(
             "nmap_scan_completed",
@@ -471,18 +558,15 @@ class ScannerService:
         network: Network,
         scan: ScanJob,
         scan_id: str,
-        scan_repo: ScanRepository,
-        address_repo: AddressRepository,
     ) -> ScanResult:
         """Run built-in ICMP/TCP network scan."""
         start_time = datetime.now(timezone.utc)
-        active_ips: set[str] = set()
         new_ips = 0
 
         # Generate IP range from CIDR
-        ip_network = IPNetwork(network.network)
-        all_ips = [str(ip) for ip in ip_network.iter_hosts()]
-        total_ips = len(all_ips)
+        net = _parse_net(network.network)
+        active_ips = _ActiveHosts(net)
+        total_ips = host_count(net)
 
         logger.info(
             "scanning_network",
@@ -494,42 +578,42 @@ class ScannerService:
 
         # Scan in batches
         use_tcp = scan.scan_type == ScanType.TCP
-        async for discovered in self._scan_batch(all_ips, use_tcp=use_tcp):
+        pending: list[IPAddressDiscovered] = []
+        async for discovered in self._scan_batch(
+            map(str, net.hosts()), use_tcp=use_tcp
+        ):
             if discovered.is_alive:
                 active_ips.add(discovered.address)
+                pending.append(discovered)
 
-                # Check if this is a new IP
-                existing = await address_repo.find_by_ip(
-                    network.id, discovered.address
-                )
-                if not existing:
-                    new_ips += 1
-
-                # Upsert the discovered address
-                await address_repo.upsert(
-                    IPAddressCreate(
-                        network_id=network.id,
-                        address=discovered.address,
-                        hostname=discovered.hostname,
-                        mac_address=discovered.mac_address,
-                        status=IPStatus.ACTIVE,
-                    )
-                )
+                # Flush live hosts in batches; counts newly inserted rows
+                if len(pending) >= UPSERT_BATCH_SIZE:
+                    async with get_db() as conn:
+                        new_ips += await _store_discovered(
+                            AddressRepository(conn), network.id, pending
+                        )
+                    pending = []
 
-        # Mark addresses not seen as inactive
-        disappeared = await address_repo.mark_inactive(network.id, active_ips)
+        async with get_db() as conn:
+            address_repo = AddressRepository(conn)
 
-        end_time = datetime.now(timezone.utc)
-        duration = (end_time - start_time).total_seconds()
+            if pending:
+                new_ips += await _store_discovered(address_repo, network.id, pending)
 
-        # Update scan with results
-        await scan_repo.update_status(
-            scan_id,
-            ScanStatus.COMPLETED,
-            total_ips=total_ips,
-            active_ips=len(active_ips),
-            new_ips=new_ips,
-        )
+            # Mark addresses not seen as inactive
+            disappeared = await active_ips.mark_others_inactive(address_repo, network.id)
+
+            end_time = datetime.now(timezone.utc)
+            duration = (end_time - start_time).total_seconds()
+
+            # Update scan with results
+            await ScanRepository(conn).update_status(
+                scan_id,
+                ScanStatus.COMPLETED,
+                total_ips=total_ips,
+                active_ips=len(active_ips),
+                new_ips=new_ips,
+            )
 
         logger.info(
             "scan_completed",
@@ -557,38 +641,68 @@ class ScannerService:
         )
 
     async def _scan_batch(
-        self, ips: list[str], use_tcp: bool = False
+        self, ips: Iterable[str], use_tcp: bool = False
     ) -> AsyncIterator[IPAddressDiscovered]:
-        """Scan IPs in concurrent batches."""
-        semaphore = asyncio.Semaphore(self.concurrency)
-
-        async def scan_with_limit(ip: str) -> IPAddressDiscovered | None:
-            async with semaphore:
-                if use_tcp:
-                    ip_addr, is_alive, response_time, open_ports = await tcp_ping(
-                        ip, timeout=self.ping_timeout
-                    )
+        """Scan IPs with a fixed pool of workers fed from a bounded queue."""
+        # Both queues are bounded, so memory tracks the concurrency limit
+        # rather than the size of the network being swept
+        targets: asyncio.Queue[str | None] = asyncio.Queue(maxsize=self.concurrency * 2)
+        results: asyncio.Queue[IPAddressDiscovered | Exception | None] = asyncio.Queue(
+            maxsize=self.concurrency * 2
+        )
+
+        async def scan_one(ip: str) -> IPAddressDiscovered:
+            if use_tcp:
+                ip_addr, is_alive, response_time, open_ports = await tcp_ping(
+                    ip, timeout=self.ping_timeout
+                )
+            else:
+                ip_addr, is_alive, response_time = await icmp_ping(
+                    ip, timeout=self.ping_timeout
+                )
+
+            if is_alive:
+                hostname = await resolve_hostname(ip)
+                return IPAddressDiscovered(
+                    address=ip_addr,
+                    hostname=hostname,
+                    response_time_ms=response_time,
+                    is_alive=True,
+                )
+            return IPAddressDiscovered(address=ip_addr, is_alive=False)
+
+        async def produce() -> None:
+            for ip in ips:
+                await targets.put(ip)
+            for _ in range(self.concurrency):
+                await targets.put(None)
+
+        async def work() -> None:
+            try:
+                while (ip := await targets.get()) is not None:
+                    await results.put(await scan_one(ip))
+            except Exception as e:
+                await results.put(e)
+            finally:
+                await results.put(None)
+
+        producer = asyncio.create_task(produce())
+        workers = [asyncio.create_task(work()) for _ in range(self.concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
                 else:
-                    ip_addr, is_alive, response_time = await icmp_ping(
-                        ip, timeout=self.ping_timeout
-                    )
-
-                if is_alive:
-                    hostname = await resolve_hostname(ip)
-                    return IPAddressDiscovered(
-                        address=ip_addr,
-                        hostname=hostname,
-                        response_time_ms=response_time,
-                        is_alive=True,
-                    )
-                return IPAddressDiscovered(address=ip_addr, is_alive=False)
-
-        # Process all IPs concurrently (respecting semaphore limit)
-        tasks = [scan_with_limit(ip) for ip in ips]
-        for coro in asyncio.as_completed(tasks):
-            result = await coro
-            if result:
-                yield result
+                    yield item
+        finally:
+            producer.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
 
     async def run_quick_scan(
         self, cidr: str, scan_type: str = "ping"
@@ -601,11 +715,10 @@ class ScannerService:
             return await nmap_scan(cidr, scan_type="ping")
         else:
             # Use built-in scanner
-            ip_network = IPNetwork(cidr)
-            all_ips = [str(ip) for ip in ip_network.iter_hosts()]
+            net = _parse_net(cidr)
 
             results = []
-            async for discovered in self._scan_batch(all_ips, use_tcp=False):
+            async for discovered in self._scan_batch(map(str, net.hosts()), use_tcp=False):
                 if discovered.is_alive:
                     results.append({
                         "ip_address": discovered.address,
@@ -616,14 +729,14 @@ class ScannerService:
 
             return results
 
-    async def get_scan_status(self, scan_id: str) -> ScanJob | None:
+    async def get_scan_status(self, scan_id: EntityId) -> ScanJob | None:
         """Get current status of a scan job."""
         async with get_db() as conn:
             scan_repo = ScanRepository(conn)
             return await scan_repo.find_by_id(scan_id)
 
     async def get_network_scans(
-        self, network_id: str, limit: int = 10
+        self, network_id: EntityId, limit: int = 10
     ) -> list[ScanJob]:
         """Get recent scans for a network."""
         async with get_db() as conn:
@@ -0,0 +1,31 @@
+"""Tests for usable host counting."""
+
+import ipaddress
+
+import pytest
+
+from ipam.models.network import host_count
+
+
+@pytest.mark.parametrize(
+    "cidr",
+    [
+        "10.0.0.0/20",
+        "192.168.1.0/24",
+        "192.168.1.0/30",
+        "192.168.1.0/31",
+        "192.168.1.1/32",
+        "2001:db8::/120",
+        "2001:db8::/126",
+        "2001:db8::/127",
+        "2001:db8::1/128",
+    ],
+)
+def test_host_count_matches_hosts(cidr: str) -> None:
+    net = ipaddress.ip_network(cidr)
+    assert host_count(net) == sum(1 for _ in net.hosts())
+
+
+def test_point_to_point_networks_count_both_ends() -> None:
+    assert host_count(ipaddress.ip_network("10.0.0.0/31")) == 2
+    assert host_count(ipaddress.ip_network("10.0.0.1/32")) == 1
@@ -0,0 +1,50 @@
+"""Tests for pagination cursors and address search classification."""
+
+import pytest
+
+from ipam.db.repository import (
+    _SEARCH_PATTERN,
+    _SEARCH_PREFIX,
+    _address_search,
+    _decode_cursor,
+    _encode_cursor,
+)
+
+
+class TestCursor:
+    def test_round_trip(self) -> None:
+        cursor = _encode_cursor("2024-01-02T03:04:05+00:00", "6f9619ff-8b86-d011-b42d-00cf4fc964ff")
+        assert _decode_cursor(cursor, 2) == [
+            "2024-01-02T03:04:05+00:00",
+            "6f9619ff-8b86-d011-b42d-00cf4fc964ff",
+        ]
+
+    def test_is_url_safe_without_padding(self) -> None:
+        cursor = _encode_cursor("2001:db8::ff")
+        assert "=" not in cursor
+        assert "+" not in cursor and "/" not in cursor
+        assert _decode_cursor(cursor, 1) == ["2001:db8::ff"]
+
+    @pytest.mark.parametrize("cursor", ["!!!not-base64", "_w", "AAAA"])
+    def test_rejects_garbage(self, cursor: str) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            _decode_cursor(cursor, 2)
+
+    def test_rejects_wrong_arity(self) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            _decode_cursor(_encode_cursor("10.0.0.1"), 2)
+
+
+class TestAddressSearch:
+    def test_plain_term_is_lowercased_prefix(self) -> None:
+        assert _address_search("Core-SW") == (_SEARCH_PREFIX, "core-sw%")
+
+    def test_prefix_escapes_like_metacharacters(self) -> None:
+        assert _address_search("host_1") == (_SEARCH_PREFIX, "host\\_1%")
+        assert _address_search("a\\b") == (_SEARCH_PREFIX, "a\\\\b%")
+
+    def test_star_wildcard_becomes_pattern(self) -> None:
+        assert _address_search("*.5") == (_SEARCH_PATTERN, "%.5")
+
+    def test_percent_wildcard_is_kept_as_pattern(self) -> None:
+        assert _address_search("10.%.1") == (_SEARCH_PATTERN, "10.%.1")
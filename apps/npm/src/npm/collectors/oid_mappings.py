@@ -26,10 +26,17 @@ Standard MIBs supported:
 MIB files are stored in: infrastructure/mibs/
 """
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only fallback for lookup misses, so a miss neither allocates a
+# fresh dict nor hands the caller something it could mutate
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 class VendorType(str, Enum):
     """Supported network equipment vendors."""
@@ -46,15 +53,23 @@ class VendorType(str, Enum):
     WINDOWS = "windows"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OIDDefinition:
-    """Definition for a single SNMP OID."""
+    """Definition for a single SNMP OID.
+
+    ``oid_tuple`` is derived from ``oid`` once at catalog load so pollers
+    don't re-parse the dotted string on every poll.
+    """
     oid: str
     name: str
     description: str
     data_type: str  # integer, string, counter32, counter64, gauge32, timeticks
     unit: str | None = None  # bytes, percent, seconds, etc.
     scale: float = 1.0  # multiplier for unit conversion
+    oid_tuple: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "oid_tuple", tuple(map(int, self.oid.split("."))))
 
 
 # =============================================================================
@@ -547,7 +562,16 @@ VENDOR_OID_PREFIXES = {
     "1.3.6.1.4.1.77": VendorType.WINDOWS,         # LanMgr (Windows)
 }
 
+# Every prefix above is a private enterprise number, so detection is one dict
+# probe on the arc after 1.3.6.1.4.1 rather than a startswith per vendor.
+# Matching whole arcs also keeps e.g. enterprise 7744 from matching "77".
+_ENTERPRISES = "1.3.6.1.4.1."
+_VENDOR_BY_ENTERPRISE = {
+    prefix[len(_ENTERPRISES):]: vendor for prefix, vendor in VENDOR_OID_PREFIXES.items()
+}
+
 
+@lru_cache(maxsize=4096)
 def detect_vendor_from_sys_object_id(sys_object_id: str) -> VendorType:
     """Detect vendor type from sysObjectID OID.
 
@@ -557,54 +581,70 @@ def detect_vendor_from_sys_object_id(sys_object_id: str) -> VendorType:
     Returns:
         VendorType enum indicating the detected vendor
     """
-    for prefix, vendor in VENDOR_OID_PREFIXES.items():
-        if sys_object_id.startswith(prefix):
-            return vendor
-    return VendorType.GENERIC
+    if not sys_object_id.startswith(_ENTERPRISES):
+        return VendorType.GENERIC
+    enterprise = sys_object_id[len(_ENTERPRISES):].partition(".")[0]
+    return _VENDOR_BY_ENTERPRISE.get(enterprise, VendorType.GENERIC)
+
+
+def _freeze(catalog: dict[str, dict[str, OIDDefinition]]) -> Mapping[str, Mapping[str, OIDDefinition]]:
+    """Read-only view of a category -> name -> definition catalog."""
+    return MappingProxyType({category: MappingProxyType(oids) for category, oids in catalog.items()})
+
+
+# Built once rather than per get_vendor_oids call
+_VENDOR_OIDS = {
+    VendorType.ARISTA: _freeze(ARISTA_OIDS),
+    VendorType.ARUBA: _freeze(ARUBA_OIDS),
+    VendorType.HPE_ARUBA_CX: _freeze(HPE_ARUBA_CX_OIDS),
+    VendorType.JUNIPER: _freeze(JUNIPER_OIDS),
+    VendorType.MELLANOX: _freeze(MELLANOX_OIDS),
+    VendorType.PFSENSE: _freeze(PFSENSE_OIDS),
+    VendorType.SOPHOS: _freeze(SOPHOS_OIDS),
+    VendorType.LINUX: _freeze(LINUX_OIDS),
+    VendorType.REDHAT: _freeze(REDHAT_OIDS),
+    VendorType.WINDOWS: _freeze(WINDOWS_OIDS),
+}
 
 
-def get_vendor_oids(vendor: VendorType) -> dict[str, dict[str, OIDDefinition]]:
+def get_vendor_oids(vendor: VendorType) -> Mapping[str, Mapping[str, OIDDefinition]]:
     """Get vendor-specific OID mappings.
 
     Args:
         vendor: The vendor type
 
     Returns:
-        Dictionary of OID categories and definitions
+        Read-only mapping of OID categories and definitions
     """
-    vendor_maps = {
-        VendorType.ARISTA: ARISTA_OIDS,
-        VendorType.ARUBA: ARUBA_OIDS,
-        VendorType.HPE_ARUBA_CX: HPE_ARUBA_CX_OIDS,
-        VendorType.JUNIPER: JUNIPER_OIDS,
-        VendorType.MELLANOX: MELLANOX_OIDS,
-        VendorType.PFSENSE: PFSENSE_OIDS,
-        VendorType.SOPHOS: SOPHOS_OIDS,
-        VendorType.LINUX: LINUX_OIDS,
-        VendorType.REDHAT: REDHAT_OIDS,
-        VendorType.WINDOWS: WINDOWS_OIDS,
-    }
-    return vendor_maps.get(vendor, {})
-
-
-def get_all_oids_for_vendor(vendor: VendorType) -> dict[str, dict[str, OIDDefinition]]:
+    return _VENDOR_OIDS.get(vendor, _EMPTY)
+
+
+def get_all_oids_for_vendor(vendor: VendorType) -> Mapping[str, Mapping[str, OIDDefinition]]:
     """Get all OIDs (standard + vendor-specific) for a vendor.
 
     Args:
         vendor: The vendor type
 
     Returns:
-        Combined dictionary of standard and vendor OIDs
+        Read-only combined mapping of standard and vendor OIDs
     """
-    # Start with standard OIDs
-    all_oids = dict(STANDARD_OIDS)
+    return _ALL_OIDS_BY_VENDOR.get(vendor, _ALL_OIDS_BY_VENDOR[VendorType.GENERIC])
 
-    # Add vendor-specific OIDs
-    vendor_oids = get_vendor_oids(vendor)
-    for category, oids in vendor_oids.items():
-        if category in all_oids:
-            all_oids[category].update(oids)
-        else:
-            all_oids[category] = oids
 
-    return all_oids
+def _merge_catalogs(vendor: VendorType) -> Mapping[str, Mapping[str, OIDDefinition]]:
+    """Merge standard and vendor OIDs per category; vendor entries win."""
+    vendor_oids = get_vendor_oids(vendor)
+    categories = dict.fromkeys([*STANDARD_OIDS, *vendor_oids])
+    return MappingProxyType({
+        category: MappingProxyType({
+            **STANDARD_OIDS.get(category, _EMPTY),
+            **vendor_oids.get(category, _EMPTY),
+        })
+        for category in categories
+    })
+
+
+# The catalogs never change at runtime, so each vendor's merged view is built
+# once and shared. The proxies are read-only, which also stops callers from
+# writing into STANDARD_OIDS through a merged category.
+_ALL_OIDS_BY_VENDOR = {vendor: _merge_catalogs(vendor) for vendor in VendorType}
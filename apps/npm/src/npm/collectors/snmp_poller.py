@@ -13,9 +13,31 @@ OID mappings: oid_mappings.py
 """
 
 import asyncio
+import contextlib
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+from pysnmp.hlapi.v3arch.asyncio import (
+    get_cmd,
+    bulk_cmd,
+    CommunityData,
+    UdpTransportTarget,
+    ContextData,
+    ObjectType,
+    ObjectIdentity,
+    SnmpEngine,
+)
+from pysnmp.error import PySnmpError
+from pysnmp.proto.rfc1905 import NoSuchInstance, NoSuchObject
+
 from ..core.config import settings
 from ..core.logging import get_logger, configure_logging
 from ..db import init_db, close_db, get_db, DeviceRepository, InterfaceRepository
@@ -23,7 +45,7 @@ from ..models.device import Device, DeviceStatus
 from ..models.interface import InterfaceCreate, InterfaceStatus, AdminStatus
 from ..models.metrics import DeviceMetrics, InterfaceMetrics
 from ..services.device import DeviceService
-from ..services.metrics import MetricsService
+from ..services.metrics import MetricsService, device_metric_lines, interface_metric_lines
 from .oid_mappings import (
     STANDARD_OIDS,
     VendorType,
@@ -58,16 +80,290 @@ OID_IF_HC_IN_OCTETS = STANDARD_OIDS["interfaces_hc"]["ifHCInOctets"].oid
 OID_IF_HC_OUT_OCTETS = STANDARD_OIDS["interfaces_hc"]["ifHCOutOctets"].oid
 OID_IF_NAME = STANDARD_OIDS["interfaces_hc"]["ifName"].oid
 OID_IF_ALIAS = STANDARD_OIDS["interfaces_hc"]["ifAlias"].oid
+OID_IF_HIGH_SPEED = STANDARD_OIDS["interfaces_hc"]["ifHighSpeed"].oid
+
+SNMP_PORT = 161
+
+# Upper bound for GETBULK max-repetitions; agents truncate oversized responses
+BULK_MAX_REPETITIONS = 25
+
+# Interface columns fetched together, one varbind per column in each GETBULK PDU
+IF_WALK_COLUMNS: dict[str, str] = {
+    "ifDescr": OID_IF_DESCR,
+    "ifType": OID_IF_TYPE,
+    "ifSpeed": OID_IF_SPEED,
+    "ifPhysAddress": OID_IF_PHYS_ADDRESS,
+    "ifAdminStatus": OID_IF_ADMIN_STATUS,
+    "ifOperStatus": OID_IF_OPER_STATUS,
+    "ifInErrors": OID_IF_IN_ERRORS,
+    "ifOutErrors": OID_IF_OUT_ERRORS,
+    "ifHCInOctets": OID_IF_HC_IN_OCTETS,
+    "ifHCOutOctets": OID_IF_HC_OUT_OCTETS,
+    "ifName": OID_IF_NAME,
+    "ifAlias": OID_IF_ALIAS,
+    "ifHighSpeed": OID_IF_HIGH_SPEED,
+}
+
+# Cached-OID GET batches outstanding per device; agents usually serve SNMP on a
+# single task, so sending every batch at once only queues them there and
+# invites drops and retries
+GET_BATCHES_IN_FLIGHT = 4
+
+# Per-worker DB pool bounds when polling is sharded across processes
+WORKER_DB_POOL_MIN = 2
+WORKER_DB_POOL_MAX = 8
+
+# How long the active device list is reused before it is reloaded
+DEVICE_LIST_TTL = 300.0
+
+# Interfaces upserted per DB round trip while a walk is still streaming rows
+INTERFACE_UPSERT_CHUNK = 32
+
+# Octet counter change points kept per interface; rates span oldest to newest
+COUNTER_HISTORY_SIZE = 4
+
+# Counters unchanged for this many agent MIB update periods mean an idle interface
+MIB_PERIOD_MULTIPLIER = 3
+
+# IF-MIB status enumerations (1-based)
+_OPER_STATUS = (
+    InterfaceStatus.UP,
+    InterfaceStatus.DOWN,
+    InterfaceStatus.TESTING,
+    InterfaceStatus.UNKNOWN,
+    InterfaceStatus.DORMANT,
+    InterfaceStatus.NOT_PRESENT,
+    InterfaceStatus.LOWER_LAYER_DOWN,
+)
+_ADMIN_STATUS = (AdminStatus.UP, AdminStatus.DOWN, AdminStatus.TESTING)
+
+
+# Column OID prefixes (pre-parsed by the catalog) and root varbinds, built once
+# instead of on every walk
+_IF_COLUMN_PREFIXES = {
+    name: (
+        STANDARD_OIDS["interfaces"].get(name) or STANDARD_OIDS["interfaces_hc"][name]
+    ).oid_tuple
+    for name in IF_WALK_COLUMNS
+}
+_IF_TABLE_COLUMNS = {
+    name: ObjectType(ObjectIdentity(oid)) for name, oid in IF_WALK_COLUMNS.items()
+}
+
+# Column name by OID prefix, used to route GET responses back to their column
+_COLUMN_BY_PREFIX = {prefix: name for name, prefix in _IF_COLUMN_PREFIXES.items()}
+
+
+def _enum_value(table: tuple, value: Any) -> Any:
+    """Map a 1-based SNMP enumeration to its model value."""
+    try:
+        return table[int(value) - 1]
+    except (IndexError, TypeError, ValueError):
+        return None
+
+
+def _format_mac(value: Any) -> str | None:
+    """Format an ifPhysAddress octet string as a colon-separated MAC."""
+    raw = bytes(value.asOctets()) if hasattr(value, "asOctets") else b""
+    if len(raw) != 6:
+        return None
+    return ":".join(f"{b:02x}" for b in raw)
+
+
+def _record_counters(
+    history: deque[tuple[float, int, int]],
+    sampled_at: float,
+    in_octets: int,
+    out_octets: int,
+) -> None:
+    """Append a counter change point when the octet counters moved.
+
+    Agents only rewrite counters every P_MIB seconds, so polls that see the
+    same values carry no new information and are not recorded. A counter
+    going backwards (reset or wrap) starts the history over.
+    """
+    if history:
+        _, last_in, last_out = history[-1]
+        if in_octets == last_in and out_octets == last_out:
+            return
+        if in_octets < last_in or out_octets < last_out:
+            history.clear()
+    history.append((sampled_at, in_octets, out_octets))
+
+
+def _estimate_mib_period(history: deque[tuple[float, int, int]]) -> float | None:
+    """Estimate how often the agent refreshes its octet counters.
+
+    The median gap between recorded change points approximates P_MIB (or the
+    poll interval, for agents that update faster than we poll). Returns None
+    with fewer than two change points.
+    """
+    if len(history) < 2:
+        return None
+    times = [sample[0] for sample in history]
+    return statistics.median(b - a for a, b in zip(times, times[1:], strict=False))
+
+
+def _counter_rates(
+    history: deque[tuple[float, int, int]],
+    now: float,
+) -> tuple[float, float] | None:
+    """Derive (in, out) bits per second from the counter change points.
+
+    The rate spans the oldest to the newest change point, so both ends sit on
+    agent updates and the window widens with the history instead of showing
+    P_MIB step artefacts. If the counters have not moved for
+    MIB_PERIOD_MULTIPLIER update periods the interface is idle and the rate is
+    0. Returns None while the rate is still unknown.
+    """
+    mib_period = _estimate_mib_period(history)
+    if mib_period is None:
+        return None
+
+    oldest, newest = history[0], history[-1]
+    if now - newest[0] > MIB_PERIOD_MULTIPLIER * mib_period:
+        return 0.0, 0.0
+
+    elapsed = newest[0] - oldest[0]
+    if elapsed <= 0:
+        return None
+    return (newest[1] - oldest[1]) * 8 / elapsed, (newest[2] - oldest[2]) * 8 / elapsed
+
+
+class SNMPError(Exception):
+    """SNMP failure while polling a device."""
+
+
+class SNMPTransportError(SNMPError):
+    """No usable response from the agent (timeout, unreachable, bad community)."""
+
+
+class SNMPProtocolError(SNMPError):
+    """The agent answered with a non-zero error-status."""
+
+
+@dataclass(slots=True)
+class IfRow:
+    """One interface as read from ifTable/ifXTable."""
+
+    if_index: int
+    name: str | None = None
+    description: str | None = None
+    mac_address: str | None = None
+    speed_mbps: int | None = None
+    admin_status: AdminStatus | None = None
+    oper_status: InterfaceStatus | None = None
+    in_octets: int = 0
+    out_octets: int = 0
+    in_errors: int = 0
+    out_errors: int = 0
+
+
+def _to_if_row(if_index: int, row: dict[str, Any]) -> IfRow:
+    """Convert one interface's column values into an IfRow."""
+    if_descr = str(row["ifDescr"]) if "ifDescr" in row else None
+    high_speed = int(row.get("ifHighSpeed", 0))
+    speed = int(row.get("ifSpeed", 0))
+    return IfRow(
+        if_index=if_index,
+        name=str(row["ifName"]) if "ifName" in row else if_descr,
+        description=str(row["ifAlias"]) if row.get("ifAlias") else if_descr,
+        mac_address=_format_mac(row.get("ifPhysAddress")),
+        speed_mbps=high_speed or (speed // 1_000_000 if speed else None),
+        admin_status=_enum_value(_ADMIN_STATUS, row.get("ifAdminStatus")),
+        oper_status=_enum_value(_OPER_STATUS, row.get("ifOperStatus")),
+        in_octets=int(row.get("ifHCInOctets", 0)),
+        out_octets=int(row.get("ifHCOutOctets", 0)),
+        in_errors=int(row.get("ifInErrors", 0)),
+        out_errors=int(row.get("ifOutErrors", 0)),
+    )
+
+
+def _absorb_bulk_response(
+    names: list[str],
+    var_binds: Any,
+    cursors: dict[str, tuple[int, ...]],
+    rows: dict[int, dict[str, Any]],
+) -> tuple[set[str], bool]:
+    """Merge one multi-column GETBULK response into rows, advancing cursors.
+
+    Responses are row-major: one varbind per requested column per repetition.
+    Returns the columns the agent walked past (or hit endOfMibView on) and
+    whether any column moved forward.
+    """
+    done: set[str] = set()
+    progressed = False
+    for i, (oid, value) in enumerate(var_binds):
+        name = names[i % len(names)]
+        if name in done:
+            continue
+        arcs = tuple(oid)
+        prefix = _IF_COLUMN_PREFIXES[name]
+        if (
+            arcs[: len(prefix)] != prefix
+            or len(arcs) != len(prefix) + 1
+            or arcs <= cursors[name]
+        ):
+            done.add(name)
+            continue
+        rows.setdefault(arcs[-1], {})[name] = value
+        cursors[name] = arcs
+        progressed = True
+    return done, progressed
+
+
+def _pop_complete_rows(
+    rows: dict[int, dict[str, Any]],
+    cursors: dict[str, tuple[int, ...]],
+) -> list[tuple[int, dict[str, Any]]]:
+    """Remove and return, in ifIndex order, rows no active column can extend.
+
+    A row is complete once every column still being walked has reached its
+    ifIndex; with no active columns every row is complete.
+    """
+    horizon = min(
+        (
+            cursor[-1] if len(cursor) > len(_IF_COLUMN_PREFIXES[name]) else 0
+            for name, cursor in cursors.items()
+        ),
+        default=None,
+    )
+    return [
+        (if_index, rows.pop(if_index))
+        for if_index in sorted(rows)
+        if horizon is None or if_index <= horizon
+    ]
+
+
+async def _iter_rows(
+    rows: dict[int, dict[str, Any]],
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """Yield already-fetched rows in ifIndex order."""
+    for if_index in sorted(rows):
+        yield if_index, rows[if_index]
 
 
 class SNMPPoller:
     """SNMP polling service for collecting device metrics."""
 
-    def __init__(self) -> None:
+    def __init__(self, shard: tuple[int, int] | None = None) -> None:
+        self.shard = shard
         self.device_service = DeviceService()
         self.metrics_service = MetricsService()
         self._running = False
         self._poll_task: asyncio.Task | None = None
+        # One engine (and dispatcher socket) shared by every request this poller makes
+        self._snmp_engine = SnmpEngine()
+        self._transport_cache: dict[str, UdpTransportTarget] = {}
+        self._community_cache: dict[str, CommunityData] = {}
+        # device_id -> (walked_at, ifNumber, fully-qualified interface OIDs)
+        self._oid_cache: dict[str, tuple[float, int, list[tuple[int, ...]]]] = {}
+        # (device_id, ifIndex) -> recent (monotonic ts, ifHCInOctets, ifHCOutOctets)
+        self._counter_history: dict[tuple[str, int], deque[tuple[float, int, int]]] = {}
+        # Device list reused across cycles; statuses are tracked locally instead
+        self._devices: list[Device] = []
+        self._devices_cache_expiry = 0.0
+        self._last_status: dict[str, DeviceStatus] = {}
 
     async def start(self) -> None:
         """Start the polling loop."""
@@ -85,36 +381,65 @@ class SNMPPoller:
             except asyncio.CancelledError:
                 pass
         await self.metrics_service.close()
+        self._snmp_engine.close_dispatcher()
+        self._transport_cache.clear()
         logger.info("snmp_poller_stopped")
 
     async def _poll_loop(self) -> None:
         """Main polling loop."""
+        loop = asyncio.get_running_loop()
         while self._running:
+            start = loop.time()
             try:
                 await self._poll_all_devices()
             except Exception as e:
                 logger.error("poll_loop_error", error=str(e))
 
-            # Wait for next poll interval
-            await asyncio.sleep(settings.default_poll_interval)
+            # Wait out the rest of the poll interval
+            elapsed = loop.time() - start
+            await asyncio.sleep(max(0, settings.default_poll_interval - elapsed))
 
     async def _poll_all_devices(self) -> None:
         """Poll all active devices."""
-        devices = await self.device_service.get_active_devices_for_polling()
+        if time.monotonic() >= self._devices_cache_expiry:
+            self._devices = await self.device_service.get_active_devices_for_polling(self.shard)
+            self._devices_cache_expiry = time.monotonic() + DEVICE_LIST_TTL
+        devices = list(self._devices)
         logger.info("polling_devices", count=len(devices))
 
         # Create semaphore to limit concurrent polls
         semaphore = asyncio.Semaphore(settings.max_concurrent_polls)
 
+        # Spread devices across the start of the cycle instead of polling in lockstep
+        random.shuffle(devices)
+        jitter = min(settings.default_poll_interval / 10, 1.0)
+
         async def poll_with_limit(device: Device):
+            await asyncio.sleep(random.uniform(0, jitter))
             async with semaphore:
-                await self._poll_device(device)
+                try:
+                    await asyncio.wait_for(
+                        self._poll_device(device),
+                        timeout=settings.device_poll_timeout,
+                    )
+                except TimeoutError:
+                    logger.warning("device_poll_timeout", device_id=device.id)
+                    await self._update_device_status(device.id, DeviceStatus.DOWN)
+                except Exception as e:
+                    # Server-side failures (DB, VictoriaMetrics) say nothing about the device
+                    logger.error("device_poll_error", device_id=device.id, error=str(e))
+
+        # Poll devices concurrently, bounded so a cycle never overruns the interval
+        tasks = {asyncio.create_task(poll_with_limit(device)): device.id for device in devices}
+        if not tasks:
+            return
 
-        # Poll devices concurrently
-        await asyncio.gather(
-            *[poll_with_limit(device) for device in devices],
-            return_exceptions=True,
-        )
+        try:
+            async with asyncio.timeout(max(1, settings.default_poll_interval - 2)):
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except TimeoutError:
+            pending = [device_id for task, device_id in tasks.items() if not task.done()]
+            logger.warning("poll_cycle_timeout", pending=len(pending), device_ids=pending)
 
     async def _poll_device(self, device: Device) -> None:
         """Poll a single device via SNMP."""
@@ -132,22 +457,34 @@ class SNMPPoller:
             device_metrics = await self._get_device_metrics(device, community)
 
             if device_metrics:
+                # Interfaces may have been renumbered while the device was down
+                if self._last_status.get(device.id, device.status) == DeviceStatus.DOWN:
+                    self._oid_cache.pop(device.id, None)
+
                 # Device is responding - mark as UP
                 await self._update_device_status(device.id, DeviceStatus.UP)
 
-                # Push metrics to VictoriaMetrics
-                await self.metrics_service.push_device_metrics(
-                    device.id, device.name, device_metrics
+                # Poll interfaces, then push device and interface samples together
+                interface_metrics = await self._poll_interfaces(
+                    device, community, device_metrics.timestamp
                 )
 
-                # Poll interfaces
-                await self._poll_interfaces(device, community)
+                timestamp = int(device_metrics.timestamp.timestamp() * 1000)
+                lines = device_metric_lines(device.id, device.name, device_metrics, timestamp)
+                for m in interface_metrics:
+                    lines.extend(
+                        interface_metric_lines(
+                            m.interface_id, device.id, m.interface_name, m, timestamp
+                        )
+                    )
+                await self.metrics_service.push_batch(lines)
             else:
                 # Device not responding - mark as DOWN
                 await self._update_device_status(device.id, DeviceStatus.DOWN)
 
-        except Exception as e:
-            logger.error("device_poll_failed", device_id=device.id, error=str(e))
+        except (TimeoutError, OSError, SNMPError) as e:
+            # Only device-side failures flip status; DB errors propagate to the caller
+            logger.warning("device_poll_failed", device_id=device.id, error=str(e))
             await self._update_device_status(device.id, DeviceStatus.DOWN)
 
     async def _get_device_metrics(
@@ -156,96 +493,198 @@ class SNMPPoller:
         community: str,
     ) -> DeviceMetrics | None:
         """Get device-level metrics via SNMP."""
-        try:
-            # For now, return simulated metrics
-            # In production, use pysnmp to perform actual SNMP queries
-            uptime = await self._snmp_get(device.ip_address, community, OID_SYSTEM_UPTIME)
+        uptime = await self._snmp_get(device.ip_address, community, OID_SYSTEM_UPTIME)
 
-            if uptime is None:
-                return None
-
-            return DeviceMetrics(
-                device_id=device.id,
-                device_name=device.name,
-                timestamp=datetime.now(timezone.utc),
-                uptime_seconds=uptime,
-                cpu_utilization=None,  # Would need vendor-specific OIDs
-                memory_utilization=None,
-            )
-        except Exception as e:
-            logger.warning("device_metrics_failed", device_id=device.id, error=str(e))
+        if uptime is None:
             return None
 
-    async def _poll_interfaces(self, device: Device, community: str) -> None:
-        """Poll and update interface information."""
+        return DeviceMetrics(
+            device_id=device.id,
+            device_name=device.name,
+            timestamp=datetime.now(timezone.utc),
+            uptime_seconds=int(uptime) // 100,  # sysUpTime is in hundredths
+            cpu_utilization=None,  # Would need vendor-specific OIDs
+            memory_utilization=None,
+        )
+
+    async def _poll_interfaces(
+        self,
+        device: Device,
+        community: str,
+        now: datetime,
+    ) -> list[InterfaceMetrics]:
+        """Poll and update interface information, returning metrics to push.
+
+        now is the device sample's timestamp, shared by every interface row.
+        """
         try:
             # Get interface count
             if_count = await self._snmp_get(device.ip_address, community, OID_IF_NUMBER)
             if not if_count:
-                return
+                return []
+
+            if_count = int(if_count)
+
+            # Steady state: GET the cached OIDs; rewalk when stale or ifNumber changed
+            rows: AsyncIterator[tuple[int, dict[str, Any]]] | None = None
+            cached = self._oid_cache.get(device.id)
+            if (
+                cached
+                and cached[1] == if_count
+                and time.monotonic() - cached[0] < settings.refresh_oids_cache_interval
+            ):
+                fetched = await self._snmp_get_interface_rows(
+                    device.ip_address, community, cached[2]
+                )
+                if fetched is None:
+                    self._oid_cache.pop(device.id, None)
+                else:
+                    rows = _iter_rows(fetched)
+
+            walked = rows is None
+            if walked:
+                rows = self._snmp_walk_interfaces(device.ip_address, community, if_count)
+
+            sampled_at = time.monotonic()
+            oids: list[tuple[int, ...]] = []
+            metrics_rows: list[InterfaceMetrics] = []
+            chunk: list[IfRow] = []
+
+            # Upsert in fixed-size chunks while the walk is still receiving rows
+            async for if_index, columns in rows:
+                if walked:
+                    oids.extend(
+                        _IF_COLUMN_PREFIXES[name] + (if_index,) for name in columns
+                    )
+                chunk.append(_to_if_row(if_index, columns))
+                if len(chunk) >= INTERFACE_UPSERT_CHUNK:
+                    metrics_rows.extend(
+                        await self._store_interfaces(device, chunk, sampled_at, now)
+                    )
+                    chunk = []
 
-            # Walk interface table
-            interfaces_data = await self._snmp_walk_interfaces(
-                device.ip_address, community, if_count
-            )
+            if chunk:
+                metrics_rows.extend(await self._store_interfaces(device, chunk, sampled_at, now))
 
-            async with get_db() as conn:
-                repo = InterfaceRepository(conn)
-
-                for if_data in interfaces_data:
-                    # Upsert interface
-                    interface = await repo.upsert(
-                        InterfaceCreate(
-                            device_id=device.id,
-                            if_index=if_data["if_index"],
-                            name=if_data.get("name"),
-                            description=if_data.get("description"),
-                            mac_address=if_data.get("mac_address"),
-                            speed_mbps=if_data.get("speed_mbps"),
-                            admin_status=if_data.get("admin_status"),
-                            oper_status=if_data.get("oper_status"),
-                        )
-                    )
+            if walked and oids:
+                self._oid_cache[device.id] = (time.monotonic(), if_count, oids)
 
-                    # Push interface metrics
-                    if interface:
-                        metrics = InterfaceMetrics(
-                            interface_id=interface.id,
-                            device_id=device.id,
-                            interface_name=interface.name or f"if{interface.if_index}",
-                            timestamp=datetime.now(timezone.utc),
-                            in_octets=if_data.get("in_octets", 0),
-                            out_octets=if_data.get("out_octets", 0),
-                            in_errors=if_data.get("in_errors", 0),
-                            out_errors=if_data.get("out_errors", 0),
-                            speed_mbps=if_data.get("speed_mbps"),
-                        )
-                        await self.metrics_service.push_interface_metrics(
-                            interface.id, device.id, interface.name or "", metrics
-                        )
+            return metrics_rows
 
-        except Exception as e:
+        except SNMPError as e:
+            # The device already answered sysUpTime, so keep its status and skip interfaces
             logger.warning("interface_poll_failed", device_id=device.id, error=str(e))
+            return []
+
+    async def _store_interfaces(
+        self,
+        device: Device,
+        interfaces: list[IfRow],
+        sampled_at: float,
+        now: datetime,
+    ) -> list[InterfaceMetrics]:
+        """Upsert a chunk of interfaces and build their metrics."""
+        creates = [
+            InterfaceCreate(
+                device_id=device.id,
+                if_index=row.if_index,
+                name=row.name,
+                description=row.description,
+                mac_address=row.mac_address,
+                speed_mbps=row.speed_mbps,
+                admin_status=row.admin_status,
+                oper_status=row.oper_status,
+            )
+            for row in interfaces
+        ]
+
+        async with get_db() as conn:
+            interface_ids = await InterfaceRepository(conn).upsert_many(device.id, creates)
+
+        metrics_rows = []
+        for row in interfaces:
+            interface_id = interface_ids.get(row.if_index)
+            if not interface_id:
+                continue
+
+            history = self._counter_history.setdefault(
+                (device.id, row.if_index), deque(maxlen=COUNTER_HISTORY_SIZE)
+            )
+            _record_counters(history, sampled_at, row.in_octets, row.out_octets)
+            rates = _counter_rates(history, sampled_at)
+
+            # Utilization stays unset rather than 0% while the rate is unknown
+            in_util = out_util = None
+            if rates and row.speed_mbps:
+                in_util = rates[0] / (row.speed_mbps * 10_000)
+                out_util = rates[1] / (row.speed_mbps * 10_000)
+
+            metrics_rows.append(
+                InterfaceMetrics(
+                    interface_id=interface_id,
+                    device_id=device.id,
+                    interface_name=row.name or f"if{row.if_index}",
+                    timestamp=now,
+                    in_octets=row.in_octets,
+                    out_octets=row.out_octets,
+                    in_errors=row.in_errors,
+                    out_errors=row.out_errors,
+                    speed_mbps=row.speed_mbps,
+                    in_utilization_pct=in_util,
+                    out_utilization_pct=out_util,
+                    in_rate_bps=rates[0] if rates else None,
+                    out_rate_bps=rates[1] if rates else None,
+                )
+            )
+
+        return metrics_rows
+
+    async def _get_transport(self, ip: str) -> UdpTransportTarget:
+        """Get the memoised UDP target for a device address."""
+        transport = self._transport_cache.get(ip)
+        if transport is None:
+            transport = await UdpTransportTarget.create(
+                (ip, SNMP_PORT),
+                timeout=settings.snmp_timeout,
+                retries=settings.snmp_retries,
+            )
+            self._transport_cache[ip] = transport
+        return transport
+
+    def _get_auth(self, community: str) -> CommunityData:
+        """Get the memoised v2c auth data for a community string."""
+        auth = self._community_cache.get(community)
+        if auth is None:
+            auth = self._community_cache[community] = CommunityData(community)
+        return auth
 
     async def _snmp_get(self, ip: str, community: str, oid: str) -> Any:
         """Perform SNMP GET operation.
 
-        This is a placeholder implementation. In production, use pysnmp:
+        Returns None when the agent does not implement the OID.
+        """
+        try:
+            error_indication, error_status, error_index, var_binds = await get_cmd(
+                self._snmp_engine,
+                self._get_auth(community),
+                await self._get_transport(ip),
+                ContextData(),
+                ObjectType(ObjectIdentity(oid)),
+            )
+        except PySnmpError as e:
+            raise SNMPError(f"{ip} {oid}: {e}") from e
 
-        from pysnmp.hlapi.asyncio import get_cmd, CommunityData, UdpTransportTarget, ObjectType, ObjectIdentity
+        if error_indication:
+            raise SNMPTransportError(f"{ip} {oid}: {error_indication}")
+        if error_status:
+            raise SNMPProtocolError(f"{ip} {oid}: {error_status.prettyPrint()}")
+
+        for var_bind in var_binds:
+            value = var_bind[1]
+            if isinstance(value, (NoSuchInstance, NoSuchObject)):
+                return None
+            return value
 
-        errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
-            snmpEngine,
-            CommunityData(community),
-            UdpTransportTarget((ip, 161), timeout=settings.snmp_timeout, retries=settings.snmp_retries),
-            ObjectType(ObjectIdentity(oid))
-        )
-        """
-        # Placeholder - return simulated values for development
-        if oid == OID_SYSTEM_UPTIME:
-            return 86400  # 1 day in seconds
-        if oid == OID_IF_NUMBER:
-            return 4  # 4 interfaces
         return None
 
     async def _snmp_walk_interfaces(
@@ -253,43 +692,133 @@ class SNMPPoller:
         ip: str,
         community: str,
         if_count: int,
-    ) -> list[dict[str, Any]]:
-        """Walk interface table via SNMP.
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Walk interface table via SNMP GETBULK, yielding rows as they complete.
 
-        This is a placeholder. In production, use pysnmp bulk operations.
+        All ifTable/ifXTable columns travel in the same PDU, so a device needs
+        ceil(ifNumber / max-repetitions) round trips instead of one per column
+        per interface. A row is yielded once every column still being walked
+        has moved past its ifIndex.
         """
-        # Placeholder - return simulated interface data
-        interfaces = []
-        for i in range(1, if_count + 1):
-            interfaces.append({
-                "if_index": i,
-                "name": f"eth{i-1}",
-                "description": f"Ethernet interface {i}",
-                "speed_mbps": 1000,
-                "admin_status": AdminStatus.UP,
-                "oper_status": InterfaceStatus.UP if i < if_count else InterfaceStatus.DOWN,
-                "in_octets": 1000000 * i,
-                "out_octets": 500000 * i,
-                "in_errors": 0,
-                "out_errors": 0,
-            })
-        return interfaces
+        columns = _IF_COLUMN_PREFIXES
+        cursors = dict(columns)
+        rows: dict[int, dict[str, Any]] = {}
+        max_repetitions = max(1, min(if_count, BULK_MAX_REPETITIONS))
+
+        transport = await self._get_transport(ip)
+        auth = self._get_auth(community)
+        context = ContextData()
+
+        while cursors:
+            names = list(cursors)
+            error_indication, error_status, error_index, var_binds = await bulk_cmd(
+                self._snmp_engine,
+                auth,
+                transport,
+                context,
+                0,
+                max_repetitions,
+                *(
+                    _IF_TABLE_COLUMNS[name]
+                    if cursors[name] is columns[name]
+                    else ObjectType(ObjectIdentity(cursors[name]))
+                    for name in names
+                ),
+            )
+
+            if error_indication:
+                raise SNMPTransportError(f"{ip} ifTable walk: {error_indication}")
+            if error_status:
+                raise SNMPProtocolError(f"{ip} ifTable walk: {error_status.prettyPrint()}")
+
+            if not var_binds:
+                break
+
+            done, progressed = _absorb_bulk_response(names, var_binds, cursors, rows)
+            if not progressed:
+                break
+            for name in done:
+                del cursors[name]
+
+            for row in _pop_complete_rows(rows, cursors):
+                yield row
+
+        for if_index in sorted(rows):
+            yield if_index, rows[if_index]
+
+    async def _snmp_get_interface_rows(
+        self,
+        ip: str,
+        community: str,
+        oids: list[tuple[int, ...]],
+    ) -> dict[int, dict[str, Any]] | None:
+        """GET cached interface OIDs in batches of settings.oid_batch_size.
+
+        Batches need more PDUs than a GETBULK walk of the same table, so at
+        most GET_BATCHES_IN_FLIGHT are outstanding per device; in exchange the
+        agent returns exactly the cached instances, with no rows to discard
+        past the end of each column.
+
+        Returns None when any instance has disappeared or the agent rejects a
+        batch, so the caller can fall back to a fresh walk.
+        """
+        transport = await self._get_transport(ip)
+        auth = self._get_auth(community)
+        context = ContextData()
+        batch_size = max(1, settings.oid_batch_size)
+        in_flight = asyncio.Semaphore(GET_BATCHES_IN_FLIGHT)
+
+        async def get_batch(batch: list[tuple[int, ...]]) -> tuple:
+            async with in_flight:
+                return await get_cmd(
+                    self._snmp_engine,
+                    auth,
+                    transport,
+                    context,
+                    *(ObjectType(ObjectIdentity(oid)) for oid in batch),
+                )
+
+        responses = await asyncio.gather(*[
+            get_batch(oids[i:i + batch_size]) for i in range(0, len(oids), batch_size)
+        ])
+
+        rows: dict[int, dict[str, Any]] = {}
+        for error_indication, error_status, _error_index, var_binds in responses:
+            if error_indication:
+                raise SNMPTransportError(f"{ip} interface GET: {error_indication}")
+            if error_status:
+                logger.warning(
+                    "snmp_get_batch_error",
+                    ip=ip,
+                    error=error_status.prettyPrint(),
+                )
+                return None
+            for oid, value in var_binds:
+                if isinstance(value, (NoSuchInstance, NoSuchObject)):
+                    return None
+                arcs = tuple(oid)
+                rows.setdefault(arcs[-1], {})[_COLUMN_BY_PREFIX[arcs[:-1]]] = value
+        return rows
 
     async def _update_device_status(self, device_id: str, status: DeviceStatus) -> None:
         """Update device status in database."""
+        self._last_status[device_id] = status
         async with get_db() as conn:
             repo = DeviceRepository(conn)
             await repo.update_poll_status(device_id, status)
 
 
-async def main() -> None:
+async def main(shard: tuple[int, int] | None = None) -> None:
     """Main entry point for running the poller as a standalone service."""
     configure_logging()
-    logger.info("starting_snmp_poller_service")
+    logger.info("starting_snmp_poller_service", shard=shard)
 
-    await init_db()
+    if shard:
+        await init_db(min_size=WORKER_DB_POOL_MIN, max_size=WORKER_DB_POOL_MAX)
+    else:
+        await init_db()
 
-    poller = SNMPPoller()
+    poller = SNMPPoller(shard)
     await poller.start()
 
     try:
@@ -303,5 +832,55 @@ async def main() -> None:
         await close_db()
 
 
+def _run(shard: tuple[int, int] | None = None) -> None:
+    """Run main() on uvloop when available."""
+    # uvloop ships with uvicorn[standard]; fall back to asyncio where it is unavailable
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main(shard))
+    else:
+        uvloop.run(main(shard))
+
+
+def _worker_main(shard_id: int, num_shards: int) -> None:
+    """Poll one shard of the devices in a child process pinned to one CPU."""
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[shard_id % len(cpus)]})
+    with contextlib.suppress(KeyboardInterrupt):
+        _run((shard_id, num_shards))
+
+
+def run() -> None:
+    """Start the poller, sharded by device id across POLLER_WORKERS processes."""
+    num_workers = settings.poller_workers
+    if num_workers <= 1:
+        _run()
+        return
+
+    # Each worker gets its own event loop, SnmpEngine and DB pool
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(
+            target=_worker_main,
+            args=(shard_id, num_workers),
+            name=f"snmp-poller-{shard_id}",
+        )
+        for shard_id in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
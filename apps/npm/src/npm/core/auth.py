@@ -1,11 +1,10 @@
 """JWT authentication utilities."""
 
-from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
 
 from .config import settings
 from .logging import get_logger
@@ -59,18 +58,17 @@ def verify_token(token: str) -> JWTPayload:
             algorithms=algorithms,
             audience="GridWatch-api",
             issuer="gridwatch-net-enterprise",
+            # jose validates exp itself; require it so tokens without one are rejected
+            options={"require_exp": True},
         )
 
-        # Check expiration
-        exp = payload.get("exp", 0)
-        if datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(timezone.utc):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired",
-            )
-
         return JWTPayload(payload)
 
+    except ExpiredSignatureError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has expired",
+        ) from e
     except JWTError as e:
         logger.warning("jwt_verification_failed", error=str(e))
         raise HTTPException(
@@ -68,6 +68,10 @@ class Settings(BaseSettings):
     snmp_timeout: float = Field(default=5.0, alias="SNMP_TIMEOUT")
     snmp_retries: int = Field(default=3, alias="SNMP_RETRIES")
     max_concurrent_polls: int = Field(default=50, alias="MAX_CONCURRENT_POLLS")
+    device_poll_timeout: float = Field(default=30.0, alias="DEVICE_POLL_TIMEOUT")
+    poller_workers: int = Field(default=1, alias="POLLER_WORKERS")
+    refresh_oids_cache_interval: int = Field(default=3600, alias="REFRESH_OIDS_CACHE_INTERVAL")
+    oid_batch_size: int = Field(default=32, alias="OID_BATCH_SIZE")
 
     # Alerting
     alert_evaluation_interval: int = Field(default=30, alias="ALERT_EVALUATION_INTERVAL")
@@ -14,7 +14,7 @@ logger = get_logger(__name__)
 _pool: Pool | None = None
 
 
-async def init_db() -> None:
+async def init_db(min_size: int | None = None, max_size: int | None = None) -> None:
     """Initialize the database connection pool."""
     global _pool
 
@@ -23,17 +23,20 @@ async def init_db() -> None:
 
     logger.info("initializing_database_pool", url=str(settings.postgres_url).split("@")[-1])
 
+    min_size = min_size or settings.db_pool_min
+    max_size = max_size or settings.db_pool_max
+
     _pool = await asyncpg.create_pool(
         str(settings.postgres_url),
-        min_size=settings.db_pool_min,
-        max_size=settings.db_pool_max,
+        min_size=min_size,
+        max_size=max_size,
         command_timeout=60,
         server_settings={
             "search_path": "npm,shared,public",
         },
     )
 
-    logger.info("database_pool_initialized", min_size=settings.db_pool_min, max_size=settings.db_pool_max)
+    logger.info("database_pool_initialized", min_size=min_size, max_size=max_size)
 
 
 async def close_db() -> None:
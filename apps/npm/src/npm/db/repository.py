@@ -200,17 +200,31 @@ class DeviceRepository:
         row = await self.conn.fetchrow(query, ip_address)
         return Device(**_row_to_dict(row)) if row else None
 
-    async def find_active_for_polling(self) -> list[Device]:
-        """Find all active devices that should be polled."""
-        query = """
+    async def find_active_for_polling(
+        self,
+        shard: tuple[int, int] | None = None,
+    ) -> list[Device]:
+        """Find all active devices that should be polled.
+
+        shard is (shard_id, num_shards); when given, only devices hashing to
+        that shard are returned.
+        """
+        where_sql = "is_active = true"
+        params: list[Any] = []
+        if shard:
+            # hashtext() is a signed int4; shift it non-negative before mod
+            where_sql += " AND mod(hashtext(id::text)::bigint + 2147483648, $1) = $2"
+            params.extend([shard[1], shard[0]])
+
+        query = f"""
             SELECT id, name, ip_address::text, device_type, vendor, model,
                    snmp_version, ssh_enabled, poll_interval, is_active,
                    last_poll, status, created_at, updated_at
             FROM npm.devices
-            WHERE is_active = true
+            WHERE {where_sql}
             ORDER BY last_poll ASC NULLS FIRST
         """
-        rows = await self.conn.fetch(query)
+        rows = await self.conn.fetch(query, *params)
         return [Device(**_row_to_dict(row)) for row in rows]
 
     async def create(self, data: DeviceCreate, snmp_community_encrypted: str | None = None) -> Device:
@@ -406,6 +420,53 @@ class InterfaceRepository:
         )
         return Interface(**_row_to_dict(row))
 
+    async def upsert_many(
+        self,
+        device_id: str,
+        interfaces: list[InterfaceCreate],
+    ) -> dict[int, str]:
+        """Create or update a device's interfaces in one statement.
+
+        Returns a mapping of if_index to interface ID.
+        """
+        if not interfaces:
+            return {}
+
+        query = """
+            INSERT INTO npm.interfaces (
+                device_id, if_index, name, description, mac_address,
+                speed_mbps, admin_status, oper_status
+            )
+            SELECT $1, t.if_index, t.name, t.description, t.mac_address::macaddr,
+                   t.speed_mbps, t.admin_status, t.oper_status
+            FROM unnest(
+                $2::int[], $3::text[], $4::text[], $5::text[],
+                $6::bigint[], $7::text[], $8::text[]
+            ) AS t(if_index, name, description, mac_address, speed_mbps, admin_status, oper_status)
+            ON CONFLICT (device_id, if_index)
+            DO UPDATE SET
+                name = COALESCE(EXCLUDED.name, npm.interfaces.name),
+                description = COALESCE(EXCLUDED.description, npm.interfaces.description),
+                mac_address = COALESCE(EXCLUDED.mac_address, npm.interfaces.mac_address),
+                speed_mbps = COALESCE(EXCLUDED.speed_mbps, npm.interfaces.speed_mbps),
+                admin_status = COALESCE(EXCLUDED.admin_status, npm.interfaces.admin_status),
+                oper_status = COALESCE(EXCLUDED.oper_status, npm.interfaces.oper_status),
+                updated_at = NOW()
+            RETURNING id, if_index
+        """
+        rows = await self.conn.fetch(
+            query,
+            UUID(device_id),
+            [i.if_index for i in interfaces],
+            [i.name for i in interfaces],
+            [i.description for i in interfaces],
+            [i.mac_address for i in interfaces],
+            [i.speed_mbps for i in interfaces],
+            [i.admin_status.value if i.admin_status else None for i in interfaces],
+            [i.oper_status.value if i.oper_status else None for i in interfaces],
+        )
+        return {row["if_index"]: str(row["id"]) for row in rows}
+
     async def update(self, interface_id: str, data: InterfaceUpdate) -> Interface | None:
         """Update an existing interface."""
         updates = []
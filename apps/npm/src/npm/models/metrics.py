@@ -78,8 +78,10 @@ class InterfaceMetrics(BaseModel):
     in_discards: int = 0
     out_discards: int = 0
     speed_mbps: int | None = None
-    in_utilization_pct: float = 0.0
-    out_utilization_pct: float = 0.0
+    in_utilization_pct: float | None = None
+    out_utilization_pct: float | None = None
+    in_rate_bps: float | None = None
+    out_rate_bps: float | None = None
 
 
 class DashboardStats(BaseModel):
@@ -2,6 +2,8 @@
 
 from math import ceil
 
+from shared_python import TTLCache
+
 from ..db import get_db, DeviceRepository, InterfaceRepository, AlertRepository
 from ..models.device import Device, DeviceCreate, DeviceUpdate, DeviceWithInterfaces, DeviceStatus
 from ..models.interface import Interface, InterfaceUpdate
@@ -12,12 +14,21 @@ from .crypto import get_crypto_service
 
 logger = get_logger(__name__)
 
+# Decrypted SNMP communities are reused across poll cycles for this long
+COMMUNITY_CACHE_TTL = 300.0
+
 
 class DeviceService:
     """Service for device operations."""
 
     def __init__(self) -> None:
         self.crypto = get_crypto_service()
+        # Misses are stored as "" so devices without a community skip the DB too
+        self._communities = TTLCache(maxsize=4096, ttl=COMMUNITY_CACHE_TTL)
+
+    def invalidate(self, device_id: str) -> None:
+        """Drop cached per-device lookups after the device changes."""
+        self._communities.invalidate(device_id)
 
     async def list_devices(
         self,
@@ -98,13 +109,19 @@ class DeviceService:
             if hasattr(data, 'snmp_community') and data.snmp_community:
                 snmp_community_encrypted = self.crypto.encrypt(data.snmp_community)
 
-            return await repo.update(device_id, data, snmp_community_encrypted)
+            device = await repo.update(device_id, data, snmp_community_encrypted)
+
+        self.invalidate(device_id)
+        return device
 
     async def delete_device(self, device_id: str) -> bool:
         """Delete a device by ID."""
         async with get_db() as conn:
             repo = DeviceRepository(conn)
-            return await repo.delete(device_id)
+            deleted = await repo.delete(device_id)
+
+        self.invalidate(device_id)
+        return deleted
 
     async def get_device_interfaces(self, device_id: str) -> list[Interface]:
         """Get all interfaces for a device."""
@@ -151,20 +168,30 @@ class DeviceService:
             repo = AlertRepository(conn)
             return await repo.update_status(alert_id, AlertStatus.RESOLVED)
 
-    async def get_active_devices_for_polling(self) -> list[Device]:
+    async def get_active_devices_for_polling(
+        self,
+        shard: tuple[int, int] | None = None,
+    ) -> list[Device]:
         """Get all active devices that should be polled."""
         async with get_db() as conn:
             repo = DeviceRepository(conn)
-            return await repo.find_active_for_polling()
+            return await repo.find_active_for_polling(shard)
 
     async def get_snmp_community(self, device_id: str) -> str | None:
         """Get decrypted SNMP community string for a device."""
+        cached = self._communities.get(device_id)
+        if cached is not None:
+            return cached or None
+
+        community = None
         async with get_db() as conn:
             query = "SELECT snmp_community_encrypted FROM npm.devices WHERE id = $1"
             row = await conn.fetchrow(query, device_id)
             if row and row["snmp_community_encrypted"]:
                 try:
-                    return self.crypto.decrypt(row["snmp_community_encrypted"])
+                    community = self.crypto.decrypt(row["snmp_community_encrypted"])
                 except Exception:
                     logger.warning("failed_to_decrypt_snmp_community", device_id=device_id)
-            return None
+
+        self._communities.set(device_id, community or "")
+        return community
@@ -1,5 +1,7 @@
 """Metrics service for VictoriaMetrics integration."""
 
+import time
+
 import httpx
 from datetime import datetime, timezone, timedelta
 from typing import Any
@@ -31,17 +33,97 @@ def escape_label_value(value: str) -> str:
     )
 
 
+def device_metric_lines(
+    device_id: str,
+    device_name: str,
+    metrics: DeviceMetrics,
+    timestamp: int,
+) -> list[str]:
+    """Render device-level metrics in Prometheus text format."""
+    # Escape label values to prevent metric format corruption
+    labels = (
+        f'device_id="{escape_label_value(device_id)}",'
+        f'device_name="{escape_label_value(device_name)}"'
+    )
+    return [
+        f"npm_device_cpu_utilization{{{labels}}} {metrics.cpu_utilization or 0} {timestamp}",
+        f"npm_device_memory_utilization{{{labels}}} {metrics.memory_utilization or 0} {timestamp}",
+        f"npm_device_uptime_seconds{{{labels}}} {metrics.uptime_seconds or 0} {timestamp}",
+        f"npm_device_interfaces_total{{{labels}}} {metrics.interface_count} {timestamp}",
+        f"npm_device_interfaces_up{{{labels}}} {metrics.interface_up_count} {timestamp}",
+        f"npm_device_interfaces_down{{{labels}}} {metrics.interface_down_count} {timestamp}",
+    ]
+
+
+def interface_metric_lines(
+    interface_id: str,
+    device_id: str,
+    interface_name: str,
+    metrics: InterfaceMetrics,
+    timestamp: int,
+) -> list[str]:
+    """Render one interface's metrics in Prometheus text format."""
+    # Escape label values to prevent metric format corruption
+    labels = (
+        f'interface_id="{escape_label_value(interface_id)}",'
+        f'device_id="{escape_label_value(device_id)}",'
+        f'interface_name="{escape_label_value(interface_name)}"'
+    )
+    lines = [
+        f"npm_interface_in_octets{{{labels}}} {metrics.in_octets} {timestamp}",
+        f"npm_interface_out_octets{{{labels}}} {metrics.out_octets} {timestamp}",
+        f"npm_interface_in_errors{{{labels}}} {metrics.in_errors} {timestamp}",
+        f"npm_interface_out_errors{{{labels}}} {metrics.out_errors} {timestamp}",
+    ]
+    # Rates and utilization are only present when the poller could derive them
+    if metrics.in_utilization_pct is not None and metrics.out_utilization_pct is not None:
+        lines.append(
+            f"npm_interface_in_utilization{{{labels}}} {metrics.in_utilization_pct} {timestamp}"
+        )
+        lines.append(
+            f"npm_interface_out_utilization{{{labels}}} {metrics.out_utilization_pct} {timestamp}"
+        )
+    if metrics.in_rate_bps is not None and metrics.out_rate_bps is not None:
+        lines.append(f"npm_interface_in_bps{{{labels}}} {metrics.in_rate_bps} {timestamp}")
+        lines.append(f"npm_interface_out_bps{{{labels}}} {metrics.out_rate_bps} {timestamp}")
+    return lines
+
+
+# Keep one pooled keep-alive connection per concurrent device poll so
+# per-device pushes reuse sockets instead of reconnecting
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=settings.max_concurrent_polls,
+    keepalive_expiry=60.0,
+)
+
+
 class MetricsService:
     """Service for pushing and querying metrics from VictoriaMetrics."""
 
     def __init__(self) -> None:
         self.base_url = settings.victoria_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, limits=HTTP_LIMITS)
 
     async def close(self) -> None:
         """Close the HTTP client."""
         await self.client.aclose()
 
+    async def push_batch(self, lines: list[str]) -> None:
+        """Push pre-rendered Prometheus lines to VictoriaMetrics in one request."""
+        if not lines:
+            return
+
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/api/v1/import/prometheus",
+                content="\n".join(lines).encode(),
+                headers={"Content-Type": "text/plain"},
+            )
+            response.raise_for_status()
+            logger.debug("metrics_batch_pushed", lines=len(lines))
+        except httpx.HTTPError as e:
+            logger.warning("metrics_batch_push_failed", lines=len(lines), error=str(e))
+
     async def push_device_metrics(
         self,
         device_id: str,
@@ -49,20 +131,9 @@ class MetricsService:
         metrics: DeviceMetrics,
     ) -> None:
         """Push device metrics to VictoriaMetrics."""
-        timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
-
-        # Escape label values to prevent metric format corruption
-        safe_device_id = escape_label_value(device_id)
-        safe_device_name = escape_label_value(device_name)
-
-        metric_lines = [
-            f'npm_device_cpu_utilization{{device_id="{safe_device_id}",device_name="{safe_device_name}"}} {metrics.cpu_utilization or 0} {timestamp}',
-            f'npm_device_memory_utilization{{device_id="{safe_device_id}",device_name="{safe_device_name}"}} {metrics.memory_utilization or 0} {timestamp}',
-            f'npm_device_uptime_seconds{{device_id="{safe_device_id}",device_name="{safe_device_name}"}} {metrics.uptime_seconds or 0} {timestamp}',
-            f'npm_device_interfaces_total{{device_id="{safe_device_id}",device_name="{safe_device_name}"}} {metrics.interface_count} {timestamp}',
-            f'npm_device_interfaces_up{{device_id="{safe_device_id}",device_name="{safe_device_name}"}} {metrics.interface_up_count} {timestamp}',
-            f'npm_device_interfaces_down{{device_id="{safe_device_id}",device_name="{safe_device_name}"}} {metrics.interface_down_count} {timestamp}',
-        ]
+        timestamp = int(time.time() * 1000)
+
+        metric_lines = device_metric_lines(device_id, device_name, metrics, timestamp)
 
         try:
             response = await self.client.post(
@@ -83,21 +154,10 @@ class MetricsService:
         metrics: InterfaceMetrics,
     ) -> None:
         """Push interface metrics to VictoriaMetrics."""
-        timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
-
-        # Escape label values to prevent metric format corruption
-        safe_interface_id = escape_label_value(interface_id)
-        safe_device_id = escape_label_value(device_id)
-        safe_interface_name = escape_label_value(interface_name)
-
-        metric_lines = [
-            f'npm_interface_in_octets{{interface_id="{safe_interface_id}",device_id="{safe_device_id}",interface_name="{safe_interface_name}"}} {metrics.in_octets} {timestamp}',
-            f'npm_interface_out_octets{{interface_id="{safe_interface_id}",device_id="{safe_device_id}",interface_name="{safe_interface_name}"}} {metrics.out_octets} {timestamp}',
-            f'npm_interface_in_errors{{interface_id="{safe_interface_id}",device_id="{safe_device_id}",interface_name="{safe_interface_name}"}} {metrics.in_errors} {timestamp}',
-            f'npm_interface_out_errors{{interface_id="{safe_interface_id}",device_id="{safe_device_id}",interface_name="{safe_interface_name}"}} {metrics.out_errors} {timestamp}',
-            f'npm_interface_in_utilization{{interface_id="{safe_interface_id}",device_id="{safe_device_id}",interface_name="{safe_interface_name}"}} {metrics.in_utilization_pct} {timestamp}',
-            f'npm_interface_out_utilization{{interface_id="{safe_interface_id}",device_id="{safe_device_id}",interface_name="{safe_interface_name}"}} {metrics.out_utilization_pct} {timestamp}',
-        ]
+        timestamp = int(time.time() * 1000)
+        metric_lines = interface_metric_lines(
+            interface_id, device_id, interface_name, metrics, timestamp
+        )
 
         try:
             response = await self.client.post(
@@ -0,0 +1,94 @@
+"""Tests for interface counter rate derivation in the SNMP poller."""
+
+from collections import deque
+
+import pytest
+
+from npm.collectors.snmp_poller import (
+    COUNTER_HISTORY_SIZE,
+    _counter_rates,
+    _estimate_mib_period,
+    _record_counters,
+)
+
+
+def _simulate(
+    poll_interval: float,
+    mib_period: float,
+    bytes_per_second: float,
+    polls: int,
+) -> list[tuple[float, float] | None]:
+    """Poll an agent that refreshes its counters every mib_period seconds."""
+    history: deque[tuple[float, int, int]] = deque(maxlen=COUNTER_HISTORY_SIZE)
+    results = []
+    for i in range(polls):
+        now = i * poll_interval
+        # Counters as of the agent's last refresh
+        refreshed_at = (now // mib_period) * mib_period
+        octets = int(refreshed_at * bytes_per_second)
+        _record_counters(history, now, octets, octets)
+        results.append(_counter_rates(history, now))
+    return results
+
+
+class TestRecordCounters:
+    def test_unchanged_counters_are_not_recorded(self):
+        history = deque(maxlen=COUNTER_HISTORY_SIZE)
+        _record_counters(history, 0.0, 100, 200)
+        _record_counters(history, 5.0, 100, 200)
+        assert list(history) == [(0.0, 100, 200)]
+
+    def test_either_direction_moving_is_a_change(self):
+        history = deque(maxlen=COUNTER_HISTORY_SIZE)
+        _record_counters(history, 0.0, 100, 200)
+        _record_counters(history, 5.0, 100, 300)
+        assert len(history) == 2
+
+    def test_counter_reset_starts_over(self):
+        history = deque(maxlen=COUNTER_HISTORY_SIZE)
+        _record_counters(history, 0.0, 1000, 1000)
+        _record_counters(history, 5.0, 2000, 2000)
+        _record_counters(history, 10.0, 10, 10)
+        assert list(history) == [(10.0, 10, 10)]
+
+
+class TestEstimateMibPeriod:
+    def test_needs_two_change_points(self):
+        assert _estimate_mib_period(deque([(0.0, 0, 0)])) is None
+
+    def test_median_gap_between_change_points(self):
+        history = deque([(0.0, 0, 0), (10.0, 1, 1), (20.0, 2, 2), (45.0, 3, 3)])
+        assert _estimate_mib_period(history) == 10.0
+
+
+class TestCounterRates:
+    def test_unknown_until_two_change_points(self):
+        history = deque([(0.0, 0, 0)])
+        assert _counter_rates(history, 5.0) is None
+
+    def test_rate_spans_oldest_to_newest_change_point(self):
+        history = deque([(0.0, 0, 0), (10.0, 1000, 2000)])
+        assert _counter_rates(history, 10.0) == (800.0, 1600.0)
+
+    def test_fast_polling_against_slow_agent_keeps_emitting_rates(self):
+        # 5s polls against a 10s P_MIB at 1000 B/s
+        results = _simulate(poll_interval=5.0, mib_period=10.0, bytes_per_second=1000, polls=20)
+        steady = results[4:]
+        assert all(rate is not None for rate in steady)
+        for in_bps, out_bps in steady:
+            assert in_bps == pytest.approx(8000.0)
+            assert out_bps == pytest.approx(8000.0)
+
+    def test_polling_slower_than_agent_refresh(self):
+        results = _simulate(poll_interval=10.0, mib_period=1.0, bytes_per_second=500, polls=10)
+        for in_bps, _ in results[2:]:
+            assert in_bps == pytest.approx(4000.0)
+
+    def test_idle_interface_reports_zero_not_unknown(self):
+        history = deque([(0.0, 0, 0), (10.0, 1000, 1000), (20.0, 2000, 2000)])
+        # Counters have not moved for well over MIB_PERIOD_MULTIPLIER periods
+        assert _counter_rates(history, 100.0) == (0.0, 0.0)
+
+    def test_quiet_within_one_period_keeps_last_rate(self):
+        history = deque([(0.0, 0, 0), (10.0, 1000, 1000), (20.0, 2000, 2000)])
+        assert _counter_rates(history, 25.0) == (800.0, 800.0)
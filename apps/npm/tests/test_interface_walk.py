@@ -0,0 +1,118 @@
+"""Tests for the multi-column GETBULK interface walk parser."""
+
+import bisect
+from typing import Any
+
+from npm.collectors.snmp_poller import (
+    _IF_COLUMN_PREFIXES,
+    _absorb_bulk_response,
+    _pop_complete_rows,
+)
+
+# Arcs just past ifTable/ifXTable, standing in for whatever the agent
+# returns after the last interface column
+_PAST_TABLES = (1, 3, 6, 1, 2, 1, 99)
+
+
+def _agent_mib(if_indexes: dict[str, list[int]]) -> list[tuple[tuple[int, ...], Any]]:
+    """Build a sorted MIB view with the given ifIndexes populated per column."""
+    mib = [
+        (_IF_COLUMN_PREFIXES[name] + (if_index,), f"{name}.{if_index}")
+        for name, indexes in if_indexes.items()
+        for if_index in indexes
+    ]
+    mib.append((_PAST_TABLES, "beyond"))
+    return sorted(mib)
+
+
+def _getbulk(
+    mib: list[tuple[tuple[int, ...], Any]],
+    starts: list[tuple[int, ...]],
+    max_repetitions: int,
+) -> list[tuple[tuple[int, ...], Any]]:
+    """Answer a GETBULK the way an agent does: row-major lexicographic successors."""
+    oids = [oid for oid, _ in mib]
+    positions = [bisect.bisect_right(oids, start) for start in starts]
+    var_binds = []
+    for rep in range(max_repetitions):
+        for pos in positions:
+            i = pos + rep
+            var_binds.append(mib[i] if i < len(mib) else (_PAST_TABLES, "endOfMibView"))
+    return var_binds
+
+
+def _walk(mib, max_repetitions: int) -> list[tuple[int, dict[str, Any]]]:
+    """Drive the parser the way _snmp_walk_interfaces does."""
+    cursors = dict(_IF_COLUMN_PREFIXES)
+    rows: dict[int, dict[str, Any]] = {}
+    yielded = []
+    while cursors:
+        names = list(cursors)
+        var_binds = _getbulk(mib, [cursors[n] for n in names], max_repetitions)
+        done, progressed = _absorb_bulk_response(names, var_binds, cursors, rows)
+        if not progressed:
+            break
+        for name in done:
+            del cursors[name]
+        yielded.extend(_pop_complete_rows(rows, cursors))
+    yielded.extend(sorted(rows.items()))
+    return yielded
+
+
+def test_walk_yields_every_row_once_and_complete() -> None:
+    indexes = [1, 2, 3, 10, 11, 1001]
+    mib = _agent_mib(dict.fromkeys(_IF_COLUMN_PREFIXES, indexes))
+
+    rows = _walk(mib, max_repetitions=4)
+
+    assert [if_index for if_index, _ in rows] == indexes
+    for if_index, columns in rows:
+        assert set(columns) == set(_IF_COLUMN_PREFIXES)
+        assert columns["ifDescr"] == f"ifDescr.{if_index}"
+
+
+def test_walk_handles_sparse_columns() -> None:
+    # ifAlias is only populated on some interfaces; rows must still come out
+    # once, with the columns the agent has
+    full = [1, 2, 3, 4, 5]
+    layout = dict.fromkeys(_IF_COLUMN_PREFIXES, full)
+    layout["ifAlias"] = [2, 5]
+    mib = _agent_mib(layout)
+
+    rows = dict(_walk(mib, max_repetitions=2))
+
+    assert sorted(rows) == full
+    assert "ifAlias" in rows[2] and "ifAlias" in rows[5]
+    assert "ifAlias" not in rows[1]
+
+
+def test_absorb_marks_columns_that_leave_their_subtree() -> None:
+    names = ["ifDescr", "ifType"]
+    cursors = {name: _IF_COLUMN_PREFIXES[name] for name in names}
+    rows: dict[int, dict[str, Any]] = {}
+    var_binds = [
+        (_IF_COLUMN_PREFIXES["ifDescr"] + (1,), "eth0"),
+        (_IF_COLUMN_PREFIXES["ifType"] + (1,), 6),
+        # ifDescr ran into the next column; ifType hit the end of the MIB
+        (_IF_COLUMN_PREFIXES["ifType"] + (1,), 6),
+        (_PAST_TABLES, "endOfMibView"),
+    ]
+
+    done, progressed = _absorb_bulk_response(names, var_binds, cursors, rows)
+
+    assert progressed
+    assert done == {"ifDescr", "ifType"}
+    assert rows == {1: {"ifDescr": "eth0", "ifType": 6}}
+    assert cursors["ifDescr"] == _IF_COLUMN_PREFIXES["ifDescr"] + (1,)
+
+
+def test_pop_complete_rows_waits_for_the_slowest_column() -> None:
+    rows = {1: {"ifDescr": "a"}, 2: {"ifDescr": "b"}, 3: {"ifDescr": "c"}}
+    cursors = {
+        "ifDescr": _IF_COLUMN_PREFIXES["ifDescr"] + (3,),
+        "ifType": _IF_COLUMN_PREFIXES["ifType"] + (2,),
+    }
+
+    assert [i for i, _ in _pop_complete_rows(rows, cursors)] == [1, 2]
+    assert list(rows) == [3]
+    assert [i for i, _ in _pop_complete_rows(rows, {})] == [3]
@@ -4,7 +4,8 @@ from typing import Annotated
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File, Form, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+from shared_python import json_response
 
 from ..core.auth import get_current_user, require_role, UserContext
 from ..core.config import settings
@@ -79,7 +80,7 @@ async def list_targets(
     platform: str | None = None,
     is_active: bool | None = None,
     search: str | None = None,
-) -> PaginatedResponse[Target]:
+) -> Response:
     """List STIG targets with pagination and filtering."""
     await get_current_user(request)
 
@@ -93,14 +94,16 @@ async def list_targets(
 
     total_pages = (total + per_page - 1) // per_page
 
-    return PaginatedResponse(
-        data=targets,
-        pagination=Pagination(
-            page=page,
-            per_page=per_page,
-            total=total,
-            total_pages=total_pages,
-        ),
+    return json_response(
+        PaginatedResponse[Target](
+            data=targets,
+            pagination=Pagination(
+                page=page,
+                per_page=per_page,
+                total=total,
+                total_pages=total_pages,
+            ),
+        )
     )
 
 
@@ -183,7 +186,7 @@ async def list_target_definitions(
     request: Request,
     target_id: str,
     enabled_only: bool = False,
-) -> APIResponse[list[TargetDefinitionWithCompliance]]:
+) -> Response:
     """List all STIG definitions assigned to a target.
 
     Returns STIGs assigned to the target with compliance info from the last audit.
@@ -210,7 +213,7 @@ async def list_target_definitions(
         enabled_only=enabled_only,
     )
 
-    return APIResponse(data=definitions)
+    return json_response(APIResponse[list[TargetDefinitionWithCompliance]](data=definitions))
 
 
 @router.post("/targets/{target_id}/definitions", response_model=APIResponse[TargetDefinition], status_code=status.HTTP_201_CREATED)
@@ -232,46 +235,42 @@ async def assign_stig_to_target(
     Returns:
         The created assignment
     """
-    # Verify target exists
-    target = await TargetRepository.get_by_id(target_id)
-    if not target:
+    try:
+        assignment, result = await TargetDefinitionRepository.create_if_absent(target_id, data)
+    except Exception as e:
+        logger.error("stig_assignment_failed", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to assign STIG: {str(e)}",
+        )
+
+    if result == "target_missing":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Target not found: {target_id}",
         )
-
-    # Verify definition exists
-    definition = await DefinitionRepository.get_by_id(data.definition_id)
-    if not definition:
+    if result == "definition_missing":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"STIG definition not found: {data.definition_id}",
         )
-
-    # Check for existing assignment
-    existing = await TargetDefinitionRepository.get(target_id, data.definition_id)
-    if existing:
+    if result == "duplicate":
+        # Only the conflict message needs the title, so fetch it on this path alone
+        definition = await DefinitionRepository.get_by_id(data.definition_id)
+        title = definition.title if definition else data.definition_id
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"STIG '{definition.title}' is already assigned to this target",
+            detail=f"STIG '{title}' is already assigned to this target",
         )
 
-    try:
-        assignment = await TargetDefinitionRepository.create(target_id, data)
-        logger.info(
-            "stig_assigned_to_target",
-            target_id=target_id,
-            definition_id=data.definition_id,
-            is_primary=data.is_primary,
-            user=user.username if user else None,
-        )
-        return APIResponse(data=assignment)
-    except Exception as e:
-        logger.error("stig_assignment_failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to assign STIG: {str(e)}",
-        )
+    logger.info(
+        "stig_assigned_to_target",
+        target_id=target_id,
+        definition_id=data.definition_id,
+        is_primary=data.is_primary,
+        user=user.username if user else None,
+    )
+    return APIResponse(data=assignment)
 
 
 @router.post("/targets/{target_id}/definitions/bulk", response_model=APIResponse[BulkAssignmentResponse])
@@ -303,13 +302,13 @@ async def bulk_assign_stigs_to_target(
         )
 
     # Verify all definitions exist
-    for def_id in data.definition_ids:
-        definition = await DefinitionRepository.get_by_id(def_id)
-        if not definition:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"STIG definition not found: {def_id}",
-            )
+    existing = await DefinitionRepository.get_existing_ids(data.definition_ids)
+    missing = set(data.definition_ids) - existing
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"STIG definitions not found: {sorted(missing)}",
+        )
 
     assigned, skipped = await TargetDefinitionRepository.bulk_assign(
         target_id=target_id,
@@ -327,6 +326,7 @@ async def bulk_assign_stigs_to_target(
 
     return APIResponse(
         data=BulkAssignmentResponse(
+            target_id=target_id,
             assigned=assigned,
             skipped=skipped,
             total=len(data.definition_ids),
@@ -453,25 +453,27 @@ async def start_audit_all(
     group_data = AuditGroupCreate(name=group_name, target_id=target_id)
     group = await AuditGroupRepository.create(group_data, user.id if user else None)
 
-    # Create individual audit jobs for each STIG
+    # Create the audit jobs for every STIG in one INSERT
+    jobs = [
+        AuditJobCreate(
+            name=f"{td.stig_title} - {target.name}",
+            target_id=target_id,
+            definition_id=td.definition_id,
+            audit_group_id=group.id,
+        )
+        for td in definitions
+    ]
     jobs_created = 0
-    for td in definitions:
-        try:
-            job = await audit_service.start_audit(
-                target_id=target_id,
-                definition_id=td.definition_id,
-                name=f"{td.stig_title} - {target.name}",
-                created_by=user.id if user else None,
-                audit_group_id=group.id,
-            )
-            jobs_created += 1
-        except Exception as e:
-            logger.error(
-                "audit_job_creation_failed",
-                group_id=group.id,
-                definition_id=td.definition_id,
-                error=str(e),
-            )
+    try:
+        created = await audit_service.start_audits_bulk(jobs, user.id if user else None)
+        jobs_created = len(created)
+    except Exception as e:
+        logger.error(
+            "audit_job_creation_failed",
+            group_id=group.id,
+            definition_ids=[td.definition_id for td in definitions],
+            error=str(e),
+        )
 
     logger.info(
         "audit_all_started",
@@ -616,24 +618,21 @@ async def get_audit_group_summary(
     total_not_reviewed = 0
     stig_summaries = []
 
-    for job in jobs:
-        if job["status"] == "completed":
-            summary = await audit_service.get_compliance_summary(job["id"])
-            if summary:
-                total_checks += summary.total_checks
-                total_passed += summary.passed
-                total_failed += summary.failed
-                total_not_applicable += summary.not_applicable
-                total_not_reviewed += summary.not_reviewed
-
-                stig_summaries.append({
-                    "stig_id": job["stig_id"],
-                    "stig_title": job["stig_title"],
-                    "compliance_score": summary.compliance_score,
-                    "total_checks": summary.total_checks,
-                    "passed": summary.passed,
-                    "failed": summary.failed,
-                })
+    for summary in await audit_service.get_compliance_summaries_for_group(group_id):
+        total_checks += summary["total"]
+        total_passed += summary["passed"]
+        total_failed += summary["failed"]
+        total_not_applicable += summary["not_applicable"]
+        total_not_reviewed += summary["not_reviewed"]
+
+        stig_summaries.append({
+            "stig_id": summary["stig_id"],
+            "stig_title": summary["stig_title"],
+            "compliance_score": summary["compliance_score"],
+            "total_checks": summary["total"],
+            "passed": summary["passed"],
+            "failed": summary["failed"],
+        })
 
     # Calculate overall compliance
     overall_score = 0.0
@@ -107,6 +107,10 @@ def require_role(*allowed_roles: Role) -> Callable:
     Returns:
         Decorator function
     """
+    # Built once at decoration time; each request does a single set lookup
+    allowed = frozenset(allowed_roles)
+    required = ", ".join(allowed_roles)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -125,7 +129,7 @@ def require_role(*allowed_roles: Role) -> Callable:
 
             user = await get_current_user(request)
 
-            if user.role not in allowed_roles:
+            if user.role not in allowed:
                 logger.warning(
                     "access_denied",
                     user_id=user.id,
@@ -134,7 +138,7 @@ def require_role(*allowed_roles: Role) -> Callable:
                 )
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Requires role: {', '.join(allowed_roles)}",
+                    detail=f"Requires role: {required}",
                 )
 
             kwargs["user"] = user
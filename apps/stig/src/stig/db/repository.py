@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 import asyncpg
 
@@ -369,6 +369,19 @@ class DefinitionRepository:
             updated_at=row["updated_at"],
         )
 
+    @staticmethod
+    async def get_existing_ids(definition_ids: list[str]) -> set[str]:
+        """Return the subset of definition IDs that exist."""
+        pool = get_pool()
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT id FROM stig.definitions WHERE id = ANY($1::uuid[])",
+                definition_ids,
+            )
+
+        return {str(row["id"]) for row in rows}
+
     @staticmethod
     async def count() -> int:
         """Get total count of definitions."""
@@ -563,6 +576,56 @@ class AuditJobRepository:
             audit_group_id=str(row["audit_group_id"]) if row["audit_group_id"] else None,
         )
 
+    @staticmethod
+    async def create_many(
+        jobs: list[AuditJobCreate],
+        created_by: str | None = None,
+    ) -> list[AuditJob]:
+        """Create several audit jobs in a single INSERT."""
+        if not jobs:
+            return []
+
+        pool = get_pool()
+
+        # Generate names for jobs that don't have one
+        default_name = f"Audit-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                INSERT INTO stig.audit_jobs (name, target_id, definition_id, created_by, audit_group_id)
+                SELECT t.name, t.target_id, t.definition_id, $4, t.audit_group_id
+                FROM unnest($1::text[], $2::uuid[], $3::uuid[], $5::uuid[])
+                    AS t(name, target_id, definition_id, audit_group_id)
+                RETURNING id, name, target_id, definition_id, status, started_at,
+                          completed_at, created_by, error_message, created_at, audit_group_id
+                """,
+                [job.name or default_name for job in jobs],
+                [job.target_id for job in jobs],
+                [job.definition_id for job in jobs],
+                created_by,
+                [job.audit_group_id for job in jobs],
+            )
+
+        logger.info("audit_jobs_created", count=len(rows))
+
+        return [
+            AuditJob(
+                id=str(row["id"]),
+                name=row["name"],
+                target_id=str(row["target_id"]),
+                definition_id=str(row["definition_id"]),
+                status=AuditStatus(row["status"]),
+                started_at=row["started_at"],
+                completed_at=row["completed_at"],
+                created_by=str(row["created_by"]) if row["created_by"] else None,
+                error_message=row["error_message"],
+                created_at=row["created_at"],
+                audit_group_id=str(row["audit_group_id"]) if row["audit_group_id"] else None,
+            )
+            for row in rows
+        ]
+
     @staticmethod
     async def update_status(
         job_id: str,
@@ -970,17 +1033,42 @@ class TargetDefinitionRepository:
         )
 
     @staticmethod
-    async def create(target_id: str, data: TargetDefinitionCreate) -> TargetDefinition:
-        """Create a new target-STIG assignment."""
+    async def create_if_absent(
+        target_id: str,
+        data: TargetDefinitionCreate,
+    ) -> tuple[
+        TargetDefinition | None,
+        Literal["created", "target_missing", "definition_missing", "duplicate"],
+    ]:
+        """Create a target-STIG assignment in one round trip.
+
+        Target and definition existence checks and the conflict check all run
+        in the same statement; the status says which one, if any, failed.
+        """
         pool = get_pool()
 
         async with pool.acquire() as conn:
             row = await conn.fetchrow(
                 """
-                INSERT INTO stig.target_definitions
-                    (target_id, definition_id, is_primary, enabled, notes)
-                VALUES ($1, $2, $3, $4, $5)
-                RETURNING id, target_id, definition_id, is_primary, enabled, notes, created_at, updated_at
+                WITH t AS (
+                    SELECT id FROM stig.targets WHERE id = $1
+                ),
+                d AS (
+                    SELECT id FROM stig.definitions WHERE id = $2
+                ),
+                ins AS (
+                    INSERT INTO stig.target_definitions
+                        (target_id, definition_id, is_primary, enabled, notes)
+                    SELECT t.id, d.id, $3, $4, $5 FROM t, d
+                    ON CONFLICT (target_id, definition_id) DO NOTHING
+                    RETURNING id, target_id, definition_id, is_primary, enabled, notes, created_at, updated_at
+                )
+                SELECT
+                    EXISTS (SELECT 1 FROM t) AS target_exists,
+                    EXISTS (SELECT 1 FROM d) AS definition_exists,
+                    ins.*
+                FROM (SELECT 1) AS one
+                LEFT JOIN ins ON true
                 """,
                 target_id,
                 data.definition_id,
@@ -989,6 +1077,13 @@ class TargetDefinitionRepository:
                 data.notes,
             )
 
+        if not row["target_exists"]:
+            return None, "target_missing"
+        if not row["definition_exists"]:
+            return None, "definition_missing"
+        if row["id"] is None:
+            return None, "duplicate"
+
         return TargetDefinition(
             id=str(row["id"]),
             target_id=str(row["target_id"]),
@@ -998,7 +1093,7 @@ class TargetDefinitionRepository:
             notes=row["notes"],
             created_at=row["created_at"],
             updated_at=row["updated_at"],
-        )
+        ), "created"
 
     @staticmethod
     async def update(
@@ -1207,6 +1302,45 @@ class AuditGroupRepository:
             for row in rows
         ]
 
+    @staticmethod
+    async def get_result_counts(group_id: str) -> list[dict]:
+        """Get result status counts for every completed job in a group."""
+        pool = get_pool()
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT
+                    aj.id as job_id, d.stig_id, d.title as stig_title,
+                    COUNT(r.id) FILTER (WHERE r.status = 'pass') as passed,
+                    COUNT(r.id) FILTER (WHERE r.status = 'fail') as failed,
+                    COUNT(r.id) FILTER (WHERE r.status = 'not_applicable') as not_applicable,
+                    COUNT(r.id) FILTER (WHERE r.status = 'not_reviewed') as not_reviewed,
+                    COUNT(r.id) as total
+                FROM stig.audit_jobs aj
+                JOIN stig.definitions d ON aj.definition_id = d.id
+                LEFT JOIN stig.audit_results r ON r.job_id = aj.id
+                WHERE aj.audit_group_id = $1 AND aj.status = 'completed'
+                GROUP BY aj.id, d.stig_id, d.title
+                ORDER BY d.title
+                """,
+                group_id,
+            )
+
+        return [
+            {
+                "job_id": str(row["job_id"]),
+                "stig_id": row["stig_id"],
+                "stig_title": row["stig_title"],
+                "passed": row["passed"],
+                "failed": row["failed"],
+                "not_applicable": row["not_applicable"],
+                "not_reviewed": row["not_reviewed"],
+                "total": row["total"],
+            }
+            for row in rows
+        ]
+
     @staticmethod
     async def list_by_target(
         target_id: str,
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
 
 from .audit import AuditStatus
 
@@ -150,6 +152,26 @@ class BulkAssignmentRequest(BaseModel):
         description="Which definition to set as primary (must be in definition_ids)"
     )
 
+    @field_validator("definition_ids")
+    @classmethod
+    def normalize_definition_ids(cls, v: list[str]) -> list[str]:
+        """Canonicalize UUIDs so they compare equal to the IDs Postgres returns."""
+        try:
+            return [str(UUID(d)) for d in v]
+        except ValueError:
+            raise ValueError("definition_ids must contain valid UUIDs") from None
+
+    @field_validator("primary_id")
+    @classmethod
+    def normalize_primary_id(cls, v: str | None) -> str | None:
+        """Canonicalize the primary UUID to match definition_ids."""
+        if v is None:
+            return v
+        try:
+            return str(UUID(v))
+        except ValueError:
+            raise ValueError(f"Invalid UUID: {v}") from None
+
 
 class BulkAssignmentResponse(BaseModel):
     """Response from bulk assignment operation."""
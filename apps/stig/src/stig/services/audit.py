@@ -13,6 +13,7 @@ from ..db.repository import (
     DefinitionRepository,
     AuditJobRepository,
     AuditResultRepository,
+    AuditGroupRepository,
 )
 from ..models import (
     AuditJob,
@@ -97,8 +98,43 @@ class AuditService:
             audit_group_id=audit_group_id,
         )
         job = await AuditJobRepository.create(job_data, created_by)
+        await self._dispatch(job)
 
-        # Submit to NATS for processing
+        return job
+
+    async def start_audits_bulk(
+        self,
+        jobs: list[AuditJobCreate],
+        created_by: str | None = None,
+    ) -> list[AuditJob]:
+        """Create several audit jobs in one INSERT, then dispatch them.
+
+        Args:
+            jobs: Jobs to create; definitions must already exist
+            created_by: User ID who started the audits
+
+        Returns:
+            Created audit jobs
+
+        Raises:
+            ValueError: If a target is not found or not active
+        """
+        for target_id in {job.target_id for job in jobs}:
+            target = await TargetRepository.get_by_id(target_id)
+            if not target:
+                raise ValueError(f"Target not found: {target_id}")
+            if not target.is_active:
+                raise ValueError(f"Target is not active: {target_id}")
+
+        created = await AuditJobRepository.create_many(jobs, created_by)
+
+        # Dispatch only after the insert has committed
+        await asyncio.gather(*(self._dispatch(job) for job in created))
+
+        return created
+
+    async def _dispatch(self, job: AuditJob) -> None:
+        """Submit a created job to NATS, or run it in-process without NATS."""
         if self._js:
             try:
                 await self._js.publish(
@@ -116,8 +152,6 @@ class AuditService:
             # Run synchronously for development/testing
             asyncio.create_task(self._run_audit_sync(job.id))
 
-        return job
-
     async def _run_audit_sync(self, job_id: str) -> None:
         """Run audit synchronously (for development without NATS)."""
         try:
@@ -200,6 +234,26 @@ class AuditService:
             job_id, page, per_page, status, severity
         )
 
+    async def get_compliance_summaries_for_group(self, group_id: str) -> list[dict]:
+        """Get per-STIG result counts for the completed jobs in an audit group.
+
+        Args:
+            group_id: ID of the audit group
+
+        Returns:
+            One entry per completed job, with its compliance score
+        """
+        summaries = await AuditGroupRepository.get_result_counts(group_id)
+
+        for summary in summaries:
+            # Same scoring as get_compliance_summary: passing / (passing + failing)
+            applicable = summary["passed"] + summary["failed"]
+            summary["compliance_score"] = (
+                round(summary["passed"] / applicable * 100, 2) if applicable > 0 else 0.0
+            )
+
+        return summaries
+
     async def get_compliance_summary(self, job_id: str) -> ComplianceSummary | None:
         """Get compliance summary for an audit job.
 
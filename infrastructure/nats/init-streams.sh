@@ -55,35 +55,36 @@ nats stream add ALERTS \
 # IPAM STREAMS
 # ============================================
 
-# IPAM discovery events
-nats stream add IPAM_DISCOVERY \
+# IPAM scan completions (progress and discovery use core NATS, not JetStream)
+nats stream add IPAM \
     --server="$NATS_URL" \
-    --subjects="ipam.discovery.>" \
+    --subjects="ipam.scan.complete" \
     --storage=file \
-    --retention=workqueue \
-    --max-msgs=50000 \
+    --retention=limits \
+    --max-msgs=100000 \
     --max-bytes=268435456 \
-    --max-age=24h \
-    --max-msg-size=65536 \
+    --max-age=7d \
+    --max-msg-size=262144 \
     --discard=old \
-    --dupe-window=5m \
+    --dupe-window=2m \
     --replicas=1 \
-    2>/dev/null || echo "Stream IPAM_DISCOVERY already exists"
+    2>/dev/null || echo "Stream IPAM already exists"
 
-# IPAM scan results
-nats stream add IPAM_SCANS \
+# IPAM scan request work queue (each request is deleted once acked)
+nats stream add IPAM_SCAN_QUEUE \
     --server="$NATS_URL" \
-    --subjects="ipam.scans.>" \
+    --subjects="ipam.scan.request" \
     --storage=file \
-    --retention=limits \
-    --max-msgs=-1 \
-    --max-bytes=536870912 \
-    --max-age=7d \
-    --max-msg-size=262144 \
-    --discard=old \
-    --dupe-window=2m \
+    --retention=work \
+    --max-msgs=10000 \
+    --max-msgs-per-subject=10000 \
+    --max-bytes=268435456 \
+    --max-age=24h \
+    --max-msg-size=65536 \
+    --discard=new \
+    --dupe-window=5m \
     --replicas=1 \
-    2>/dev/null || echo "Stream IPAM_SCANS already exists"
+    2>/dev/null || echo "Stream IPAM_SCAN_QUEUE already exists"
 
 # ============================================
 # NPM STREAMS
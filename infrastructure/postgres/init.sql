@@ -5,6 +5,7 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
 CREATE EXTENSION IF NOT EXISTS "citext";  -- Case-insensitive text
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- Trigram indexes for ILIKE search
 
 -- ============================================
 -- SCHEMAS
@@ -97,10 +98,15 @@ CREATE TABLE ipam.networks (
     is_active BOOLEAN DEFAULT true,
     created_by UUID REFERENCES shared.users(id),
     created_at TIMESTAMPTZ DEFAULT NOW(),
-    updated_at TIMESTAMPTZ DEFAULT NOW()
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    network_text TEXT GENERATED ALWAYS AS (network::text) STORED  -- trigram search
 );
 
 CREATE INDEX idx_networks_cidr ON ipam.networks USING gist (network inet_ops);
+CREATE INDEX idx_networks_name_trgm ON ipam.networks USING gin (name gin_trgm_ops);
+CREATE INDEX idx_networks_location_trgm ON ipam.networks USING gin (location gin_trgm_ops);
+CREATE INDEX idx_networks_network_text_trgm ON ipam.networks USING gin (network_text gin_trgm_ops);
+CREATE INDEX idx_networks_created_id ON ipam.networks (created_at DESC, id DESC);  -- keyset paging
 
 -- IP Addresses
 CREATE TABLE ipam.addresses (
@@ -119,12 +125,22 @@ CREATE TABLE ipam.addresses (
     discovered_at TIMESTAMPTZ,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
+    address_text TEXT GENERATED ALWAYS AS (host(address)) STORED,  -- trigram search
+    mac_text TEXT GENERATED ALWAYS AS (mac_address::text) STORED,  -- trigram search
     UNIQUE(network_id, address)
 );
 
 CREATE INDEX idx_addresses_ip ON ipam.addresses(address);
 CREATE INDEX idx_addresses_mac ON ipam.addresses(mac_address);
 CREATE INDEX idx_addresses_status ON ipam.addresses(status);
+CREATE INDEX idx_addresses_network_status ON ipam.addresses(network_id, status);
+CREATE INDEX idx_addresses_hostname_trgm ON ipam.addresses USING gin (hostname gin_trgm_ops);
+CREATE INDEX idx_addresses_address_text_trgm ON ipam.addresses USING gin (address_text gin_trgm_ops);
+CREATE INDEX idx_addresses_mac_text_trgm ON ipam.addresses USING gin (mac_text gin_trgm_ops);
+-- Prefix (search-as-you-type) lookups: LIKE 'term%' within a network
+CREATE INDEX idx_addresses_hostname_pattern ON ipam.addresses (network_id, lower(hostname) text_pattern_ops);
+CREATE INDEX idx_addresses_address_text_pattern ON ipam.addresses (network_id, address_text text_pattern_ops);
+CREATE INDEX idx_addresses_mac_text_pattern ON ipam.addresses (network_id, mac_text text_pattern_ops);
 
 -- Scan history
 CREATE TABLE ipam.scan_history (
@@ -144,6 +160,20 @@ CREATE TABLE ipam.scan_history (
 
 CREATE INDEX idx_scan_history_network ON ipam.scan_history(network_id);
 CREATE INDEX idx_scan_history_started ON ipam.scan_history(started_at DESC);
+CREATE INDEX idx_scan_history_network_completed ON ipam.scan_history(network_id, started_at DESC)
+    WHERE status = 'completed';
+
+-- Per-network address status counts (maintained by ipam.bump_address_counts)
+CREATE TABLE ipam.network_address_counts (
+    network_id UUID PRIMARY KEY REFERENCES ipam.networks(id) ON DELETE CASCADE,
+    total INTEGER NOT NULL DEFAULT 0,
+    active INTEGER NOT NULL DEFAULT 0,
+    inactive INTEGER NOT NULL DEFAULT 0,
+    reserved INTEGER NOT NULL DEFAULT 0,
+    dhcp INTEGER NOT NULL DEFAULT 0,
+    unknown INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
 
 -- ============================================
 -- NPM SCHEMA
@@ -678,6 +708,89 @@ CREATE TRIGGER update_device_group_count_on_delete
     AFTER DELETE ON npm.devices
     FOR EACH ROW EXECUTE FUNCTION npm.device_group_delete();
 
+-- Keep ipam.network_address_counts in step with ipam.addresses
+CREATE OR REPLACE FUNCTION ipam.bump_address_counts()
+RETURNS TRIGGER AS $$
+DECLARE
+    network_ids UUID[];
+    statuses TEXT[];
+    signs INTEGER[];
+BEGIN
+    -- Collect one (network_id, status, +1/-1) entry per changed row; each
+    -- branch may only reference the transition tables its trigger declares
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(network_id), array_agg(status), array_agg(1)
+        INTO network_ids, statuses, signs
+        FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(network_id), array_agg(status), array_agg(-1)
+        INTO network_ids, statuses, signs
+        FROM old_rows;
+    ELSE
+        -- Most updates (last_seen, hostname, ...) leave the counts alone
+        SELECT array_agg(x.network_id), array_agg(x.status), array_agg(x.sign)
+        INTO network_ids, statuses, signs
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        CROSS JOIN LATERAL (
+            VALUES (o.network_id, o.status, -1), (n.network_id, n.status, 1)
+        ) AS x (network_id, status, sign)
+        WHERE o.status IS DISTINCT FROM n.status
+           OR o.network_id IS DISTINCT FROM n.network_id;
+    END IF;
+
+    IF network_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- One upsert per statement; networks deleted in the same statement (the
+    -- ON DELETE CASCADE path) drop out of the join
+    INSERT INTO ipam.network_address_counts AS c (
+        network_id, total, active, inactive, reserved, dhcp, unknown
+    )
+    SELECT d.network_id, d.total, d.active, d.inactive, d.reserved, d.dhcp, d.unknown
+    FROM (
+        SELECT
+            network_id,
+            SUM(sign) AS total,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'active'), 0) AS active,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'inactive'), 0) AS inactive,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'reserved'), 0) AS reserved,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'dhcp'), 0) AS dhcp,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'unknown'), 0) AS unknown
+        FROM unnest(network_ids, statuses, signs) AS t (network_id, status, sign)
+        WHERE network_id IS NOT NULL
+        GROUP BY network_id
+    ) d
+    JOIN ipam.networks n ON n.id = d.network_id
+    ON CONFLICT (network_id) DO UPDATE SET
+        total = c.total + EXCLUDED.total,
+        active = c.active + EXCLUDED.active,
+        inactive = c.inactive + EXCLUDED.inactive,
+        reserved = c.reserved + EXCLUDED.reserved,
+        dhcp = c.dhcp + EXCLUDED.dhcp,
+        unknown = c.unknown + EXCLUDED.unknown,
+        updated_at = NOW();
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER addresses_counts_insert
+    AFTER INSERT ON ipam.addresses
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ipam.bump_address_counts();
+
+CREATE TRIGGER addresses_counts_update
+    AFTER UPDATE ON ipam.addresses
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ipam.bump_address_counts();
+
+CREATE TRIGGER addresses_counts_delete
+    AFTER DELETE ON ipam.addresses
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ipam.bump_address_counts();
+
 -- ============================================
 -- SEED DATA (Development Only)
 -- ============================================
@@ -0,0 +1,32 @@
+-- Migration 014: Trigram indexes for IPAM search
+-- Purpose: NetworkRepository.find_all and AddressRepository.find_by_network
+-- search with ILIKE '%term%', which cannot use a btree index and forced
+-- sequential scans. pg_trgm GIN indexes serve leading-wildcard ILIKE.
+-- inet/cidr/macaddr columns are exposed as generated text columns so the
+-- search predicates can hit an index instead of casting per row.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Networks
+ALTER TABLE ipam.networks
+    ADD COLUMN IF NOT EXISTS network_text TEXT GENERATED ALWAYS AS (network::text) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_networks_name_trgm
+    ON ipam.networks USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_networks_location_trgm
+    ON ipam.networks USING gin (location gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_networks_network_text_trgm
+    ON ipam.networks USING gin (network_text gin_trgm_ops);
+
+-- Addresses
+ALTER TABLE ipam.addresses
+    ADD COLUMN IF NOT EXISTS address_text TEXT GENERATED ALWAYS AS (host(address)) STORED;
+ALTER TABLE ipam.addresses
+    ADD COLUMN IF NOT EXISTS mac_text TEXT GENERATED ALWAYS AS (mac_address::text) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_addresses_hostname_trgm
+    ON ipam.addresses USING gin (hostname gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_addresses_address_text_trgm
+    ON ipam.addresses USING gin (address_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_addresses_mac_text_trgm
+    ON ipam.addresses USING gin (mac_text gin_trgm_ops);
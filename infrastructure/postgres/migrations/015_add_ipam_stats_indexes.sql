@@ -0,0 +1,11 @@
+-- Migration 015: Indexes for NetworkRepository.get_stats
+-- Purpose: get_stats counts a network's addresses by status and looks up its
+-- most recent completed scan. Cover both with composite indexes so the stats
+-- query reads one index range per network instead of scanning the tables.
+
+CREATE INDEX IF NOT EXISTS idx_addresses_network_status
+    ON ipam.addresses (network_id, status);
+
+CREATE INDEX IF NOT EXISTS idx_scan_history_network_completed
+    ON ipam.scan_history (network_id, started_at DESC)
+    WHERE status = 'completed';
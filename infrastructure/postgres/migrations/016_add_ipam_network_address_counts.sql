@@ -0,0 +1,135 @@
+-- Migration 016: Materialized per-network address status counts
+-- Purpose: NetworkRepository.get_stats re-aggregated every address row of a
+-- network on each call. Counts are now maintained incrementally by triggers on
+-- ipam.addresses so get_stats is a single-row lookup.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ipam.network_address_counts (
+    network_id UUID PRIMARY KEY REFERENCES ipam.networks(id) ON DELETE CASCADE,
+    total INTEGER NOT NULL DEFAULT 0,
+    active INTEGER NOT NULL DEFAULT 0,
+    inactive INTEGER NOT NULL DEFAULT 0,
+    reserved INTEGER NOT NULL DEFAULT 0,
+    dhcp INTEGER NOT NULL DEFAULT 0,
+    unknown INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Statement-level: a bulk scan upsert touches thousands of rows, so the deltas
+-- are aggregated per network from the transition tables and applied in one
+-- upsert instead of one counts-row update per address
+CREATE OR REPLACE FUNCTION ipam.bump_address_counts()
+RETURNS TRIGGER AS $$
+DECLARE
+    network_ids UUID[];
+    statuses TEXT[];
+    signs INTEGER[];
+BEGIN
+    -- Collect one (network_id, status, +1/-1) entry per changed row; each
+    -- branch may only reference the transition tables its trigger declares
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(network_id), array_agg(status), array_agg(1)
+        INTO network_ids, statuses, signs
+        FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(network_id), array_agg(status), array_agg(-1)
+        INTO network_ids, statuses, signs
+        FROM old_rows;
+    ELSE
+        -- Most updates (last_seen, hostname, ...) leave the counts alone
+        SELECT array_agg(x.network_id), array_agg(x.status), array_agg(x.sign)
+        INTO network_ids, statuses, signs
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        CROSS JOIN LATERAL (
+            VALUES (o.network_id, o.status, -1), (n.network_id, n.status, 1)
+        ) AS x (network_id, status, sign)
+        WHERE o.status IS DISTINCT FROM n.status
+           OR o.network_id IS DISTINCT FROM n.network_id;
+    END IF;
+
+    IF network_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- One upsert per statement; networks deleted in the same statement (the
+    -- ON DELETE CASCADE path) drop out of the join
+    INSERT INTO ipam.network_address_counts AS c (
+        network_id, total, active, inactive, reserved, dhcp, unknown
+    )
+    SELECT d.network_id, d.total, d.active, d.inactive, d.reserved, d.dhcp, d.unknown
+    FROM (
+        SELECT
+            network_id,
+            SUM(sign) AS total,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'active'), 0) AS active,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'inactive'), 0) AS inactive,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'reserved'), 0) AS reserved,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'dhcp'), 0) AS dhcp,
+            COALESCE(SUM(sign) FILTER (WHERE status = 'unknown'), 0) AS unknown
+        FROM unnest(network_ids, statuses, signs) AS t (network_id, status, sign)
+        WHERE network_id IS NOT NULL
+        GROUP BY network_id
+    ) d
+    JOIN ipam.networks n ON n.id = d.network_id
+    ON CONFLICT (network_id) DO UPDATE SET
+        total = c.total + EXCLUDED.total,
+        active = c.active + EXCLUDED.active,
+        inactive = c.inactive + EXCLUDED.inactive,
+        reserved = c.reserved + EXCLUDED.reserved,
+        dhcp = c.dhcp + EXCLUDED.dhcp,
+        unknown = c.unknown + EXCLUDED.unknown,
+        updated_at = NOW();
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS addresses_counts_insert_delete ON ipam.addresses;
+
+DROP TRIGGER IF EXISTS addresses_counts_insert ON ipam.addresses;
+CREATE TRIGGER addresses_counts_insert
+    AFTER INSERT ON ipam.addresses
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ipam.bump_address_counts();
+
+DROP TRIGGER IF EXISTS addresses_counts_update ON ipam.addresses;
+CREATE TRIGGER addresses_counts_update
+    AFTER UPDATE ON ipam.addresses
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ipam.bump_address_counts();
+
+DROP TRIGGER IF EXISTS addresses_counts_delete ON ipam.addresses;
+CREATE TRIGGER addresses_counts_delete
+    AFTER DELETE ON ipam.addresses
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION ipam.bump_address_counts();
+
+-- Backfill from existing rows; block writers so no delta is lost in between
+LOCK TABLE ipam.addresses IN SHARE ROW EXCLUSIVE MODE;
+
+INSERT INTO ipam.network_address_counts (
+    network_id, total, active, inactive, reserved, dhcp, unknown
+)
+SELECT
+    network_id,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE status = 'active'),
+    COUNT(*) FILTER (WHERE status = 'inactive'),
+    COUNT(*) FILTER (WHERE status = 'reserved'),
+    COUNT(*) FILTER (WHERE status = 'dhcp'),
+    COUNT(*) FILTER (WHERE status = 'unknown')
+FROM ipam.addresses
+WHERE network_id IS NOT NULL
+GROUP BY network_id
+ON CONFLICT (network_id) DO UPDATE SET
+    total = EXCLUDED.total,
+    active = EXCLUDED.active,
+    inactive = EXCLUDED.inactive,
+    reserved = EXCLUDED.reserved,
+    dhcp = EXCLUDED.dhcp,
+    unknown = EXCLUDED.unknown,
+    updated_at = NOW();
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Migration 017: Prefix-search indexes for IPAM addresses
+-- Purpose: AddressRepository.find_by_network treats a search term without
+-- wildcards as a prefix (LIKE 'term%'). text_pattern_ops btree indexes scoped
+-- by network serve those lookups; the trigram indexes from migration 014 stay
+-- in place for explicit-wildcard searches.
+
+CREATE INDEX IF NOT EXISTS idx_addresses_hostname_pattern
+    ON ipam.addresses (network_id, lower(hostname) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_addresses_address_text_pattern
+    ON ipam.addresses (network_id, address_text text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_addresses_mac_text_pattern
+    ON ipam.addresses (network_id, mac_text text_pattern_ops);
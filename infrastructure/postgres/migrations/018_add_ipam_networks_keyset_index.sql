@@ -0,0 +1,8 @@
+-- Migration 018: Keyset pagination index for IPAM networks
+-- Purpose: NetworkRepository.find_all pages by cursor with
+-- (created_at, id) < (last_created_at, last_id) ORDER BY created_at DESC, id DESC.
+-- Addresses page on (network_id, address), already covered by the table's
+-- UNIQUE constraint.
+
+CREATE INDEX IF NOT EXISTS idx_networks_created_id
+    ON ipam.networks (created_at DESC, id DESC);
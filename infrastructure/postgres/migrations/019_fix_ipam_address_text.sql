@@ -0,0 +1,19 @@
+-- Migration 019: Generate ipam.addresses.address_text from host(address)
+-- Purpose: address::text renders inet with its mask ("10.0.0.5/32"), so
+-- searches anchored at the end ("%.5") never matched and terms such as "/3"
+-- matched every address. host() yields the bare address. Dropping the column
+-- also drops its trigram (014) and text_pattern_ops (017) indexes; both are
+-- rebuilt.
+
+BEGIN;
+
+ALTER TABLE ipam.addresses DROP COLUMN IF EXISTS address_text;
+ALTER TABLE ipam.addresses
+    ADD COLUMN address_text TEXT GENERATED ALWAYS AS (host(address)) STORED;
+
+CREATE INDEX idx_addresses_address_text_trgm
+    ON ipam.addresses USING gin (address_text gin_trgm_ops);
+CREATE INDEX idx_addresses_address_text_pattern
+    ON ipam.addresses (network_id, address_text text_pattern_ops);
+
+COMMIT;
@@ -6,6 +6,8 @@ Consolidates common patterns used across IPAM, NPM, STIG, and Syslog services:
 - DatabasePool: asyncpg pool with retry/backoff on startup
 - create_health_router(): FastAPI health endpoint factory
 - create_service_app(): FastAPI app bootstrap factory
+- TTLCache: bounded in-process LRU with per-entry expiry
+- json_response(): serialize a pydantic model straight to a JSON Response
 """
 
 from .config import BaseServiceSettings
@@ -13,6 +15,8 @@ from .logging import configure_logging, get_logger, bind_context, clear_context
 from .database import DatabasePool
 from .health import create_health_router
 from .app_factory import create_service_app
+from .cache import TTLCache
+from .responses import json_response
 
 __all__ = [
     "BaseServiceSettings",
@@ -23,4 +27,6 @@ __all__ = [
     "DatabasePool",
     "create_health_router",
     "create_service_app",
+    "TTLCache",
+    "json_response",
 ]
@@ -30,6 +30,7 @@ from typing import AsyncGenerator, Awaitable, Callable, Sequence
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .config import BaseServiceSettings
 from .database import DatabasePool
@@ -58,7 +59,8 @@ def create_service_app(
     Handles:
     - Logging configuration
     - DB pool init with retry/backoff
-    - CORS middleware
+    - CORS middleware (development only unless origins are passed)
+    - Gzip compression for larger responses
     - Router registration
     - Lifespan hooks for startup/shutdown (NATS, collectors, etc.)
     - Docs endpoint gating (dev only)
@@ -72,7 +74,9 @@ def create_service_app(
         routers: Sequence of APIRouter instances to register.
         on_startup: Additional async callables to run after DB init.
         on_shutdown: Additional async callables to run before DB close.
-        cors_origins: Allowed CORS origins. Defaults to ["*"] in dev, [] in prod.
+        cors_origins: Allowed CORS origins. Defaults to settings.cors_origins
+            in dev and none in prod; with no origins the middleware is not
+            installed (services sit behind the gateway, which handles CORS).
     """
     # Configure logging early
     configure_logging(
@@ -125,7 +129,7 @@ def create_service_app(
         await db.close()
 
     origins = cors_origins if cors_origins is not None else (
-        ["*"] if settings.is_development else []
+        settings.cors_origins if settings.is_development else []
     )
 
     app = FastAPI(
@@ -137,13 +141,17 @@ def create_service_app(
         redoc_url="/redoc" if settings.is_development else None,
     )
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Paginated listings compress well; small JSON bodies skip the work
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
     for router in routers:
         app.include_router(router)
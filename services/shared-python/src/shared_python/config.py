@@ -42,6 +42,11 @@ class BaseServiceSettings(BaseSettings):
         default="development", alias="NODE_ENV"
     )
     debug: bool = Field(default=False, alias="DEBUG")
+    # Browser origins allowed to call the service directly in development
+    # (JSON list in env, e.g. CORS_ORIGINS='["http://localhost:3000"]')
+    cors_origins: list[str] = Field(
+        default=["http://localhost:3000"], alias="CORS_ORIGINS"
+    )
 
     # Database
     postgres_url: PostgresDsn = Field(..., alias="POSTGRES_URL")
@@ -22,16 +22,65 @@ Usage:
 """
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import asyncpg
 from asyncpg import Pool
+from asyncpg.pool import PoolAcquireContext
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds the pre-ping probe may take; a half-open socket would otherwise hold
+# acquire() for the full command_timeout
+PRE_PING_TIMEOUT = 2.0
+
+# Errors that mean a pooled connection's socket is gone (TimeoutError is an
+# OSError, so a probe that times out counts as dead too)
+_DEAD_CONNECTION_ERRORS = (
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    OSError,
+)
+
+
+class _StaleConnectionError(Exception):
+    """Raised by the pre-ping setup hook when an idle connection is dead."""
+
+
+class _PingedAcquireContext:
+    """``async with`` context that replaces connections failing the pre-ping.
+
+    A plain class rather than ``@asynccontextmanager`` so every checkout
+    doesn't pay for a generator.
+    """
+
+    __slots__ = ("_attempts", "_connection", "_pool")
+
+    def __init__(self, pool: Pool, attempts: int) -> None:
+        self._pool = pool
+        self._attempts = attempts
+        self._connection: asyncpg.Connection | None = None
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        # After a server restart every idle connection may be dead; each failed
+        # probe closes one, so max_size attempts drain them all
+        for _ in range(self._attempts):
+            try:
+                self._connection = await self._pool.acquire()
+                return self._connection
+            except _StaleConnectionError as e:
+                logger.warning("database_stale_connection_replaced", error=str(e))
+        self._connection = await self._pool.acquire()
+        return self._connection
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        connection, self._connection = self._connection, None
+        await self._pool.release(connection)
+
 
 class DatabasePool:
     """Managed asyncpg pool with startup retry and health checks.
@@ -44,6 +93,16 @@ class DatabasePool:
         command_timeout: Default query timeout in seconds.
         max_retries: Number of connection attempts on startup.
         retry_delay: Initial delay between retries (doubles each attempt).
+        statement_cache_size: Prepared statements cached per connection
+            (asyncpg default is 100).
+        max_cacheable_statement_size: Longest query text, in bytes, that is
+            eligible for the statement cache (asyncpg default is 15 KiB).
+        max_inactive_connection_lifetime: Seconds an idle connection is kept
+            before the pool closes it.
+        pre_ping_after: If set, a connection that hasn't been checked out
+            for this many seconds is probed with ``SELECT 1`` on acquire. A
+            dead one is closed and acquire() moves on to another connection,
+            so a half-open socket never reaches the caller.
     """
 
     def __init__(
@@ -55,6 +114,10 @@ class DatabasePool:
         command_timeout: int = 60,
         max_retries: int = 5,
         retry_delay: float = 2.0,
+        statement_cache_size: int = 100,
+        max_cacheable_statement_size: int = 1024 * 15,
+        max_inactive_connection_lifetime: float = 300.0,
+        pre_ping_after: float | None = None,
     ) -> None:
         self._dsn = dsn
         self._schema = schema
@@ -63,6 +126,13 @@ class DatabasePool:
         self._command_timeout = command_timeout
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._statement_cache_size = statement_cache_size
+        self._max_cacheable_statement_size = max_cacheable_statement_size
+        self._max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self._pre_ping_after = pre_ping_after
+        # Last checkout time per backend PID (the setup hook sees a fresh proxy
+        # object on every acquire, so the PID is the stable key)
+        self._last_checkout: dict[int, float] = {}
         self._pool: Pool | None = None
 
     async def init(self) -> None:
@@ -87,6 +157,10 @@ class DatabasePool:
                     min_size=self._min_size,
                     max_size=self._max_size,
                     command_timeout=self._command_timeout,
+                    statement_cache_size=self._statement_cache_size,
+                    max_cacheable_statement_size=self._max_cacheable_statement_size,
+                    setup=self._pre_ping if self._pre_ping_after is not None else None,
+                    max_inactive_connection_lifetime=self._max_inactive_connection_lifetime,
                     server_settings={"search_path": self._schema},
                 )
                 logger.info(
@@ -116,6 +190,27 @@ class DatabasePool:
             f"Failed to connect to database after {self._max_retries} attempts: {last_error}"
         )
 
+    async def _pre_ping(self, conn: asyncpg.Connection) -> None:
+        """Pool setup hook: probe connections that sat idle past pre_ping_after."""
+        now = time.monotonic()
+        pid = conn.get_server_pid()
+        last = self._last_checkout.get(pid)
+        self._last_checkout[pid] = now
+
+        if last is None:
+            # Forget PIDs of connections the pool has since closed
+            if len(self._last_checkout) > self._max_size * 4:
+                self._last_checkout = {pid: now}
+            return
+
+        if now - last > self._pre_ping_after:
+            try:
+                await conn.fetchval("SELECT 1", timeout=PRE_PING_TIMEOUT)
+            except _DEAD_CONNECTION_ERRORS as e:
+                # asyncpg closes a connection whose setup hook raised
+                del self._last_checkout[pid]
+                raise _StaleConnectionError(str(e)) from e
+
     async def close(self) -> None:
         """Close the connection pool."""
         if self._pool is None:
@@ -131,16 +226,21 @@ class DatabasePool:
             raise RuntimeError("Database pool not initialized. Call init() first.")
         return self._pool
 
-    @asynccontextmanager
-    async def acquire(self) -> AsyncGenerator[asyncpg.Connection, None]:
-        """Acquire a connection from the pool."""
-        async with self.pool.acquire() as connection:
-            yield connection
+    def acquire(self) -> PoolAcquireContext | _PingedAcquireContext:
+        """Acquire a connection from the pool.
+
+        Without pre-ping this returns asyncpg's own acquire context; with it, a
+        small class-based context that retries past dead connections. Neither
+        pays for a generator-based context manager.
+        """
+        if self._pre_ping_after is None:
+            return self.pool.acquire()
+        return _PingedAcquireContext(self.pool, self._max_size)
 
     @asynccontextmanager
     async def transaction(self) -> AsyncGenerator[asyncpg.Connection, None]:
         """Acquire a connection with an active transaction."""
-        async with self.pool.acquire() as connection:
+        async with self.acquire() as connection:
             async with connection.transaction():
                 yield connection
 
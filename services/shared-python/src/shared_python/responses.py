@@ -0,0 +1,24 @@
+"""Response helpers for FastAPI routes.
+
+Usage:
+    from shared_python import json_response
+
+    @router.get("/networks", response_model=PaginatedResponse[Network])
+    async def list_networks(...) -> Response:
+        return json_response(PaginatedResponse[Network](...))
+"""
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(model: BaseModel) -> Response:
+    """Serialize a listing response in one pydantic-core pass.
+
+    Skips FastAPI's response_model re-validation/encoding for the hot list
+    endpoints; response_model is kept on the route for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type=JSON_MEDIA_TYPE)
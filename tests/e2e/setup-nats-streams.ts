@@ -20,8 +20,14 @@ const NATS_URL = process.env.NATS_URL || "nats://localhost:4222";
 const STREAMS = [
   {
     name: "IPAM",
-    subjects: ["ipam.scan.*", "ipam.discovery.*"],
-    description: "IPAM network scan and discovery events",
+    subjects: ["ipam.scan.complete"],
+    description: "IPAM scan completions (progress/discovery use core NATS)",
+  },
+  {
+    name: "IPAM_SCAN_QUEUE",
+    subjects: ["ipam.scan.request"],
+    description: "IPAM scan request work queue",
+    retention: RetentionPolicy.Workqueue,
   },
   {
     name: "NPM_METRICS",
@@ -75,7 +81,7 @@ async function main() {
         name: streamConfig.name,
         subjects: streamConfig.subjects,
         description: streamConfig.description,
-        retention: RetentionPolicy.Limits,
+        retention: streamConfig.retention ?? RetentionPolicy.Limits,
         storage: StorageType.File,
         max_msgs: 100000,
         max_bytes: 100 * 1024 * 1024, // 100MB
@@ -440,6 +440,47 @@ class TestPostgreSQLDataTypes:
         assert row is not None
         assert "10.255.0.200" in str(row[0])
 
+    async def test_copy_many_stores_mac_addresses(
+        self,
+        test_network,
+        config
+    ):
+        """Bulk COPY upsert of discovered hosts stores MACADDR values."""
+        asyncpg = pytest.importorskip("asyncpg")
+        repository = pytest.importorskip("ipam.db.repository")
+        address_models = pytest.importorskip("ipam.models.address")
+
+        rows = [
+            address_models.IPAddressDiscovered(
+                address=f"10.255.0.{i}",
+                mac_address=f"02:00:00:00:00:{i:02x}",
+                hostname=f"e2e-host-{i}",
+            )
+            for i in range(1, 255)
+        ]
+
+        conn = await asyncpg.connect(config.postgres_dsn)
+        try:
+            # Roll everything back so the test network is left untouched
+            tx = conn.transaction()
+            await tx.start()
+            try:
+                address_repo = repository.AddressRepository(conn)
+                inserted = await address_repo.copy_many(test_network["id"], rows)
+                assert inserted == len(rows)
+
+                mac = await conn.fetchval(
+                    "SELECT mac_address::text FROM ipam.addresses "
+                    "WHERE network_id = $1 AND address = $2::inet",
+                    test_network["id"],
+                    "10.255.0.10",
+                )
+                assert mac == "02:00:00:00:00:0a"
+            finally:
+                await tx.rollback()
+        finally:
+            await conn.close()
+
 
 class TestSubnetCalculations:
     """Test subnet calculations and validations."""